@@ -23,7 +23,9 @@ class Config:
             'uri': os.getenv('NEO4J_URI', 'bolt://localhost:7689'),
             'user': os.getenv('NEO4J_USER', 'neo4j'),
             'password': os.getenv('NEO4J_PASSWORD', 'perseus2025'),
-            'database': os.getenv('NEO4J_DATABASE', 'neo4j')
+            'database': os.getenv('NEO4J_DATABASE', 'neo4j'),
+            'max_connection_pool_size': int(os.getenv('NEO4J_MAX_POOL_SIZE', '50')),
+            'connection_acquisition_timeout': float(os.getenv('NEO4J_ACQUISITION_TIMEOUT', '30'))
         }
         
         self.paths = {
@@ -38,6 +40,12 @@ class Config:
             'batch_size': int(os.getenv('BATCH_SIZE', '100')),
             'timeout': int(os.getenv('TIMEOUT', '30')),
             'retry_attempts': int(os.getenv('RETRY_ATTEMPTS', '3')),
+            'query_concurrency': int(os.getenv('QUERY_CONCURRENCY', '4')),
+            'query_timeout': float(os.getenv('QUERY_TIMEOUT', '120')),
+            'query_cache': os.getenv('QUERY_CACHE', 'true').lower() in ('1', 'true', 'yes'),
+            'query_cache_path': os.getenv('QUERY_CACHE_PATH', 'data/cache/query_cache.sqlite'),
+            'query_cache_ttl': float(os.getenv('QUERY_CACHE_TTL', '300')),
+            'query_cache_shared_version': os.getenv('QUERY_CACHE_SHARED_VERSION', 'false').lower() in ('1', 'true', 'yes'),
             'log_level': os.getenv('LOG_LEVEL', 'INFO')
         }
         
@@ -71,11 +79,19 @@ class Config:
                 'uri': 'bolt://localhost:7689',
                 'user': 'neo4j',
                 'password': 'perseus2025',
-                'timeout': 30
+                'timeout': 30,
+                'max_connection_pool_size': 50,
+                'connection_acquisition_timeout': 30
             },
             'analysis': {
                 'batch_size': 100,
                 'retry_attempts': 3,
+                'query_concurrency': 4,
+                'query_timeout': 120,
+                'query_cache': True,
+                'query_cache_path': 'data/cache/query_cache.sqlite',
+                'query_cache_ttl': 300,
+                'query_cache_shared_version': False,
                 'output_format': 'csv',
                 'include_visualizations': True
             },
@@ -101,6 +117,13 @@ class Config:
         """Get database authentication."""
         return (self.database_config['user'], self.database_config['password'])
     
+    def get_pool_settings(self) -> Dict[str, Any]:
+        """Get Neo4j driver connection pool settings."""
+        return {
+            'max_connection_pool_size': int(self.database_config['max_connection_pool_size']),
+            'connection_acquisition_timeout': float(self.database_config['connection_acquisition_timeout'])
+        }
+    
     def get_output_dir(self) -> Path:
         """Get output directory."""
         return self.paths['output_dir']
@@ -120,6 +143,31 @@ class Config:
     def get_retry_attempts(self) -> int:
         """Get number of retry attempts."""
         return self.analysis_config['retry_attempts']
+    
+    def get_query_concurrency(self) -> int:
+        """Get the number of read queries a batch runs at once."""
+        return int(self.analysis_config['query_concurrency'])
+    
+    def get_query_timeout(self) -> float:
+        """Get the per-query transaction timeout (seconds) for query batches."""
+        return float(self.analysis_config['query_timeout'])
+    
+    def get_query_cache_settings(self) -> Dict[str, Any]:
+        """Get the read query result cache settings (enabled, SQLite path, graph version TTL in seconds,
+        whether a graph version recorded by another process is trusted).
+
+        A relative path is resolved against the repository root, so every script shares one cache file
+        whatever directory it runs from.
+        """
+        path = Path(self.analysis_config['query_cache_path'])
+        if not path.is_absolute():
+            path = Path(__file__).resolve().parents[1] / path
+        return {
+            'enabled': bool(self.analysis_config['query_cache']),
+            'path': str(path),
+            'ttl': float(self.analysis_config['query_cache_ttl']),
+            'shared_version': bool(self.analysis_config.get('query_cache_shared_version', False))
+        }
 
 # Global configuration instance
 config = Config() 
\ No newline at end of file
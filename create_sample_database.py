@@ -17,6 +17,8 @@ from pathlib import Path
 from typing import Dict, List, Any
 import logging
 
+from src.utils.taxonomy import get_taxonomy
+
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -127,27 +129,11 @@ class SampleDatabaseCreator:
         
     def _classify_program_level(self, program_name: str) -> str:
         """Classify program level based on name"""
-        name_lower = program_name.lower()
-        if any(word in name_lower for word in ['bachelor', 'bs', 'ba', 'undergraduate', 'associate']):
-            return 'Undergraduate'
-        elif any(word in name_lower for word in ['master', 'ms', 'ma', 'mba', 'graduate']):
-            return 'Master'
-        elif any(word in name_lower for word in ['phd', 'ph.d.', 'doctorate', 'doctoral']):
-            return 'Doctoral'
-        else:
-            return 'Unknown'
+        return get_taxonomy('program_level').classify(program_name)
             
     def _classify_program_type(self, program_name: str) -> str:
         """Classify program type based on name"""
-        name_lower = program_name.lower()
-        if any(word in name_lower for word in ['forestry', 'forest', 'natural resource', 'environmental']):
-            return 'Forestry/Environmental'
-        elif any(word in name_lower for word in ['geography', 'geospatial', 'gis']):
-            return 'Geography/Geospatial'
-        elif any(word in name_lower for word in ['computer science', 'data science', 'informatics']):
-            return 'Computer Science/Data Science'
-        else:
-            return 'Other'
+        return get_taxonomy('program_field').classify(program_name)
             
     def save_sample(self, sample_db: Dict[str, Any], output_file: str):
         """Save the sample database to a JSON file"""
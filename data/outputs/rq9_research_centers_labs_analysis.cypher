@@ -1,6 +1,11 @@
 -- RQ9 Cypher Queries for Research Centers and Labs Analysis
 -- Neo4j Graph Database Queries for Research Question 9
 -- How many programs are associated with research centers or labs devoted to GIS, AI, Remote Sensing?
+--
+-- Sections 2-4 use the classifications materialized by src/utils/classification_materializer.py
+-- (run by database_setup.py): research_focus is the first matching research_focus rule in
+-- config/taxonomies.yaml, and :GISFocus, :AIFocus, :RemoteSensingFocus, ... mark names that
+-- contain any term of that rule.
 
 -- ============================================================================
 -- 1. DATABASE STRUCTURE VERIFICATION
@@ -28,46 +33,12 @@ RETURN count(*) as total_lab_program_relationships;
 
 -- Query 2.1: Research Centers by Technology Focus
 MATCH (rc:ResearchCenter)
-WITH rc.name as center_name,
-     CASE 
-         WHEN toLower(rc.name) CONTAINS 'gis' OR toLower(rc.name) CONTAINS 'geospatial' OR
-              toLower(rc.name) CONTAINS 'geographic' OR toLower(rc.name) CONTAINS 'spatial' OR
-              toLower(rc.name) CONTAINS 'mapping' OR toLower(rc.name) CONTAINS 'cartography' THEN 'GIS'
-         WHEN toLower(rc.name) CONTAINS 'ai' OR toLower(rc.name) CONTAINS 'artificial intelligence' OR
-              toLower(rc.name) CONTAINS 'machine learning' OR toLower(rc.name) CONTAINS 'ml' OR
-              toLower(rc.name) CONTAINS 'computational' OR toLower(rc.name) CONTAINS 'data science' THEN 'AI'
-         WHEN toLower(rc.name) CONTAINS 'remote sensing' OR toLower(rc.name) CONTAINS 'satellite' OR
-              toLower(rc.name) CONTAINS 'aerial' OR toLower(rc.name) CONTAINS 'sensor' OR
-              toLower(rc.name) CONTAINS 'earth observation' OR toLower(rc.name) CONTAINS 'spectral' THEN 'Remote Sensing'
-         WHEN toLower(rc.name) CONTAINS 'drone' OR toLower(rc.name) CONTAINS 'uav' OR
-              toLower(rc.name) CONTAINS 'unmanned aerial' OR toLower(rc.name) CONTAINS 'aerial photography' THEN 'Drones/UAV'
-         WHEN toLower(rc.name) CONTAINS 'forestry' OR toLower(rc.name) CONTAINS 'forest' OR
-              toLower(rc.name) CONTAINS 'natural resource' OR toLower(rc.name) CONTAINS 'environmental' THEN 'Forestry/Environmental'
-         ELSE 'Other'
-     END as technology_focus
-RETURN technology_focus, count(center_name) as center_count
+RETURN rc.research_focus as technology_focus, count(rc.name) as center_count
 ORDER BY center_count DESC;
 
 -- Query 2.2: Labs by Technology Focus
 MATCH (l:Lab)
-WITH l.name as lab_name,
-     CASE 
-         WHEN toLower(l.name) CONTAINS 'gis' OR toLower(l.name) CONTAINS 'geospatial' OR
-              toLower(l.name) CONTAINS 'geographic' OR toLower(l.name) CONTAINS 'spatial' OR
-              toLower(l.name) CONTAINS 'mapping' OR toLower(l.name) CONTAINS 'cartography' THEN 'GIS'
-         WHEN toLower(l.name) CONTAINS 'ai' OR toLower(l.name) CONTAINS 'artificial intelligence' OR
-              toLower(l.name) CONTAINS 'machine learning' OR toLower(l.name) CONTAINS 'ml' OR
-              toLower(l.name) CONTAINS 'computational' OR toLower(l.name) CONTAINS 'data science' THEN 'AI'
-         WHEN toLower(l.name) CONTAINS 'remote sensing' OR toLower(l.name) CONTAINS 'satellite' OR
-              toLower(l.name) CONTAINS 'aerial' OR toLower(l.name) CONTAINS 'sensor' OR
-              toLower(l.name) CONTAINS 'earth observation' OR toLower(l.name) CONTAINS 'spectral' THEN 'Remote Sensing'
-         WHEN toLower(l.name) CONTAINS 'drone' OR toLower(l.name) CONTAINS 'uav' OR
-              toLower(l.name) CONTAINS 'unmanned aerial' OR toLower(l.name) CONTAINS 'aerial photography' THEN 'Drones/UAV'
-         WHEN toLower(l.name) CONTAINS 'forestry' OR toLower(l.name) CONTAINS 'forest' OR
-              toLower(l.name) CONTAINS 'natural resource' OR toLower(l.name) CONTAINS 'environmental' THEN 'Forestry/Environmental'
-         ELSE 'Other'
-     END as technology_focus
-RETURN technology_focus, count(lab_name) as lab_count
+RETURN l.research_focus as technology_focus, count(l.name) as lab_count
 ORDER BY lab_count DESC;
 
 -- ============================================================================
@@ -75,26 +46,17 @@ ORDER BY lab_count DESC;
 -- ============================================================================
 
 -- Query 3.1: Programs Associated with GIS Research Centers
-MATCH (rc:ResearchCenter)-[:ASSOCIATED_WITH]->(p:Program)
-WHERE toLower(rc.name) CONTAINS 'gis' OR toLower(rc.name) CONTAINS 'geospatial' OR
-      toLower(rc.name) CONTAINS 'geographic' OR toLower(rc.name) CONTAINS 'spatial' OR
-      toLower(rc.name) CONTAINS 'mapping' OR toLower(rc.name) CONTAINS 'cartography'
+MATCH (rc:ResearchCenter:GISFocus)-[:ASSOCIATED_WITH]->(p:Program)
 RETURN rc.name as research_center, p.name as program_name, p.type as program_type
 ORDER BY rc.name, p.name;
 
 -- Query 3.2: Programs Associated with AI Research Centers
-MATCH (rc:ResearchCenter)-[:ASSOCIATED_WITH]->(p:Program)
-WHERE toLower(rc.name) CONTAINS 'ai' OR toLower(rc.name) CONTAINS 'artificial intelligence' OR
-      toLower(rc.name) CONTAINS 'machine learning' OR toLower(rc.name) CONTAINS 'ml' OR
-      toLower(rc.name) CONTAINS 'computational' OR toLower(rc.name) CONTAINS 'data science'
+MATCH (rc:ResearchCenter:AIFocus)-[:ASSOCIATED_WITH]->(p:Program)
 RETURN rc.name as research_center, p.name as program_name, p.type as program_type
 ORDER BY rc.name, p.name;
 
 -- Query 3.3: Programs Associated with Remote Sensing Research Centers
-MATCH (rc:ResearchCenter)-[:ASSOCIATED_WITH]->(p:Program)
-WHERE toLower(rc.name) CONTAINS 'remote sensing' OR toLower(rc.name) CONTAINS 'satellite' OR
-      toLower(rc.name) CONTAINS 'aerial' OR toLower(rc.name) CONTAINS 'sensor' OR
-      toLower(rc.name) CONTAINS 'earth observation' OR toLower(rc.name) CONTAINS 'spectral'
+MATCH (rc:ResearchCenter:RemoteSensingFocus)-[:ASSOCIATED_WITH]->(p:Program)
 RETURN rc.name as research_center, p.name as program_name, p.type as program_type
 ORDER BY rc.name, p.name;
 
@@ -103,26 +65,17 @@ ORDER BY rc.name, p.name;
 -- ============================================================================
 
 -- Query 4.1: Programs Associated with GIS Labs
-MATCH (l:Lab)-[:ASSOCIATED_WITH]->(p:Program)
-WHERE toLower(l.name) CONTAINS 'gis' OR toLower(l.name) CONTAINS 'geospatial' OR
-      toLower(l.name) CONTAINS 'geographic' OR toLower(l.name) CONTAINS 'spatial' OR
-      toLower(l.name) CONTAINS 'mapping' OR toLower(l.name) CONTAINS 'cartography'
+MATCH (l:Lab:GISFocus)-[:ASSOCIATED_WITH]->(p:Program)
 RETURN l.name as lab_name, p.name as program_name, p.type as program_type
 ORDER BY l.name, p.name;
 
 -- Query 4.2: Programs Associated with AI Labs
-MATCH (l:Lab)-[:ASSOCIATED_WITH]->(p:Program)
-WHERE toLower(l.name) CONTAINS 'ai' OR toLower(l.name) CONTAINS 'artificial intelligence' OR
-      toLower(l.name) CONTAINS 'machine learning' OR toLower(l.name) CONTAINS 'ml' OR
-      toLower(l.name) CONTAINS 'computational' OR toLower(l.name) CONTAINS 'data science'
+MATCH (l:Lab:AIFocus)-[:ASSOCIATED_WITH]->(p:Program)
 RETURN l.name as lab_name, p.name as program_name, p.type as program_type
 ORDER BY l.name, p.name;
 
 -- Query 4.3: Programs Associated with Remote Sensing Labs
-MATCH (l:Lab)-[:ASSOCIATED_WITH]->(p:Program)
-WHERE toLower(l.name) CONTAINS 'remote sensing' OR toLower(l.name) CONTAINS 'satellite' OR
-      toLower(l.name) CONTAINS 'aerial' OR toLower(l.name) CONTAINS 'sensor' OR
-      toLower(l.name) CONTAINS 'earth observation' OR toLower(l.name) CONTAINS 'spectral'
+MATCH (l:Lab:RemoteSensingFocus)-[:ASSOCIATED_WITH]->(p:Program)
 RETURN l.name as lab_name, p.name as program_name, p.type as program_type
 ORDER BY l.name, p.name;
 
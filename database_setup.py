@@ -10,29 +10,196 @@ Usage:
     
 Example:
     python database_setup.py --uri bolt://localhost:7687 --user neo4j --password password
+    python database_setup.py --uri bolt://localhost:7687 --user neo4j --password password --bulk
+    python database_setup.py --uri bolt://localhost:7687 --user neo4j --password password --workers 4
 """
 
 import json
 import argparse
 import os
+import random
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
 from neo4j import GraphDatabase
-from typing import Dict, List, Any
+from neo4j.exceptions import TransientError
+from typing import Dict, List, Any, Optional
 import logging
 
+from config.settings import config
+from src.utils.classification_materializer import (classification_index_statements, marker_labels,
+                                                    materialize_classifications)
+from src.utils.neo4j_executor import get_executor
+from src.utils.profile_ingestion import ingest_profiles
+from src.utils.query_cache import GRAPH_VERSION_LABEL
+from src.utils.summary_projections import SUMMARY_LABELS, project_summaries
+from src.utils.taxonomy import get_taxonomy
+
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Base delay before retrying a chunk that hit a transient error such as a deadlock
+RETRY_BACKOFF_SECONDS = 0.5
+
+# Labels in bulk write order; universities go first so the other chunks can match them
+BULK_LABELS = ['University', 'Program', 'Faculty', 'ResearchCenter', 'Course']
+
+# One UNWIND statement per label. Entity rows arrive grouped by university so each
+# chunk matches a University node once per university rather than once per row.
+BULK_QUERIES = {
+    'University': """
+        UNWIND $rows AS row
+        MERGE (u:University {name: row.name})
+        SET u.source_file = row.source_file
+    """,
+    'Program': """
+        UNWIND $groups AS grp
+        MATCH (u:University {name: grp.university})
+        UNWIND grp.rows AS row
+        MERGE (p:Program {name: row.name})
+        SET p.level = row.level, p.type = row.type
+        MERGE (u)-[:OFFERS]->(p)
+    """,
+    'Faculty': """
+        UNWIND $groups AS grp
+        MATCH (u:University {name: grp.university})
+        UNWIND grp.rows AS row
+        MERGE (f:Faculty {name: row.name})
+        SET f.research_area = row.research_area
+        MERGE (u)-[:HAS]->(f)
+    """,
+    'ResearchCenter': """
+        UNWIND $groups AS grp
+        MATCH (u:University {name: grp.university})
+        UNWIND grp.rows AS row
+        MERGE (rc:ResearchCenter {name: row.name})
+        SET rc.technology_focus = row.focus
+        MERGE (u)-[:HAS]->(rc)
+    """,
+    'Course': """
+        UNWIND $groups AS grp
+        MATCH (u:University {name: grp.university})
+        UNWIND grp.rows AS row
+        MERGE (c:Course {name: row.name})
+        SET c.technology_focus = row.focus, c.description = row.description
+        MERGE (u)-[:OFFERS]->(c)
+    """
+}
+
+def group_rows_by_university(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Group consecutive rows sharing a university, keeping row order"""
+    return [{'university': university, 'rows': list(group)}
+            for university, group in groupby(rows, key=itemgetter('university'))]
+
+def university_name_from_filename(filename: str) -> str:
+    """University name from an extracted data filename"""
+    return filename.replace('_extracted_data.json', '').replace('_', ' ').title()
+
+def program_row(program: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Program node properties, with level and type classified from the name"""
+    if 'name' not in program:
+        return None
+    return {'name': program['name'],
+            'level': get_taxonomy('program_level').classify(program['name']),
+            'type': get_taxonomy('program_field').classify(program['name'])}
+
+def faculty_row(faculty: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Faculty node properties"""
+    if 'name' not in faculty:
+        return None
+    return {'name': faculty['name'], 'research_area': faculty.get('research_area', 'Unknown')}
+
+def research_center_row(center: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Research center node properties, with technology focus classified from the name"""
+    if 'name' not in center:
+        return None
+    return {'name': center['name'], 'focus': get_taxonomy('technology_focus').classify(center['name'])}
+
+def course_row(course: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Course node properties, with technology focus classified from the description"""
+    if 'name' not in course:
+        return None
+    return {'name': course['name'],
+            'focus': get_taxonomy('technology_focus').classify(course.get('description', '')),
+            'description': course.get('description', '')}
+
+# (label, JSON key, row builder) for the entities attached to each university
+ENTITY_ROW_BUILDERS = [
+    ('Program', 'programs', program_row),
+    ('Faculty', 'faculty', faculty_row),
+    ('ResearchCenter', 'research_centers', research_center_row),
+    ('Course', 'courses', course_row),
+]
+
+def collect_university_rows(data: Dict[str, Any], filename: str,
+                            rows: Dict[str, List[Dict[str, Any]]]):
+    """
+    Append one university file's rows to per-label row lists
+    
+    Args:
+        data: Parsed *_extracted_data.json content
+        filename: Name of the JSON file (gives the university name)
+        rows: Mapping of label to row list (see BULK_LABELS), extended in place;
+            entity rows carry a 'university' key
+    """
+    university_name = university_name_from_filename(filename)
+    
+    # Build every row before appending so a bad file adds nothing
+    file_rows = {'University': [{'name': university_name, 'source_file': filename}]}
+    for label, key, build_row in ENTITY_ROW_BUILDERS:
+        built = (build_row(item) for item in data.get(key, []))
+        file_rows[label] = [dict(row, university=university_name) for row in built if row]
+        
+    for label, label_rows in file_rows.items():
+        rows[label].extend(label_rows)
+
+def load_university_rows(json_file: Path) -> Dict[str, List[Dict[str, Any]]]:
+    """Read one extracted JSON file into per-label rows (parse function for the worker pool)"""
+    with open(json_file, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    rows = {label: [] for label in BULK_LABELS}
+    collect_university_rows(data, Path(json_file).name, rows)
+    return rows
+
+def partition_rows_by_name(rows: List[Dict[str, Any]], partitions: int) -> List[List[Dict[str, Any]]]:
+    """
+    Split rows into partitions so that every row for a given node name lands in the same one
+    
+    Node properties are first resolved to the last row per name (what sequential
+    MERGE ... SET leaves behind), so rows can be reordered freely. Each partition
+    is sorted by university and name to give concurrent transactions a consistent
+    lock order.
+    
+    Args:
+        rows: Rows for one label
+        partitions: Number of partitions
+        
+    Returns:
+        Non-empty partitions
+    """
+    last = {row['name']: row for row in rows}
+    buckets = [[] for _ in range(max(1, partitions))]
+    for row in rows:
+        resolved = dict(last[row['name']], **({'university': row['university']} if 'university' in row else {}))
+        buckets[zlib.crc32(str(row['name']).encode('utf-8')) % len(buckets)].append(resolved)
+    return [sorted(bucket, key=lambda r: (r.get('university', ''), str(r['name']))) for bucket in buckets if bucket]
+
 class DatabaseInitializer:
     """Initialize Neo4j database with KG-Perseus data"""
     
-    def __init__(self, uri: str, user: str, password: str):
-        """Initialize database connection"""
+    def __init__(self, uri: str, user: str, password: str, batch_size: Optional[int] = None):
+        """Initialize database connection (batch_size defaults to Config.get_batch_size)"""
         self.driver = GraphDatabase.driver(uri, auth=(user, password))
         self.uri = uri
         self.user = user
         self.password = password
+        self.batch_size = max(1, batch_size or config.get_batch_size())
+        self.retry_attempts = max(1, config.get_retry_attempts())
+        self.imported_universities: List[str] = []
         
     def close(self):
         """Close database connection"""
@@ -68,7 +235,7 @@ class DatabaseInitializer:
                 "CREATE INDEX faculty_research_area IF NOT EXISTS FOR (f:Faculty) ON (f.research_area)",
                 "CREATE INDEX course_technology IF NOT EXISTS FOR (c:Course) ON (c.technology_focus)",
                 "CREATE INDEX research_center_focus IF NOT EXISTS FOR (rc:ResearchCenter) ON (rc.technology_focus)"
-            ]
+            ] + classification_index_statements()
             
             for index in indexes:
                 try:
@@ -85,9 +252,20 @@ class DatabaseInitializer:
                 logger.info("Cleared existing database")
             except Exception as e:
                 logger.error(f"Failed to clear database: {e}")
+        self.stamp_graph_version()
                 
-    def import_university_data(self, data_dir: str = "extracted_university_data"):
-        """Import university data from JSON files"""
+    def import_university_data(self, data_dir: str = "extracted_university_data", bulk: bool = False,
+                               workers: Optional[int] = None):
+        """
+        Import university data from JSON files
+        
+        Args:
+            data_dir: Directory containing the extracted JSON files
+            bulk: Accumulate rows per label across all files and write them in
+                UNWIND chunks of batch_size, one write transaction per chunk
+            workers: Parallel bulk import: read files in this many processes and
+                write each label as this many name partitions over concurrent sessions
+        """
         data_path = Path(data_dir)
         if not data_path.exists():
             logger.error(f"Data directory {data_dir} not found")
@@ -95,7 +273,16 @@ class DatabaseInitializer:
             
         json_files = list(data_path.glob("*.json"))
         logger.info(f"Found {len(json_files)} JSON files to import")
+        self.imported_universities = [university_name_from_filename(f.name) for f in json_files
+                                      if f.name != "extraction_summary_report.json"]
+        
+        if workers:
+            self._parallel_import(
+                [f for f in json_files if f.name != "extraction_summary_report.json"], workers)
+            self.stamp_graph_version()
+            return
         
+        bulk_rows = {label: [] for label in BULK_LABELS}
         for json_file in json_files:
             if json_file.name == "extraction_summary_report.json":
                 continue  # Skip summary file
@@ -104,17 +291,92 @@ class DatabaseInitializer:
                 with open(json_file, 'r', encoding='utf-8') as f:
                     data = json.load(f)
                     
-                self._import_university_file(data, json_file.name)
-                logger.info(f"Imported {json_file.name}")
+                if bulk:
+                    collect_university_rows(data, json_file.name, bulk_rows)
+                    logger.info(f"Collected {json_file.name}")
+                else:
+                    self._import_university_file(data, json_file.name)
+                    logger.info(f"Imported {json_file.name}")
                 
             except Exception as e:
                 logger.error(f"Failed to import {json_file.name}: {e}")
                 
+        if bulk:
+            for label in BULK_LABELS:
+                self._write_bulk_rows(label, bulk_rows[label])
+        self.stamp_graph_version()
+                
+    def _parallel_import(self, json_files: List[Path], workers: int):
+        """Read files over a process pool, then write each label's name partitions concurrently"""
+        rows = {label: [] for label in BULK_LABELS}
+        for result in ingest_profiles(json_files, load_university_rows, workers):
+            if result.ok:
+                for label, label_rows in result.value.items():
+                    rows[label].extend(label_rows)
+                logger.info(f"Collected {result.path.name}")
+                
+        # Labels stay sequential so universities exist before anything links to them;
+        # within a label no two partitions MERGE the same node
+        for label in BULK_LABELS:
+            partitions = partition_rows_by_name(rows[label], workers) if rows[label] else []
+            if not partitions:
+                continue
+            with ThreadPoolExecutor(max_workers=len(partitions)) as pool:
+                written = sum(pool.map(lambda part: self._write_bulk_rows(label, part), partitions))
+            logger.info(f"Wrote {written}/{len(rows[label])} {label} rows over {len(partitions)} partitions")
+                
+    def _write_bulk_rows(self, label: str, rows: List[Dict[str, Any]]) -> int:
+        """
+        Write rows for one label in UNWIND chunks, one explicit write transaction per chunk
+        
+        Uses its own session, so concurrent calls (one per partition) are safe.
+        
+        Returns:
+            Number of rows written
+        """
+        if not rows:
+            return 0
+            
+        query = BULK_QUERIES[label]
+        chunks = (len(rows) + self.batch_size - 1) // self.batch_size
+        written = 0
+        with self.driver.session() as session:
+            for start in range(0, len(rows), self.batch_size):
+                chunk = rows[start:start + self.batch_size]
+                params = {'rows': chunk} if label == 'University' else {'groups': group_rows_by_university(chunk)}
+                try:
+                    self._execute_chunk(session, query, params)
+                    written += len(chunk)
+                except Exception as e:
+                    logger.error(f"Failed to write {label} rows {start}-{start + len(chunk) - 1}: {e}")
+                    
+        logger.info(f"Wrote {written}/{len(rows)} {label} rows in {chunks} chunks of up to {self.batch_size}")
+        return written
+        
+    def _execute_chunk(self, session, query: str, params: Dict[str, Any]):
+        """Run one chunk in a write transaction, retrying transient errors (e.g. deadlocks) with backoff"""
+        for attempt in range(1, self.retry_attempts + 1):
+            try:
+                session.execute_write(self._run_chunk, query, params)
+                return
+            except TransientError as e:
+                if attempt == self.retry_attempts:
+                    raise
+                delay = RETRY_BACKOFF_SECONDS * 2 ** (attempt - 1) * random.uniform(0.5, 1.5)
+                logger.warning(f"Transient error ({e.code}); retrying chunk in {delay:.1f}s "
+                               f"(attempt {attempt}/{self.retry_attempts})")
+                time.sleep(delay)
+        
+    @staticmethod
+    def _run_chunk(tx, query: str, params: Dict[str, Any]):
+        """Transaction function running one UNWIND chunk"""
+        tx.run(query, **params).consume()
+        
     def _import_university_file(self, data: Dict[str, Any], filename: str):
         """Import data from a single university JSON file"""
         with self.driver.session() as session:
             # Extract university name from filename
-            university_name = filename.replace('_extracted_data.json', '').replace('_', ' ').title()
+            university_name = university_name_from_filename(filename)
             
             # Create university node
             session.run("""
@@ -144,12 +406,9 @@ class DatabaseInitializer:
                     
     def _import_program(self, session, program: Dict[str, Any], university_name: str):
         """Import a program node"""
-        if 'name' not in program:
+        row = program_row(program)
+        if not row:
             return
-            
-        # Determine program level and type
-        level = self._classify_program_level(program['name'])
-        program_type = self._classify_program_type(program['name'])
         
         session.run("""
             MERGE (p:Program {name: $name})
@@ -157,11 +416,12 @@ class DatabaseInitializer:
             WITH p
             MATCH (u:University {name: $university})
             MERGE (u)-[:OFFERS]->(p)
-        """, name=program['name'], level=level, type=program_type, university=university_name)
+        """, **row, university=university_name)
         
     def _import_faculty(self, session, faculty: Dict[str, Any], university_name: str):
         """Import a faculty member node"""
-        if 'name' not in faculty:
+        row = faculty_row(faculty)
+        if not row:
             return
             
         session.run("""
@@ -170,17 +430,13 @@ class DatabaseInitializer:
             WITH f
             MATCH (u:University {name: $university})
             MERGE (u)-[:HAS]->(f)
-        """, name=faculty['name'], 
-                   research_area=faculty.get('research_area', 'Unknown'),
-                   university=university_name)
+        """, **row, university=university_name)
         
     def _import_research_center(self, session, center: Dict[str, Any], university_name: str):
         """Import a research center node"""
-        if 'name' not in center:
+        row = research_center_row(center)
+        if not row:
             return
-            
-        # Determine technology focus
-        focus = self._classify_technology_focus(center['name'])
         
         session.run("""
             MERGE (rc:ResearchCenter {name: $name})
@@ -188,15 +444,13 @@ class DatabaseInitializer:
             WITH rc
             MATCH (u:University {name: $university})
             MERGE (u)-[:HAS]->(rc)
-        """, name=center['name'], focus=focus, university=university_name)
+        """, **row, university=university_name)
         
     def _import_course(self, session, course: Dict[str, Any], university_name: str):
         """Import a course node"""
-        if 'name' not in course:
+        row = course_row(course)
+        if not row:
             return
-            
-        # Determine technology focus
-        focus = self._classify_technology_focus(course.get('description', ''))
         
         session.run("""
             MERGE (c:Course {name: $name})
@@ -204,62 +458,52 @@ class DatabaseInitializer:
             WITH c
             MATCH (u:University {name: $university})
             MERGE (u)-[:OFFERS]->(c)
-        """, name=course['name'], 
-                   focus=focus,
-                   description=course.get('description', ''),
-                   university=university_name)
+        """, **row, university=university_name)
         
-    def _classify_program_level(self, program_name: str) -> str:
-        """Classify program level based on name"""
-        name_lower = program_name.lower()
-        if any(word in name_lower for word in ['bachelor', 'bs', 'ba', 'undergraduate', 'associate']):
-            return 'Undergraduate'
-        elif any(word in name_lower for word in ['master', 'ms', 'ma', 'mba', 'graduate']):
-            return 'Master'
-        elif any(word in name_lower for word in ['phd', 'ph.d.', 'doctorate', 'doctoral']):
-            return 'Doctoral'
-        else:
-            return 'Unknown'
-            
-    def _classify_program_type(self, program_name: str) -> str:
-        """Classify program type based on name"""
-        name_lower = program_name.lower()
-        if any(word in name_lower for word in ['forestry', 'forest', 'natural resource', 'environmental']):
-            return 'Forestry/Environmental'
-        elif any(word in name_lower for word in ['geography', 'geospatial', 'gis']):
-            return 'Geography/Geospatial'
-        elif any(word in name_lower for word in ['computer science', 'data science', 'informatics']):
-            return 'Computer Science/Data Science'
-        else:
-            return 'Other'
-            
-    def _classify_technology_focus(self, text: str) -> str:
-        """Classify technology focus based on text"""
-        text_lower = text.lower()
-        if any(word in text_lower for word in ['ai', 'artificial intelligence', 'machine learning', 'ml']):
-            return 'AI/ML'
-        elif any(word in text_lower for word in ['gis', 'geospatial', 'geographic', 'spatial']):
-            return 'GIS'
-        elif any(word in text_lower for word in ['remote sensing', 'satellite', 'aerial', 'sensor']):
-            return 'Remote Sensing'
-        elif any(word in text_lower for word in ['drone', 'uav', 'unmanned aerial']):
-            return 'Drones/UAV'
-        else:
-            return 'Other'
-            
-    def verify_import(self):
-        """Verify the imported data"""
+    def graph_version(self) -> Optional[str]:
+        """Current graph version stamp (None if the graph was never stamped)"""
+        return get_executor(self.uri, self.user, self.password).graph_version(refresh=True)
+        
+    def stamp_graph_version(self) -> str:
+        """Give the graph a new version stamp so cached RQ query results are recomputed"""
+        version = get_executor(self.uri, self.user, self.password).stamp_graph_version()
+        logger.info(f"Graph version stamped: {version}")
+        return version
+        
+    def materialize_classifications(self, force: bool = True) -> Dict[str, int]:
+        """Store taxonomy classifications (research focus, department type) on the imported nodes"""
+        counts = materialize_classifications(get_executor(self.uri, self.user, self.password), force=force)
+        for name, count in counts.items():
+            logger.info(f"  {name}: {count} names classified")
+        return counts
+    
+    def project_summaries(self, since: Optional[str] = None) -> Dict[str, int]:
+        """
+        Update the RQ summary nodes after an import
+        
+        Args:
+            since: Graph version before the import; if the summaries were current then,
+                only the imported universities (and the whole-graph rows) are recomputed
+        """
+        universities = self.imported_universities if since is not None else None
+        return project_summaries(get_executor(self.uri, self.user, self.password), universities, since=since)
+    
+    def verify_import(self) -> Dict[str, Dict[str, int]]:
+        """Verify the imported data, returning node counts by label and relationship counts by type"""
+        counts = {'nodes': {}, 'relationships': {}}
         with self.driver.session() as session:
-            # Count nodes by type
+            # Count nodes by type (ignoring the classification marker labels and bookkeeping nodes)
             result = session.run("""
                 MATCH (n)
-                RETURN labels(n)[0] as node_type, count(n) as count
+                WHERE none(label IN labels(n) WHERE label IN $bookkeeping)
+                RETURN [label IN labels(n) WHERE NOT label IN $markers][0] as node_type, count(n) as count
                 ORDER BY count DESC
-            """)
+            """, markers=marker_labels(), bookkeeping=[GRAPH_VERSION_LABEL] + SUMMARY_LABELS)
             
             logger.info("Database import verification:")
             for record in result:
                 logger.info(f"  {record['node_type']}: {record['count']}")
+                counts['nodes'][record['node_type']] = record['count']
                 
             # Count relationships by type
             result = session.run("""
@@ -271,6 +515,9 @@ class DatabaseInitializer:
             logger.info("Relationship counts:")
             for record in result:
                 logger.info(f"  {record['relationship_type']}: {record['count']}")
+                counts['relationships'][record['relationship_type']] = record['count']
+                
+        return counts
 
 def main():
     """Main function"""
@@ -280,15 +527,21 @@ def main():
     parser.add_argument('--password', required=True, help='Neo4j password')
     parser.add_argument('--clear', action='store_true', help='Clear existing database before import')
     parser.add_argument('--data-dir', default='extracted_university_data', help='Directory containing JSON data files')
+    parser.add_argument('--bulk', action='store_true', help='Import with batched UNWIND writes instead of one query per node')
+    parser.add_argument('--batch-size', type=int, help='Rows per UNWIND chunk in bulk mode (default: Config batch_size)')
+    parser.add_argument('--workers', type=int, help='Parallel bulk import with this many reader processes and writer sessions')
     
     args = parser.parse_args()
     
     # Initialize database
-    initializer = DatabaseInitializer(args.uri, args.user, args.password)
+    initializer = DatabaseInitializer(args.uri, args.user, args.password, batch_size=args.batch_size)
     
     try:
         logger.info("Starting database initialization...")
         
+        # Summaries that were current before the import only need the imported universities refreshed
+        since = None if args.clear else initializer.graph_version()
+        
         if args.clear:
             initializer.clear_database()
             
@@ -299,7 +552,15 @@ def main():
         
         # Import data
         logger.info("Importing university data...")
-        initializer.import_university_data(args.data_dir)
+        initializer.import_university_data(args.data_dir, bulk=args.bulk, workers=args.workers)
+        
+        # Materialize classifications used by the RQ queries
+        logger.info("Materializing classification properties...")
+        initializer.materialize_classifications()
+        
+        # Pre-aggregate the per-university and whole-graph counts the RQ reports read
+        logger.info("Projecting RQ summaries...")
+        initializer.project_summaries(since)
         
         # Verify import
         logger.info("Verifying import...")
@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+Offline Bulk-Import Exporter for KG-Perseus
+
+This script turns the extracted university JSON files (the same
+*_extracted_data.json files read by database_setup.py) into header-typed node
+and relationship CSVs for `neo4j-admin database import full`. A cold rebuild
+then becomes one offline file import instead of one MERGE per node.
+
+The graph written is the one database_setup.py builds: one node per distinct
+name per label (later files win on properties, as with MERGE ... SET) and one
+relationship per distinct university/entity pair. Node names are the import
+IDs, so IDs are stable across exports.
+
+Usage:
+    python export_neo4j_import_csv.py export --data-dir <json_dir> --output-dir <csv_dir>
+    python export_neo4j_import_csv.py verify --uri <neo4j_uri> --user <username> --password <password>
+
+Example:
+    python export_neo4j_import_csv.py export --data-dir extracted_university_data --output-dir data/neo4j_import
+    python export_neo4j_import_csv.py verify --uri bolt://localhost:7687 --user neo4j --password password --create-schema
+"""
+
+import argparse
+import json
+import logging
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from database_setup import BULK_LABELS, DatabaseInitializer, collect_university_rows
+
+# Set up logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILE = 'import_manifest.json'
+
+# Node properties per label as (property name, row key); every label is keyed by name
+NODE_PROPERTIES = {
+    'University': [('source_file', 'source_file')],
+    'Program': [('level', 'level'), ('type', 'type')],
+    'Faculty': [('research_area', 'research_area')],
+    'ResearchCenter': [('technology_focus', 'focus')],
+    'Course': [('technology_focus', 'focus'), ('description', 'description')],
+}
+
+# Relationship type from University to each entity label (mirrors database_setup.BULK_QUERIES)
+RELATIONSHIP_TYPES = {
+    'Program': 'OFFERS',
+    'Faculty': 'HAS',
+    'ResearchCenter': 'HAS',
+    'Course': 'OFFERS',
+}
+
+
+def csv_field(value: Any) -> str:
+    """
+    Format one CSV field for neo4j-admin
+
+    Non-null values are always quoted so that an empty string stays an empty
+    string (an unquoted empty field is imported as a missing property).
+    """
+    if value is None:
+        return ''
+    return '"' + str(value).replace('"', '""') + '"'
+
+
+def write_csv(path: Path, header: List[str], rows: List[List[Any]]):
+    """Write a header line and quoted data rows"""
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        f.write(','.join(header) + '\n')
+        for row in rows:
+            f.write(','.join(csv_field(value) for value in row) + '\n')
+
+
+def build_graph(rows: Dict[str, List[Dict[str, Any]]]) -> Tuple[Dict[str, Dict[str, Dict[str, Any]]],
+                                                               Dict[str, List[Tuple[str, str]]]]:
+    """
+    Deduplicate collected rows into the nodes and relationships MERGE would create
+
+    Args:
+        rows: Per-label rows from database_setup.collect_university_rows
+
+    Returns:
+        (nodes, relationships): nodes maps label -> name -> row (last row wins);
+        relationships maps entity label -> distinct (university, name) pairs
+    """
+    nodes = {label: {} for label in BULK_LABELS}
+    relationships = {label: {} for label in RELATIONSHIP_TYPES}
+
+    for label in BULK_LABELS:
+        for row in rows[label]:
+            if row['name'] is None:
+                continue  # MERGE rejects null keys
+            nodes[label][row['name']] = row
+            if label in relationships:
+                relationships[label][(row['university'], row['name'])] = None
+
+    return nodes, {label: list(pairs) for label, pairs in relationships.items()}
+
+
+def export_import_csvs(data_dir: str, output_dir: str, import_dir: str = '/var/lib/neo4j/import',
+                       database: str = 'neo4j') -> Dict[str, Any]:
+    """
+    Export the extracted JSON to neo4j-admin import CSVs plus a manifest
+
+    Args:
+        data_dir: Directory containing *_extracted_data.json files
+        output_dir: Directory for the CSVs and import_manifest.json
+        import_dir: Where output_dir is visible to neo4j-admin (used in the printed command)
+        database: Target database name
+
+    Returns:
+        The manifest: expected counts, files and the neo4j-admin command
+    """
+    data_path = Path(data_dir)
+    if not data_path.exists():
+        raise FileNotFoundError(f"Data directory {data_dir} not found")
+
+    rows = {label: [] for label in BULK_LABELS}
+    json_files = sorted(data_path.glob("*.json"))
+    logger.info(f"Found {len(json_files)} JSON files to export")
+
+    for json_file in json_files:
+        if json_file.name == "extraction_summary_report.json":
+            continue  # Skip summary file
+
+        try:
+            with open(json_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            collect_university_rows(data, json_file.name, rows)
+        except Exception as e:
+            logger.error(f"Failed to export {json_file.name}: {e}")
+
+    nodes, relationships = build_graph(rows)
+
+    output_path = Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
+    node_files, relationship_files = {}, {}
+
+    for label in BULK_LABELS:
+        properties = NODE_PROPERTIES[label]
+        header = [f'name:ID({label})'] + [f'{name}:string' for name, _ in properties]
+        write_csv(output_path / f'{label}.csv', header,
+                  [[name] + [row.get(key) for _, key in properties] for name, row in nodes[label].items()])
+        node_files[label] = f'{label}.csv'
+
+    for label, rel_type in RELATIONSHIP_TYPES.items():
+        filename = f'{rel_type}_{label}.csv'
+        write_csv(output_path / filename, [':START_ID(University)', f':END_ID({label})'],
+                  [list(pair) for pair in relationships[label]])
+        relationship_files[filename] = rel_type
+
+    relationship_counts: Dict[str, int] = {}
+    for label, rel_type in RELATIONSHIP_TYPES.items():
+        relationship_counts[rel_type] = relationship_counts.get(rel_type, 0) + len(relationships[label])
+
+    command = ['neo4j-admin', 'database', 'import', 'full', '--overwrite-destination', '--multiline-fields=true']
+    command += [f'--nodes={label}={import_dir}/{filename}' for label, filename in node_files.items()]
+    command += [f'--relationships={rel_type}={import_dir}/{filename}'
+                for filename, rel_type in relationship_files.items()]
+    command.append(database)
+
+    manifest = {
+        'source_dir': str(data_path),
+        'counts': {
+            'nodes': {label: len(nodes[label]) for label in BULK_LABELS if nodes[label]},
+            'relationships': {rel_type: n for rel_type, n in relationship_counts.items() if n}
+        },
+        'node_files': node_files,
+        'relationship_files': relationship_files,
+        'command': ' '.join(command)
+    }
+    with open(output_path / MANIFEST_FILE, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+
+    for label, count in manifest['counts']['nodes'].items():
+        logger.info(f"  {label}: {count} nodes")
+    for rel_type, count in manifest['counts']['relationships'].items():
+        logger.info(f"  {rel_type}: {count} relationships")
+    logger.info(f"Wrote import CSVs and {MANIFEST_FILE} to {output_path}")
+    logger.info(f"Import command (database stopped):\n  {manifest['command']}")
+
+    return manifest
+
+
+def compare_counts(expected: Dict[str, Dict[str, int]], actual: Dict[str, Dict[str, int]]) -> List[str]:
+    """
+    Compare exported counts with the counts reported by DatabaseInitializer.verify_import
+
+    Returns:
+        One message per label or relationship type whose counts differ
+    """
+    mismatches = []
+    for kind in ('nodes', 'relationships'):
+        for name in sorted(set(expected[kind]) | set(actual[kind])):
+            want, got = expected[kind].get(name, 0), actual[kind].get(name, 0)
+            if want != got:
+                mismatches.append(f"{kind} {name}: expected {want}, found {got}")
+    return mismatches
+
+
+def verify_import_counts(uri: str, user: str, password: str, output_dir: str,
+                         create_schema: bool = False) -> bool:
+    """
+    Check a database loaded from the exported CSVs against the manifest counts
+
+    Args:
+        uri, user, password: Neo4j connection
+        output_dir: Export directory holding import_manifest.json
+        create_schema: Create database_setup's constraints and indexes, materialize its
+            classifications, stamp the graph version and project the RQ summaries first
+            (neo4j-admin import does none of these)
+
+    Returns:
+        True if every node and relationship count matches
+    """
+    with open(Path(output_dir) / MANIFEST_FILE, 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+
+    initializer = DatabaseInitializer(uri, user, password)
+    try:
+        if create_schema:
+            initializer.create_constraints()
+            initializer.create_indexes()
+            initializer.materialize_classifications()
+            initializer.stamp_graph_version()
+            initializer.project_summaries()
+        actual = initializer.verify_import()
+    finally:
+        initializer.close()
+
+    mismatches = compare_counts(manifest['counts'], actual)
+    for mismatch in mismatches:
+        logger.error(f"Count mismatch: {mismatch}")
+    if not mismatches:
+        logger.info("Imported graph matches the exported node and relationship counts")
+    return not mismatches
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description='Export KG-Perseus data for neo4j-admin bulk import')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    export_parser = subparsers.add_parser('export', help='Write node/relationship CSVs and a manifest')
+    export_parser.add_argument('--data-dir', default='extracted_university_data', help='Directory containing JSON data files')
+    export_parser.add_argument('--output-dir', default='data/neo4j_import', help='Directory for the import CSVs')
+    export_parser.add_argument('--import-dir', default='/var/lib/neo4j/import',
+                               help='Path of the output directory as seen by neo4j-admin')
+    export_parser.add_argument('--database', default='neo4j', help='Target database name')
+
+    verify_parser = subparsers.add_parser('verify', help='Compare database counts with the export manifest')
+    verify_parser.add_argument('--uri', required=True, help='Neo4j database URI')
+    verify_parser.add_argument('--user', required=True, help='Neo4j username')
+    verify_parser.add_argument('--password', required=True, help='Neo4j password')
+    verify_parser.add_argument('--output-dir', default='data/neo4j_import', help='Directory holding the export manifest')
+    verify_parser.add_argument('--create-schema', action='store_true', help='Create constraints and indexes, materialize classifications and project RQ summaries before verifying')
+
+    args = parser.parse_args()
+
+    if args.command == 'export':
+        export_import_csvs(args.data_dir, args.output_dir, args.import_dir, args.database)
+    elif not verify_import_counts(args.uri, args.user, args.password, args.output_dir, args.create_schema):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
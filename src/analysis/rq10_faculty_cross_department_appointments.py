@@ -11,11 +11,123 @@ comprehensive insights into cross-department faculty distribution and characteri
 import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
-from neo4j import GraphDatabase
 import numpy as np
+import sys
+from pathlib import Path
 from typing import Dict, List, Tuple
 import logging
 
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from src.utils.classification_materializer import marker_labels
+from src.utils.neo4j_executor import get_executor
+from src.utils.query_cache import GRAPH_VERSION_LABEL
+from src.utils.summary_projections import SUMMARY_LABELS, summaries_current
+from src.utils.taxonomy import get_taxonomy
+
+DEPARTMENT_TYPES = get_taxonomy('department_type')
+
+# Independent read queries of the analysis, run concurrently as one batch. Department
+# categories come from the materialized d.department_type (config/taxonomies.yaml:
+# department_type), which replaces every toLower(d.name) CONTAINS ... filter and CASE
+# chain, so the technology and research-area queries cover the same departments as the
+# counts; the faculty counts per department type are read from the RQ summary nodes
+# (src/utils/summary_projections.py) instead of being recounted from the appointments
+RQ10_QUERIES = {
+    'node_counts': """
+        MATCH (n)
+        WHERE none(label IN labels(n) WHERE label IN $bookkeeping)
+        RETURN [label IN labels(n) WHERE NOT label IN $markers][0] as node_type, count(n) as count
+        ORDER BY count DESC
+    """,
+    'total_faculty': """
+        MATCH (s:RQSummary {projection: 'faculty_totals'})
+        WHERE s.university IS NULL
+        RETURN s.faculty as total_faculty
+    """,
+    'faculty_appointments': """
+        MATCH (f:Faculty)-[:APPOINTED_TO]->(d:Department)
+        RETURN f.name as faculty_name, d.name as department_name, d.category as department_category
+        ORDER BY faculty_name
+    """,
+    'cross_department_faculty': """
+        MATCH (s:RQSummary {projection: 'faculty_department'})
+        WHERE s.university IS NULL AND s.department_type IN ['Computer Science', 'Engineering', 'Data Science']
+        RETURN s.department_type as department_category, s.faculty as faculty_count
+        ORDER BY faculty_count DESC
+    """,
+    'multiple_appointments': """
+        MATCH (f:Faculty)-[:APPOINTED_TO]->(d:Department)
+        WITH f.name as faculty_name, collect(d.name) as departments
+        WHERE size(departments) > 1
+        RETURN faculty_name, departments, size(departments) as appointment_count
+        ORDER BY appointment_count DESC, faculty_name
+    """,
+    'university_distribution': """
+        MATCH (s:RQSummary {projection: 'faculty_department'})
+        WHERE s.university IS NOT NULL AND s.department_type IN ['Computer Science', 'Engineering', 'Data Science']
+        RETURN s.university as university_name, s.department_type as department_category,
+               s.faculty as faculty_count
+        ORDER BY university_name, department_category
+    """,
+    'technology_integration': """
+        MATCH (f:Faculty)-[:APPOINTED_TO]->(d:Department)-[:USES_TECHNOLOGY]->(t:Technology)
+        WHERE d.department_type IN ['Computer Science', 'Engineering', 'Data Science']
+        RETURN f.name as faculty_name, d.name as department_name, t.name as technology_name, t.category as technology_category
+        ORDER BY faculty_name, technology_name
+    """,
+    'research_areas': """
+        MATCH (f:Faculty)-[:APPOINTED_TO]->(d:Department)-[:HAS_RESEARCH_AREA]->(ra:ResearchArea)
+        WHERE d.department_type IN ['Computer Science', 'Engineering', 'Data Science']
+        RETURN f.name as faculty_name, d.name as department_name, ra.name as research_area
+        ORDER BY faculty_name, research_area
+    """,
+    'summary_statistics': """
+        MATCH (s:RQSummary {projection: 'faculty_department'})
+        WHERE s.university IS NULL AND s.department_type IN ['Computer Science', 'Engineering', 'Data Science']
+        MATCH (t:RQSummary {projection: 'faculty_totals'})
+        WHERE t.university IS NULL
+        RETURN s.department_type as department_category, 
+               s.faculty as faculty_count,
+               round(s.faculty * 100.0 / t.faculty, 2) as percentage_of_total_faculty
+        ORDER BY faculty_count DESC
+    """,
+}
+
+# Live aggregations replacing the summary-node reads while the summaries are missing or
+# older than the graph (read-only; the import and sync paths rebuild the summaries)
+RQ10_LIVE_QUERIES = {
+    'total_faculty': "MATCH (f:Faculty) RETURN count(f) as total_faculty",
+    'cross_department_faculty': """
+        MATCH (f:Faculty)-[:APPOINTED_TO]->(d:Department)
+        WHERE d.department_type IN ['Computer Science', 'Engineering', 'Data Science']
+        RETURN d.department_type as department_category, count(DISTINCT f.name) as faculty_count
+        ORDER BY faculty_count DESC
+    """,
+    'university_distribution': """
+        MATCH (u:University)-[:HAS]->(d:Department)<-[:APPOINTED_TO]-(f:Faculty)
+        WHERE d.department_type IN ['Computer Science', 'Engineering', 'Data Science']
+        RETURN u.name as university_name, d.department_type as department_category,
+               count(DISTINCT f.name) as faculty_count
+        ORDER BY university_name, department_category
+    """,
+    'summary_statistics': """
+        MATCH (f:Faculty)-[:APPOINTED_TO]->(d:Department)
+        WHERE d.department_type IN ['Computer Science', 'Engineering', 'Data Science']
+        RETURN d.department_type as department_category, 
+               count(DISTINCT f.name) as faculty_count,
+               round(count(DISTINCT f.name) * 100.0 / (MATCH (f2:Faculty) RETURN count(f2))[0], 2) as percentage_of_total_faculty
+        ORDER BY faculty_count DESC
+    """,
+}
+
+# Node counts ignore the classification marker labels and the bookkeeping nodes (as database_setup.verify_import does)
+RQ10_PARAMS = {
+    'node_counts': {'markers': marker_labels(), 'bookkeeping': [GRAPH_VERSION_LABEL] + SUMMARY_LABELS},
+}
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -25,45 +137,41 @@ class RQ10FacultyCrossDepartmentAppointmentsAnalyzer:
     
     def __init__(self, uri, user, password):
         """Initialize the RQ10 Faculty Cross-Department Appointments Analyzer"""
-        self.driver = GraphDatabase.driver(uri, auth=(user, password))
+        self.executor = get_executor(uri, user, password)
         self.uri = uri
         self.user = user
         self.password = password
         
     def close(self):
-        """Close the database connection"""
-        self.driver.close()
+        """Release the shared database connection and log query metrics"""
+        logger.info(f"Neo4j {self.executor.metrics.format()}")
         
-    def verify_database(self, session):
+    def verify_database(self, batch):
         """Verify database structure and content"""
         try:
-            result = session.run("MATCH (n) RETURN labels(n) as node_types, count(n) as count ORDER BY count DESC")
-            node_counts = [(record["node_types"], record["count"]) for record in result]
+            result = batch.result('node_counts')
+            node_counts = [(record["node_type"], record["count"]) for record in result]
             logger.info(f"Database verification completed. Node types and counts: {node_counts}")
             return node_counts
         except Exception as e:
             logger.error(f"Database verification failed: {e}")
             return []
     
-    def get_total_faculty_count(self, session):
+    def get_total_faculty_count(self, batch):
         """Get total faculty count"""
         try:
-            result = session.run("MATCH (f:Faculty) RETURN count(f) as total_faculty")
-            total = result.single()["total_faculty"]
+            result = batch.result('total_faculty')
+            total = result.value("total_faculty")
             logger.info(f"Total faculty count: {total}")
             return total
         except Exception as e:
             logger.error(f"Failed to get total faculty count: {e}")
             return 0
     
-    def get_faculty_department_appointments(self, session):
+    def get_faculty_department_appointments(self, batch):
         """Get all faculty department appointments"""
         try:
-            result = session.run("""
-                MATCH (f:Faculty)-[:APPOINTED_TO]->(d:Department)
-                RETURN f.name as faculty_name, d.name as department_name, d.category as department_category
-                ORDER BY faculty_name
-            """)
+            result = batch.result('faculty_appointments')
             appointments = [(record["faculty_name"], record["department_name"], record["department_category"]) 
                           for record in result]
             logger.info(f"Retrieved {len(appointments)} faculty department appointments")
@@ -74,41 +182,12 @@ class RQ10FacultyCrossDepartmentAppointmentsAnalyzer:
     
     def classify_department_type(self, department_name: str) -> str:
         """Classify department by type based on name"""
-        dept_lower = department_name.lower()
-        
-        if any(keyword in dept_lower for keyword in ['computer science', 'cs', 'computing', 'informatics']):
-            return 'Computer Science'
-        elif any(keyword in dept_lower for keyword in ['engineering', 'eng', 'mechanical', 'electrical', 
-                                                     'civil', 'chemical', 'biomedical', 'environmental']):
-            return 'Engineering'
-        elif any(keyword in dept_lower for keyword in ['data science', 'data', 'analytics', 'statistics', 
-                                                     'biostatistics', 'quantitative']):
-            return 'Data Science'
-        else:
-            return 'Other'
+        return DEPARTMENT_TYPES.classify(department_name)
     
-    def get_cross_department_faculty(self, session):
+    def get_cross_department_faculty(self, batch):
         """Get faculty with cross-department appointments"""
         try:
-            result = session.run("""
-                MATCH (f:Faculty)-[:APPOINTED_TO]->(d:Department)
-                WITH f.name as faculty_name, 
-                     CASE 
-                         WHEN toLower(d.name) CONTAINS 'computer science' OR toLower(d.name) CONTAINS 'cs' OR 
-                              toLower(d.name) CONTAINS 'computing' OR toLower(d.name) CONTAINS 'informatics' THEN 'Computer Science'
-                         WHEN toLower(d.name) CONTAINS 'engineering' OR toLower(d.name) CONTAINS 'eng' OR
-                              toLower(d.name) CONTAINS 'mechanical' OR toLower(d.name) CONTAINS 'electrical' OR
-                              toLower(d.name) CONTAINS 'civil' OR toLower(d.name) CONTAINS 'chemical' OR
-                              toLower(d.name) CONTAINS 'biomedical' OR toLower(d.name) CONTAINS 'environmental' THEN 'Engineering'
-                         WHEN toLower(d.name) CONTAINS 'data science' OR toLower(d.name) CONTAINS 'data' OR
-                              toLower(d.name) CONTAINS 'analytics' OR toLower(d.name) CONTAINS 'statistics' OR
-                              toLower(d.name) CONTAINS 'biostatistics' OR toLower(d.name) CONTAINS 'quantitative' THEN 'Data Science'
-                         ELSE 'Other'
-                     END as department_category
-                WHERE department_category IN ['Computer Science', 'Engineering', 'Data Science']
-                RETURN department_category, count(DISTINCT faculty_name) as faculty_count
-                ORDER BY faculty_count DESC
-            """)
+            result = batch.result('cross_department_faculty')
             
             cross_dept_data = [(record["department_category"], record["faculty_count"]) for record in result]
             logger.info(f"Retrieved cross-department faculty data: {cross_dept_data}")
@@ -117,16 +196,10 @@ class RQ10FacultyCrossDepartmentAppointmentsAnalyzer:
             logger.error(f"Failed to get cross-department faculty data: {e}")
             return []
     
-    def get_multiple_appointments_faculty(self, session):
+    def get_multiple_appointments_faculty(self, batch):
         """Get faculty with multiple department appointments"""
         try:
-            result = session.run("""
-                MATCH (f:Faculty)-[:APPOINTED_TO]->(d:Department)
-                WITH f.name as faculty_name, collect(d.name) as departments
-                WHERE size(departments) > 1
-                RETURN faculty_name, departments, size(departments) as appointment_count
-                ORDER BY appointment_count DESC, faculty_name
-            """)
+            result = batch.result('multiple_appointments')
             
             multiple_appointments = [(record["faculty_name"], record["departments"], record["appointment_count"]) 
                                    for record in result]
@@ -136,28 +209,10 @@ class RQ10FacultyCrossDepartmentAppointmentsAnalyzer:
             logger.error(f"Failed to get multiple appointments faculty: {e}")
             return []
     
-    def get_university_cross_department_distribution(self, session):
+    def get_university_cross_department_distribution(self, batch):
         """Get university-level cross-department faculty distribution"""
         try:
-            result = session.run("""
-                MATCH (u:University)-[:HAS]->(d:Department)<-[:APPOINTED_TO]-(f:Faculty)
-                WITH u.name as university_name, d.name as department_name, f.name as faculty_name,
-                     CASE 
-                         WHEN toLower(d.name) CONTAINS 'computer science' OR toLower(d.name) CONTAINS 'cs' OR 
-                              toLower(d.name) CONTAINS 'computing' OR toLower(d.name) CONTAINS 'informatics' THEN 'Computer Science'
-                         WHEN toLower(d.name) CONTAINS 'engineering' OR toLower(d.name) CONTAINS 'eng' OR
-                              toLower(d.name) CONTAINS 'mechanical' OR toLower(d.name) CONTAINS 'electrical' OR
-                              toLower(d.name) CONTAINS 'civil' OR toLower(d.name) CONTAINS 'chemical' OR
-                              toLower(d.name) CONTAINS 'biomedical' OR toLower(d.name) CONTAINS 'environmental' THEN 'Engineering'
-                         WHEN toLower(d.name) CONTAINS 'data science' OR toLower(d.name) CONTAINS 'data' OR
-                              toLower(d.name) CONTAINS 'analytics' OR toLower(d.name) CONTAINS 'statistics' OR
-                              toLower(d.name) CONTAINS 'biostatistics' OR toLower(d.name) CONTAINS 'quantitative' THEN 'Data Science'
-                         ELSE 'Other'
-                     END as department_category
-                WHERE department_category IN ['Computer Science', 'Engineering', 'Data Science']
-                RETURN university_name, department_category, count(DISTINCT faculty_name) as faculty_count
-                ORDER BY university_name, department_category
-            """)
+            result = batch.result('university_distribution')
             
             univ_distribution = [(record["university_name"], record["department_category"], record["faculty_count"]) 
                                 for record in result]
@@ -167,16 +222,10 @@ class RQ10FacultyCrossDepartmentAppointmentsAnalyzer:
             logger.error(f"Failed to get university cross-department distribution: {e}")
             return []
     
-    def get_faculty_technology_integration(self, session):
+    def get_faculty_technology_integration(self, batch):
         """Get faculty technology integration with cross-department appointments"""
         try:
-            result = session.run("""
-                MATCH (f:Faculty)-[:APPOINTED_TO]->(d:Department)-[:USES_TECHNOLOGY]->(t:Technology)
-                WHERE toLower(d.name) CONTAINS 'computer science' OR toLower(d.name) CONTAINS 'engineering' OR 
-                      toLower(d.name) CONTAINS 'data science'
-                RETURN f.name as faculty_name, d.name as department_name, t.name as technology_name, t.category as technology_category
-                ORDER BY faculty_name, technology_name
-            """)
+            result = batch.result('technology_integration')
             
             tech_integration = [(record["faculty_name"], record["department_name"], 
                                record["technology_name"], record["technology_category"]) for record in result]
@@ -186,16 +235,10 @@ class RQ10FacultyCrossDepartmentAppointmentsAnalyzer:
             logger.error(f"Failed to get faculty technology integration: {e}")
             return []
     
-    def get_faculty_research_areas(self, session):
+    def get_faculty_research_areas(self, batch):
         """Get cross-department faculty by research area"""
         try:
-            result = session.run("""
-                MATCH (f:Faculty)-[:APPOINTED_TO]->(d:Department)-[:HAS_RESEARCH_AREA]->(ra:ResearchArea)
-                WHERE toLower(d.name) CONTAINS 'computer science' OR toLower(d.name) CONTAINS 'engineering' OR 
-                      toLower(d.name) CONTAINS 'data science'
-                RETURN f.name as faculty_name, d.name as department_name, ra.name as research_area
-                ORDER BY faculty_name, research_area
-            """)
+            result = batch.result('research_areas')
             
             research_areas = [(record["faculty_name"], record["department_name"], record["research_area"]) 
                              for record in result]
@@ -205,30 +248,10 @@ class RQ10FacultyCrossDepartmentAppointmentsAnalyzer:
             logger.error(f"Failed to get faculty research areas: {e}")
             return []
     
-    def get_summary_statistics(self, session):
+    def get_summary_statistics(self, batch):
         """Get summary statistics for cross-department faculty"""
         try:
-            result = session.run("""
-                MATCH (f:Faculty)-[:APPOINTED_TO]->(d:Department)
-                WITH f.name as faculty_name, 
-                     CASE 
-                         WHEN toLower(d.name) CONTAINS 'computer science' OR toLower(d.name) CONTAINS 'cs' OR 
-                              toLower(d.name) CONTAINS 'computing' OR toLower(d.name) CONTAINS 'informatics' THEN 'Computer Science'
-                         WHEN toLower(d.name) CONTAINS 'engineering' OR toLower(d.name) CONTAINS 'eng' OR
-                              toLower(d.name) CONTAINS 'mechanical' OR toLower(d.name) CONTAINS 'electrical' OR
-                              toLower(d.name) CONTAINS 'civil' OR toLower(d.name) CONTAINS 'chemical' OR
-                              toLower(d.name) CONTAINS 'biomedical' OR toLower(d.name) CONTAINS 'environmental' THEN 'Engineering'
-                         WHEN toLower(d.name) CONTAINS 'data science' OR toLower(d.name) CONTAINS 'data' OR
-                              toLower(d.name) CONTAINS 'analytics' OR toLower(d.name) CONTAINS 'statistics' OR
-                              toLower(d.name) CONTAINS 'biostatistics' OR toLower(d.name) CONTAINS 'quantitative' THEN 'Data Science'
-                         ELSE 'Other'
-                     END as department_category
-                WHERE department_category IN ['Computer Science', 'Engineering', 'Data Science']
-                RETURN department_category, 
-                       count(DISTINCT faculty_name) as faculty_count,
-                       round(count(DISTINCT faculty_name) * 100.0 / (MATCH (f2:Faculty) RETURN count(f2))[0], 2) as percentage_of_total_faculty
-                ORDER BY faculty_count DESC
-            """)
+            result = batch.result('summary_statistics')
             
             summary_stats = [(record["department_category"], record["faculty_count"], record["percentage_of_total_faculty"]) 
                             for record in result]
@@ -362,120 +385,131 @@ class RQ10FacultyCrossDepartmentAppointmentsAnalyzer:
     def run_analysis(self):
         """Run the complete RQ10 analysis"""
         try:
-            with self.driver.session() as session:
-                logger.info("Starting RQ10: Faculty Cross-Department Appointments Analysis")
-                
-                # Verify database
-                node_counts = self.verify_database(session)
-                
-                # Get basic counts
-                total_faculty = self.get_total_faculty_count(session)
-                
-                # Get all data
-                faculty_appointments = self.get_faculty_department_appointments(session)
-                cross_dept_data = self.get_cross_department_faculty(session)
-                multiple_appointments = self.get_multiple_appointments_faculty(session)
-                univ_distribution = self.get_university_cross_department_distribution(session)
-                tech_integration = self.get_faculty_technology_integration(session)
-                research_areas = self.get_faculty_research_areas(session)
-                summary_stats = self.get_summary_statistics(session)
-                
-                # Create DataFrames for analysis
-                cross_dept_df = pd.DataFrame(cross_dept_data, columns=['Department_Type', 'Faculty_Count'])
-                multiple_appt_df = pd.DataFrame(multiple_appointments, columns=['Faculty_Name', 'Departments', 'Appointment_Count'])
-                univ_dist_df = pd.DataFrame(univ_distribution, columns=['University', 'Department_Type', 'Faculty_Count'])
-                tech_integration_df = pd.DataFrame(tech_integration, columns=['Faculty_Name', 'Department', 'Technology', 'Category'])
-                research_areas_df = pd.DataFrame(research_areas, columns=['Faculty_Name', 'Department', 'Research_Area'])
-                summary_stats_df = pd.DataFrame(summary_stats, columns=['Department_Type', 'Faculty_Count', 'Percentage'])
-                
-                # Print results
-                print("\n" + "="*80)
-                print("RQ10: FACULTY CROSS-DEPARTMENT APPOINTMENTS ANALYSIS")
-                print("="*80)
-                
-                print(f"\nTotal Faculty in Database: {total_faculty}")
-                print(f"Faculty with Department Appointments: {len(faculty_appointments)}")
-                
-                print("\n" + "-"*60)
-                print("CROSS-DEPARTMENT FACULTY DISTRIBUTION")
-                print("-"*60)
-                print(cross_dept_df.to_string(index=False))
-                
-                print("\n" + "-"*60)
-                print("FACULTY WITH MULTIPLE DEPARTMENT APPOINTMENTS")
-                print("-"*60)
-                if not multiple_appt_df.empty:
-                    print(f"Total Faculty with Multiple Appointments: {len(multiple_appt_df)}")
-                    print(multiple_appt_df.head(10).to_string(index=False))
-                    if len(multiple_appt_df) > 10:
-                        print(f"... and {len(multiple_appt_df) - 10} more")
-                else:
-                    print("No faculty found with multiple department appointments")
-                
-                print("\n" + "-"*60)
-                print("UNIVERSITY-LEVEL CROSS-DEPARTMENT FACULTY DISTRIBUTION")
-                print("-"*60)
-                if not univ_dist_df.empty:
-                    univ_totals = univ_dist_df.groupby('University')['Faculty_Count'].sum().sort_values(ascending=False)
-                    print("Top 10 Universities by Cross-Department Faculty:")
-                    for univ, count in univ_totals.head(10).items():
-                        print(f"  {univ}: {int(count)} faculty")
-                else:
-                    print("No university-level distribution data available")
-                
-                print("\n" + "-"*60)
-                print("TECHNOLOGY INTEGRATION BY CROSS-DEPARTMENT FACULTY")
-                print("-"*60)
-                if not tech_integration_df.empty:
-                    tech_faculty_count = len(set(tech_integration_df['Faculty_Name']))
-                    print(f"Cross-Department Faculty Using Technologies: {tech_faculty_count}")
-                    
-                    dept_tech_counts = tech_integration_df.groupby('Department').size()
-                    print("\nTechnology Integration by Department:")
-                    for dept, count in dept_tech_counts.items():
-                        print(f"  {dept}: {count} technology relationships")
-                else:
-                    print("No technology integration data available")
-                
-                print("\n" + "-"*60)
-                print("RESEARCH AREAS OF CROSS-DEPARTMENT FACULTY")
-                print("-"*60)
-                if not research_areas_df.empty:
-                    research_counts = research_areas_df['Research_Area'].value_counts()
-                    print("Top 10 Research Areas:")
-                    for area, count in research_counts.head(10).items():
-                        print(f"  {area}: {count} faculty")
-                else:
-                    print("No research area data available")
-                
-                print("\n" + "-"*60)
-                print("SUMMARY STATISTICS")
-                print("-"*60)
-                print(summary_stats_df.to_string(index=False))
-                
-                # Create visualizations
-                self.create_visualizations(cross_dept_data, univ_distribution, multiple_appointments, 
-                                        tech_integration, research_areas)
-                
-                # Save results to CSV files
-                cross_dept_df.to_csv('rq10_cross_department_faculty_distribution.csv', index=False)
-                multiple_appt_df.to_csv('rq10_multiple_appointments_faculty.csv', index=False)
-                univ_dist_df.to_csv('rq10_university_cross_department_distribution.csv', index=False)
-                tech_integration_df.to_csv('rq10_faculty_technology_integration.csv', index=False)
-                research_areas_df.to_csv('rq10_faculty_research_areas.csv', index=False)
-                summary_stats_df.to_csv('rq10_summary_statistics.csv', index=False)
-                
-                logger.info("RQ10 analysis completed successfully")
-                
-                return {
-                    'cross_dept_data': cross_dept_df,
-                    'multiple_appointments': multiple_appt_df,
-                    'university_distribution': univ_dist_df,
-                    'technology_integration': tech_integration_df,
-                    'research_areas': research_areas_df,
-                    'summary_statistics': summary_stats_df
-                }
+            logger.info("Starting RQ10: Faculty Cross-Department Appointments Analysis")
+            
+            # Faculty counts come from the summary projection, which only the import and sync
+            # paths write; the report itself is read-only and aggregates live when they are stale
+            queries = RQ10_QUERIES
+            if not summaries_current(self.executor):
+                logger.warning("RQ summaries are missing or out of date (run database_setup.py to rebuild them); "
+                               "aggregating live department data instead")
+                queries = {**RQ10_QUERIES, **RQ10_LIVE_QUERIES}
+            
+            # The queries are independent: run them concurrently
+            batch = self.executor.read_batch(queries, RQ10_PARAMS)
+            logger.info(f"Ran {len(queries)} queries in {batch.elapsed:.2f}s")
+            
+            # Verify database
+            node_counts = self.verify_database(batch)
+            
+            # Get basic counts
+            total_faculty = self.get_total_faculty_count(batch)
+            
+            # Get all data
+            faculty_appointments = self.get_faculty_department_appointments(batch)
+            cross_dept_data = self.get_cross_department_faculty(batch)
+            multiple_appointments = self.get_multiple_appointments_faculty(batch)
+            univ_distribution = self.get_university_cross_department_distribution(batch)
+            tech_integration = self.get_faculty_technology_integration(batch)
+            research_areas = self.get_faculty_research_areas(batch)
+            summary_stats = self.get_summary_statistics(batch)
+            
+            # Create DataFrames for analysis
+            cross_dept_df = pd.DataFrame(cross_dept_data, columns=['Department_Type', 'Faculty_Count'])
+            multiple_appt_df = pd.DataFrame(multiple_appointments, columns=['Faculty_Name', 'Departments', 'Appointment_Count'])
+            univ_dist_df = pd.DataFrame(univ_distribution, columns=['University', 'Department_Type', 'Faculty_Count'])
+            tech_integration_df = pd.DataFrame(tech_integration, columns=['Faculty_Name', 'Department', 'Technology', 'Category'])
+            research_areas_df = pd.DataFrame(research_areas, columns=['Faculty_Name', 'Department', 'Research_Area'])
+            summary_stats_df = pd.DataFrame(summary_stats, columns=['Department_Type', 'Faculty_Count', 'Percentage'])
+            
+            # Print results
+            print("\n" + "="*80)
+            print("RQ10: FACULTY CROSS-DEPARTMENT APPOINTMENTS ANALYSIS")
+            print("="*80)
+            
+            print(f"\nTotal Faculty in Database: {total_faculty}")
+            print(f"Faculty with Department Appointments: {len(faculty_appointments)}")
+            
+            print("\n" + "-"*60)
+            print("CROSS-DEPARTMENT FACULTY DISTRIBUTION")
+            print("-"*60)
+            print(cross_dept_df.to_string(index=False))
+            
+            print("\n" + "-"*60)
+            print("FACULTY WITH MULTIPLE DEPARTMENT APPOINTMENTS")
+            print("-"*60)
+            if not multiple_appt_df.empty:
+                print(f"Total Faculty with Multiple Appointments: {len(multiple_appt_df)}")
+                print(multiple_appt_df.head(10).to_string(index=False))
+                if len(multiple_appt_df) > 10:
+                    print(f"... and {len(multiple_appt_df) - 10} more")
+            else:
+                print("No faculty found with multiple department appointments")
+            
+            print("\n" + "-"*60)
+            print("UNIVERSITY-LEVEL CROSS-DEPARTMENT FACULTY DISTRIBUTION")
+            print("-"*60)
+            if not univ_dist_df.empty:
+                univ_totals = univ_dist_df.groupby('University')['Faculty_Count'].sum().sort_values(ascending=False)
+                print("Top 10 Universities by Cross-Department Faculty:")
+                for univ, count in univ_totals.head(10).items():
+                    print(f"  {univ}: {int(count)} faculty")
+            else:
+                print("No university-level distribution data available")
+            
+            print("\n" + "-"*60)
+            print("TECHNOLOGY INTEGRATION BY CROSS-DEPARTMENT FACULTY")
+            print("-"*60)
+            if not tech_integration_df.empty:
+                tech_faculty_count = len(set(tech_integration_df['Faculty_Name']))
+                print(f"Cross-Department Faculty Using Technologies: {tech_faculty_count}")
                 
+                dept_tech_counts = tech_integration_df.groupby('Department').size()
+                print("\nTechnology Integration by Department:")
+                for dept, count in dept_tech_counts.items():
+                    print(f"  {dept}: {count} technology relationships")
+            else:
+                print("No technology integration data available")
+            
+            print("\n" + "-"*60)
+            print("RESEARCH AREAS OF CROSS-DEPARTMENT FACULTY")
+            print("-"*60)
+            if not research_areas_df.empty:
+                research_counts = research_areas_df['Research_Area'].value_counts()
+                print("Top 10 Research Areas:")
+                for area, count in research_counts.head(10).items():
+                    print(f"  {area}: {count} faculty")
+            else:
+                print("No research area data available")
+            
+            print("\n" + "-"*60)
+            print("SUMMARY STATISTICS")
+            print("-"*60)
+            print(summary_stats_df.to_string(index=False))
+            
+            # Create visualizations
+            self.create_visualizations(cross_dept_data, univ_distribution, multiple_appointments, 
+                                    tech_integration, research_areas)
+            
+            # Save results to CSV files
+            cross_dept_df.to_csv('rq10_cross_department_faculty_distribution.csv', index=False)
+            multiple_appt_df.to_csv('rq10_multiple_appointments_faculty.csv', index=False)
+            univ_dist_df.to_csv('rq10_university_cross_department_distribution.csv', index=False)
+            tech_integration_df.to_csv('rq10_faculty_technology_integration.csv', index=False)
+            research_areas_df.to_csv('rq10_faculty_research_areas.csv', index=False)
+            summary_stats_df.to_csv('rq10_summary_statistics.csv', index=False)
+            
+            logger.info("RQ10 analysis completed successfully")
+            
+            return {
+                'cross_dept_data': cross_dept_df,
+                'multiple_appointments': multiple_appt_df,
+                'university_distribution': univ_dist_df,
+                'technology_integration': tech_integration_df,
+                'research_areas': research_areas_df,
+                'summary_statistics': summary_stats_df
+            }
+            
         except Exception as e:
             logger.error(f"Analysis failed: {e}")
             return None
@@ -8,21 +8,36 @@ This analysis follows the established RQ procedure to examine technology integra
 across different program levels and types in forestry and related academic programs.
 """
 
-from neo4j import GraphDatabase
 import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
 import numpy as np
 import os
 import re
+import sys
 from collections import defaultdict
+from pathlib import Path
 import warnings
 warnings.filterwarnings('ignore')
 
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from src.utils.neo4j_executor import get_executor
+from src.utils.summary_projections import summaries_current, summary_rows
+from src.utils.taxonomy import get_taxonomy
+
+PROGRAM_LEVELS = get_taxonomy('program_level')
+PROGRAM_TYPES = get_taxonomy('program_type')
+
+# Frames of a program summary (see prepare_program_summary)
+PROGRAM_SUMMARY_KEYS = ['program_counts', 'technology_counts']
+
 class RQ8ProgramLevelTechnologyCorrelationAnalyzer:
     def __init__(self, uri, user, password):
         """Initialize the RQ8 Program Level Technology Correlation Analyzer"""
-        self.driver = GraphDatabase.driver(uri, auth=(user, password))
+        self.executor = get_executor(uri, user, password)
         self.uri = uri
         self.user = user
         self.password = password
@@ -30,21 +45,20 @@ class RQ8ProgramLevelTechnologyCorrelationAnalyzer:
     def connect(self):
         """Test database connection"""
         try:
-            with self.driver.session() as session:
-                result = session.run("RETURN 1 as test")
-                print("✅ Successfully connected to Neo4j database")
-                return True
+            self.executor.read("RETURN 1 as test")
+            print("✅ Successfully connected to Neo4j database")
+            return True
         except Exception as e:
             print(f"❌ Failed to connect to Neo4j: {e}")
             return False
     
     def close(self):
-        """Close database connection"""
-        self.driver.close()
-        print("Database connection closed")
+        """Release the shared database connection and report query metrics"""
+        print(f"📈 Neo4j {self.executor.metrics.format()}")
+        print("Database connection released")
     
     def get_program_data(self):
-        """Extract program data from the graph database"""
+        """Extract every program-technology-university row from the graph database (raw input for prepare_program_summary)"""
         print("🔍 Extracting program data from Neo4j...")
         
         # Query for programs with technology relationships
@@ -60,206 +74,173 @@ class RQ8ProgramLevelTechnologyCorrelationAnalyzer:
         """
         
         try:
-            with self.driver.session() as session:
-                result = session.run(program_query)
-                program_data = [record.data() for record in result]
-                print(f"📊 Found {len(program_data)} program-technology relationships")
-                return program_data
+            program_data = self.executor.read(program_query).records
+            print(f"📊 Found {len(program_data)} program-technology relationships")
+            return program_data
         except Exception as e:
             print(f"❌ Error extracting program data: {e}")
             return []
     
-    def classify_program_level(self, program_name):
-        """Classify program by level (Undergraduate, Master, Doctoral)"""
-        if not program_name:
-            return 'Unknown'
-        
-        program_lower = str(program_name).lower()
-        
-        # Undergraduate keywords
-        if any(term in program_lower for term in [
-            'bachelor', 'bs', 'ba', 'undergraduate', 'associate', 'a.s.', 'a.a.'
-        ]):
-            return 'Undergraduate'
-        
-        # Master's keywords
-        elif any(term in program_lower for term in [
-            'master', 'ms', 'ma', 'mba', 'graduate', 'post-baccalaureate'
-        ]):
-            return 'Master'
-        
-        # Doctoral keywords
-        elif any(term in program_lower for term in [
-            'phd', 'ph.d.', 'doctorate', 'doctoral', 'd.phil'
-        ]):
-            return 'Doctoral'
+    def get_program_summary(self):
+        """
+        Read the pre-aggregated program counts (whole-graph RQ summary nodes)
         
-        else:
-            return 'Unknown'
+        The report never writes to the graph: when the summaries are missing or
+        older than the graph, the raw program rows are aggregated here instead.
+        """
+        if not summaries_current(self.executor):
+            print("⚠️ RQ summaries are missing or out of date (run database_setup.py to rebuild them); "
+                  "aggregating raw program data instead")
+            program_data = self.get_program_data()
+            if not program_data:
+                return {key: pd.DataFrame() for key in PROGRAM_SUMMARY_KEYS}
+            return self.prepare_program_summary(program_data)
+        
+        print("🔍 Reading program summaries from Neo4j...")
+        program_counts = pd.DataFrame(
+            summary_rows(self.executor, 'program_totals'),
+            columns=['program_level', 'program_type', 'programs', 'tech_programs']
+        ).rename(columns={'programs': 'total_programs'})
+        technology_counts = pd.DataFrame(
+            summary_rows(self.executor, 'program_technology'),
+            columns=['program_level', 'program_type', 'technology', 'rows']
+        ).rename(columns={'technology': 'technology_category'})
+        print(f"📊 Found {int(program_counts['total_programs'].sum())} programs in "
+              f"{len(program_counts)} level/type groups")
+        return {'program_counts': program_counts, 'technology_counts': technology_counts}
+    
+    def classify_program_level(self, program_name):
+        """Classify program by level (Undergraduate, Master, Doctoral); accepts a name or a Series"""
+        return PROGRAM_LEVELS.classify(program_name)
     
     def classify_program_type(self, program_name):
-        """Classify program by type (Forestry, Natural Resources, etc.)"""
-        if not program_name:
-            return 'Other'
-        
-        program_lower = str(program_name).lower()
-        
-        # Forestry programs
-        if any(term in program_lower for term in [
-            'forestry', 'forest', 'silviculture'
-        ]):
-            return 'Forestry'
-        
-        # Natural Resources programs
-        elif any(term in program_lower for term in [
-            'natural resource', 'environmental', 'ecology', 'conservation'
-        ]):
-            return 'Natural Resources'
-        
-        # Geospatial programs
-        elif any(term in program_lower for term in [
-            'gis', 'geospatial', 'geographic', 'spatial'
-        ]):
-            return 'Geospatial'
-        
-        # Data Science programs
-        elif any(term in program_lower for term in [
-            'data science', 'analytics', 'informatics', 'computational'
-        ]):
-            return 'Data Science'
-        
-        # Engineering programs
-        elif any(term in program_lower for term in [
-            'engineering', 'technology', 'technical'
-        ]):
-            return 'Engineering'
-        
-        # Business/Management programs
-        elif any(term in program_lower for term in [
-            'business', 'management', 'administration', 'policy'
-        ]):
-            return 'Business/Management'
-        
-        # Science programs
-        elif any(term in program_lower for term in [
-            'science', 'scientific', 'research'
-        ]):
-            return 'Science'
-        
-        # Computer Science programs
-        elif any(term in program_lower for term in [
-            'computer science', 'computing', 'software', 'programming'
-        ]):
-            return 'Computer Science'
+        """Classify program by type (Forestry, Natural Resources, etc.); accepts a name or a Series"""
+        return PROGRAM_TYPES.classify(program_name)
+    
+    def prepare_program_frame(self, program_data):
+        """Build the program DataFrame with categorical program_level/program_type, classifying each distinct name once"""
+        if isinstance(program_data, pd.DataFrame) and {'program_level', 'program_type'} <= set(program_data.columns):
+            return program_data
         
-        else:
-            return 'Other'
+        df = pd.DataFrame(program_data)
+        
+        # classify_series matches each distinct name once; alphabetical categories
+        # keep groupby output in the same order as plain string columns
+        for column, taxonomy in (('program_level', PROGRAM_LEVELS), ('program_type', PROGRAM_TYPES)):
+            labels = taxonomy.classify_series(df['program_name'], categorical=True)
+            df[column] = labels.cat.reorder_categories(sorted(taxonomy.labels))
+        
+        return df
+    
+    def prepare_program_summary(self, program_data):
+        """
+        Reduce program rows to the per level/type counts every analysis is built from
+        
+        Accepts the summary itself (from get_program_summary), or program rows /
+        a prepared program frame, which are aggregated here the same way the
+        summary projections aggregate the graph.
+        
+        Returns:
+            Dict with 'program_counts' (total_programs and tech_programs per level and
+            type) and 'technology_counts' (program-technology rows per level, type and technology)
+        """
+        if isinstance(program_data, dict) and set(PROGRAM_SUMMARY_KEYS) <= set(program_data):
+            return program_data
+        
+        df = self.prepare_program_frame(program_data)
+        levels_types = ['program_level', 'program_type']
+        tech_programs = df[df['technology_category'].notna()]
+        
+        program_counts = pd.concat([
+            df.groupby(levels_types, observed=True)['program_name'].nunique().rename('total_programs'),
+            tech_programs.groupby(levels_types, observed=True)['program_name'].nunique().rename('tech_programs')
+        ], axis=1).fillna(0).astype(int).reset_index()
+        technology_counts = tech_programs.groupby(levels_types + ['technology_category'], observed=True).size().reset_index(name='rows')
+        
+        return {'program_counts': program_counts, 'technology_counts': technology_counts}
+    
+    def summarize_technology_groups(self, program_summary, keys):
+        """
+        Programs with technology and technology mentions per group, plus program totals
+        
+        Distinct program counts add up across groups because each program has one level and one type.
+        
+        Returns:
+            (summary indexed by keys with unique_programs and total_technology_mentions,
+             total_programs and tech_programs indexed by keys)
+        """
+        mentions = program_summary['technology_counts'].groupby(keys, observed=True)['rows'].sum()
+        programs = program_summary['program_counts'].groupby(keys, observed=True)[['total_programs', 'tech_programs']].sum()
+        summary = pd.DataFrame({
+            'unique_programs': programs['tech_programs'].reindex(mentions.index),
+            'total_technology_mentions': mentions
+        })
+        return summary, programs
     
     def analyze_program_level_technology_correlation(self, program_data):
         """Analyze technology integration by program level"""
         print("🔬 Analyzing technology integration by program level...")
         
-        # Convert to DataFrame
-        df = pd.DataFrame(program_data)
-        
-        # Add program level classification
-        df['program_level'] = df['program_name'].apply(self.classify_program_level)
-        
-        # Filter for programs with technology
-        tech_programs = df[df['technology_category'].notna()].copy()
+        # Per level/type counts (reused if already prepared)
+        program_summary = self.prepare_program_summary(program_data)
+        technology_counts = program_summary['technology_counts']
         
         # Group by program level and technology category
-        level_tech_counts = tech_programs.groupby(['program_level', 'technology_category']).size().reset_index(name='count')
+        level_tech_counts = technology_counts.groupby(['program_level', 'technology_category'], observed=True)['rows'].sum().reset_index(name='count')
         
         # Calculate summary statistics by level
-        level_summary = tech_programs.groupby('program_level').agg({
-            'program_name': 'nunique',
-            'technology_category': 'count'
-        }).rename(columns={
-            'program_name': 'unique_programs',
-            'technology_category': 'total_technology_mentions'
-        })
+        level_summary, programs_by_level = self.summarize_technology_groups(program_summary, 'program_level')
         
         # Calculate technology adoption rate by level
-        total_programs_by_level = df.groupby('program_level')['program_name'].nunique()
-        tech_programs_by_level = tech_programs.groupby('program_level')['program_name'].nunique()
-        
-        level_summary['total_programs'] = total_programs_by_level
-        level_summary['tech_programs'] = tech_programs_by_level
+        level_summary['total_programs'] = programs_by_level['total_programs']
+        level_summary['tech_programs'] = programs_by_level['tech_programs']
         level_summary['adoption_rate'] = (level_summary['tech_programs'] / level_summary['total_programs'] * 100).round(1)
         
         return {
             'level_tech_counts': level_tech_counts,
             'level_summary': level_summary,
-            'tech_programs': tech_programs
+            'technology_counts': technology_counts
         }
     
     def analyze_program_type_technology_correlation(self, program_data):
         """Analyze technology integration by program type"""
         print("🔬 Analyzing technology integration by program type...")
         
-        # Convert to DataFrame
-        df = pd.DataFrame(program_data)
-        
-        # Add program type classification
-        df['program_type'] = df['program_name'].apply(self.classify_program_type)
-        
-        # Filter for programs with technology
-        tech_programs = df[df['technology_category'].notna()].copy()
+        # Per level/type counts (reused if already prepared)
+        program_summary = self.prepare_program_summary(program_data)
+        technology_counts = program_summary['technology_counts']
         
         # Group by program type and technology category
-        type_tech_counts = tech_programs.groupby(['program_type', 'technology_category']).size().reset_index(name='count')
+        type_tech_counts = technology_counts.groupby(['program_type', 'technology_category'], observed=True)['rows'].sum().reset_index(name='count')
         
         # Calculate summary statistics by type
-        type_summary = tech_programs.groupby('program_type').agg({
-            'program_name': 'nunique',
-            'technology_category': 'count'
-        }).rename(columns={
-            'program_name': 'unique_programs',
-            'technology_category': 'total_technology_mentions'
-        })
+        type_summary, programs_by_type = self.summarize_technology_groups(program_summary, 'program_type')
         
         # Calculate technology adoption rate by type
-        total_programs_by_type = df.groupby('program_type')['program_name'].nunique()
-        tech_programs_by_type = tech_programs.groupby('program_type')['program_name'].nunique()
-        
-        type_summary['total_programs'] = total_programs_by_type
-        type_summary['tech_programs'] = tech_programs_by_type
+        type_summary['total_programs'] = programs_by_type['total_programs']
+        type_summary['tech_programs'] = programs_by_type['tech_programs']
         type_summary['adoption_rate'] = (type_summary['tech_programs'] / type_summary['total_programs'] * 100).round(1)
         
         return {
             'type_tech_counts': type_tech_counts,
             'type_summary': type_summary,
-            'tech_programs': tech_programs
+            'technology_counts': technology_counts
         }
     
     def analyze_cross_correlation(self, program_data):
         """Analyze technology integration by both program level AND type"""
         print("🔬 Analyzing cross-correlation between program level and type...")
         
-        # Convert to DataFrame
-        df = pd.DataFrame(program_data)
-        
-        # Add classifications
-        df['program_level'] = df['program_name'].apply(self.classify_program_level)
-        df['program_type'] = df['program_name'].apply(self.classify_program_type)
-        
-        # Filter for programs with technology
-        tech_programs = df[df['technology_category'].notna()].copy()
+        # Per level/type counts (reused if already prepared)
+        program_summary = self.prepare_program_summary(program_data)
+        technology_counts = program_summary['technology_counts']
         
         # Cross-tabulation: Level x Type x Technology
-        cross_analysis = tech_programs.groupby(['program_level', 'program_type', 'technology_category']).size().reset_index(name='count')
+        cross_analysis = technology_counts.groupby(['program_level', 'program_type', 'technology_category'], observed=True)['rows'].sum().reset_index(name='count')
         
         # Summary by level and type
-        level_type_summary = tech_programs.groupby(['program_level', 'program_type']).agg({
-            'program_name': 'nunique',
-            'technology_category': 'count'
-        }).reset_index()
-        
-        level_type_summary = level_type_summary.rename(columns={
-            'program_name': 'unique_programs',
-            'technology_category': 'total_technology_mentions'
-        })
+        level_type_summary, _ = self.summarize_technology_groups(program_summary, ['program_level', 'program_type'])
+        level_type_summary = level_type_summary.reset_index()
         
         return {
             'cross_analysis': cross_analysis,
@@ -270,35 +251,31 @@ class RQ8ProgramLevelTechnologyCorrelationAnalyzer:
         """Analyze specific technology areas (AI/ML, GIS, Drones/UAV) by level and type"""
         print("🔬 Analyzing specific technology areas...")
         
-        # Convert to DataFrame
-        df = pd.DataFrame(program_data)
-        
-        # Add classifications
-        df['program_level'] = df['program_name'].apply(self.classify_program_level)
-        df['program_type'] = df['program_name'].apply(self.classify_program_type)
+        # Per level/type counts (reused if already prepared)
+        technology_counts = self.prepare_program_summary(program_data)['technology_counts']
         
         # Filter for specific technologies
         target_technologies = ['AI/ML', 'GIS', 'Drones/UAV']
         
         results = {}
         for tech in target_technologies:
-            tech_programs = df[df['technology_category'] == tech].copy()
+            tech_counts = technology_counts[technology_counts['technology_category'] == tech]
             
-            if not tech_programs.empty:
+            if not tech_counts.empty:
                 # By program level
-                level_counts = tech_programs.groupby('program_level').size().reset_index(name=f'{tech}_count')
+                level_counts = tech_counts.groupby('program_level', observed=True)['rows'].sum().reset_index(name=f'{tech}_count')
                 
                 # By program type
-                type_counts = tech_programs.groupby('program_type').size().reset_index(name=f'{tech}_count')
+                type_counts = tech_counts.groupby('program_type', observed=True)['rows'].sum().reset_index(name=f'{tech}_count')
                 
                 # Cross-tabulation
-                cross_counts = tech_programs.groupby(['program_level', 'program_type']).size().reset_index(name=f'{tech}_count')
+                cross_counts = tech_counts.groupby(['program_level', 'program_type'], observed=True)['rows'].sum().reset_index(name=f'{tech}_count')
                 
                 results[tech] = {
                     'level_counts': level_counts,
                     'type_counts': type_counts,
                     'cross_counts': cross_counts,
-                    'total_programs': len(tech_programs)
+                    'total_programs': int(tech_counts['rows'].sum())
                 }
             else:
                 results[tech] = {
@@ -416,8 +393,8 @@ class RQ8ProgramLevelTechnologyCorrelationAnalyzer:
         plt.axis('off')
         
         # Calculate summary statistics
-        total_programs = len(pd.DataFrame(level_analysis['tech_programs']['program_name'].unique()))
-        total_tech_mentions = len(level_analysis['tech_programs'])
+        total_programs = int(level_analysis['level_summary']['unique_programs'].sum())
+        total_tech_mentions = int(level_analysis['level_summary']['total_technology_mentions'].sum())
         
         summary_text = f"""
         RQ8 Analysis Summary
@@ -553,43 +530,45 @@ class RQ8ProgramLevelTechnologyCorrelationAnalyzer:
         print("🚀 Starting RQ8: Program Level and Type Technology Correlation Analysis")
         print("="*80)
         
-        # Test connection
-        if not self.connect():
-            print("❌ Cannot proceed without database connection")
-            return
-        
-        try:
-            # Extract data
-            program_data = self.get_program_data()
-            if not program_data:
-                print("❌ No program data found")
+        # One session for every query of the run
+        with self.executor.session_scope():
+            # Test connection
+            if not self.connect():
+                print("❌ Cannot proceed without database connection")
                 return
+        
+            try:
+                # Extract data: per level/type aggregates instead of every program-technology row
+                program_summary = self.get_program_summary()
+                if program_summary['program_counts'].empty:
+                    print("❌ No program data found")
+                    return
             
-            # Run analyses
-            level_analysis = self.analyze_program_level_technology_correlation(program_data)
-            type_analysis = self.analyze_program_type_technology_correlation(program_data)
-            cross_analysis = self.analyze_cross_correlation(program_data)
-            specific_tech_analysis = self.analyze_specific_technologies(program_data)
+                # Run analyses
+                level_analysis = self.analyze_program_level_technology_correlation(program_summary)
+                type_analysis = self.analyze_program_type_technology_correlation(program_summary)
+                cross_analysis = self.analyze_cross_correlation(program_summary)
+                specific_tech_analysis = self.analyze_specific_technologies(program_summary)
             
-            # Create visualizations
-            viz_path = self.create_visualizations(level_analysis, type_analysis, cross_analysis, specific_tech_analysis)
+                # Create visualizations
+                viz_path = self.create_visualizations(level_analysis, type_analysis, cross_analysis, specific_tech_analysis)
             
-            # Print results
-            self.print_detailed_results(level_analysis, type_analysis, cross_analysis, specific_tech_analysis)
+                # Print results
+                self.print_detailed_results(level_analysis, type_analysis, cross_analysis, specific_tech_analysis)
             
-            # Save results
-            self.save_results(level_analysis, type_analysis, cross_analysis, specific_tech_analysis)
+                # Save results
+                self.save_results(level_analysis, type_analysis, cross_analysis, specific_tech_analysis)
             
-            print(f"\n🎉 RQ8 analysis completed successfully!")
-            print(f"📊 Visualization saved to: {viz_path}")
+                print(f"\n🎉 RQ8 analysis completed successfully!")
+                print(f"📊 Visualization saved to: {viz_path}")
             
-        except Exception as e:
-            print(f"❌ Error during analysis: {e}")
-            import traceback
-            traceback.print_exc()
+            except Exception as e:
+                print(f"❌ Error during analysis: {e}")
+                import traceback
+                traceback.print_exc()
         
-        finally:
-            self.close()
+            finally:
+                self.close()
 
 def main():
     """Main function to run RQ8 analysis"""
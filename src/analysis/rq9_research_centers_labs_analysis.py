@@ -7,21 +7,31 @@ This analysis follows the established RQ procedure to examine the relationship b
 and technology-focused research infrastructure across universities.
 """
 
-from neo4j import GraphDatabase
 import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
 import numpy as np
 import os
 import re
+import sys
 from collections import defaultdict
+from pathlib import Path
 import warnings
 warnings.filterwarnings('ignore')
 
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from src.utils.neo4j_executor import get_executor
+from src.utils.taxonomy import get_taxonomy
+
+RESEARCH_FOCUS = get_taxonomy('research_focus')
+
 class RQ9ResearchCentersLabsAnalyzer:
     def __init__(self, uri, user, password):
         """Initialize the RQ9 Research Centers and Labs Analyzer"""
-        self.driver = GraphDatabase.driver(uri, auth=(user, password))
+        self.executor = get_executor(uri, user, password)
         self.uri = uri
         self.user = user
         self.password = password
@@ -29,18 +39,17 @@ class RQ9ResearchCentersLabsAnalyzer:
     def connect(self):
         """Test database connection"""
         try:
-            with self.driver.session() as session:
-                result = session.run("RETURN 1 as test")
-                print("✅ Successfully connected to Neo4j database")
-                return True
+            self.executor.read("RETURN 1 as test")
+            print("✅ Successfully connected to Neo4j database")
+            return True
         except Exception as e:
             print(f"❌ Failed to connect to Neo4j: {e}")
             return False
     
     def close(self):
-        """Close database connection"""
-        self.driver.close()
-        print("Database connection closed")
+        """Release the shared database connection and report query metrics"""
+        print(f"📈 Neo4j {self.executor.metrics.format()}")
+        print("Database connection released")
     
     def get_research_centers_data(self):
         """Extract research centers data from the graph database"""
@@ -60,11 +69,9 @@ class RQ9ResearchCentersLabsAnalyzer:
         """
         
         try:
-            with self.driver.session() as session:
-                result = session.run(research_centers_query)
-                research_centers_data = [record.data() for record in result]
-                print(f"📊 Found {len(research_centers_data)} research centers")
-                return research_centers_data
+            research_centers_data = self.executor.read(research_centers_query).records
+            print(f"📊 Found {len(research_centers_data)} research centers")
+            return research_centers_data
         except Exception as e:
             print(f"❌ Error extracting research centers data: {e}")
             return []
@@ -87,54 +94,16 @@ class RQ9ResearchCentersLabsAnalyzer:
         """
         
         try:
-            with self.driver.session() as session:
-                result = session.run(labs_query)
-                labs_data = [record.data() for record in result]
-                print(f"📊 Found {len(labs_data)} labs")
-                return labs_data
+            labs_data = self.executor.read(labs_query).records
+            print(f"📊 Found {len(labs_data)} labs")
+            return labs_data
         except Exception as e:
             print(f"❌ Error extracting labs data: {e}")
             return []
     
     def classify_technology_focus(self, name):
-        """Classify research center or lab by technology focus"""
-        if not name:
-            return 'Other'
-        
-        name_lower = str(name).lower()
-        
-        # GIS/Geospatial focus
-        if any(term in name_lower for term in [
-            'gis', 'geospatial', 'geographic', 'spatial', 'mapping', 'cartography'
-        ]):
-            return 'GIS'
-        
-        # AI/Machine Learning focus
-        elif any(term in name_lower for term in [
-            'ai', 'artificial intelligence', 'machine learning', 'ml', 'computational', 'data science'
-        ]):
-            return 'AI'
-        
-        # Remote Sensing focus
-        elif any(term in name_lower for term in [
-            'remote sensing', 'satellite', 'aerial', 'sensor', 'earth observation', 'spectral'
-        ]):
-            return 'Remote Sensing'
-        
-        # Drones/UAV focus
-        elif any(term in name_lower for term in [
-            'drone', 'uav', 'unmanned aerial', 'aerial photography'
-        ]):
-            return 'Drones/UAV'
-        
-        # Forestry/Environmental focus
-        elif any(term in name_lower for term in [
-            'forestry', 'forest', 'natural resource', 'environmental'
-        ]):
-            return 'Forestry/Environmental'
-        
-        else:
-            return 'Other'
+        """Classify research center or lab by technology focus; accepts a name or a Series"""
+        return RESEARCH_FOCUS.classify(name)
     
     def analyze_research_centers(self, research_centers_data):
         """Analyze research centers by technology focus and program associations"""
@@ -144,7 +113,7 @@ class RQ9ResearchCentersLabsAnalyzer:
         df = pd.DataFrame(research_centers_data)
         
         # Add technology focus classification
-        df['technology_focus'] = df['research_center_name'].apply(self.classify_technology_focus)
+        df['technology_focus'] = self.classify_technology_focus(df['research_center_name'])
         
         # Filter for technology-focused research centers
         tech_centers = df[df['technology_focus'].isin(['GIS', 'AI', 'Remote Sensing'])].copy()
@@ -185,7 +154,7 @@ class RQ9ResearchCentersLabsAnalyzer:
         df = pd.DataFrame(labs_data)
         
         # Add technology focus classification
-        df['technology_focus'] = df['lab_name'].apply(self.classify_technology_focus)
+        df['technology_focus'] = self.classify_technology_focus(df['lab_name'])
         
         # Filter for technology-focused labs
         tech_labs = df[df['technology_focus'].isin(['GIS', 'AI', 'Remote Sensing'])].copy()
@@ -261,12 +230,12 @@ class RQ9ResearchCentersLabsAnalyzer:
         
         # Research centers associations
         centers_df = pd.DataFrame(research_centers_data)
-        centers_df['technology_focus'] = centers_df['research_center_name'].apply(self.classify_technology_focus)
+        centers_df['technology_focus'] = self.classify_technology_focus(centers_df['research_center_name'])
         tech_centers = centers_df[centers_df['technology_focus'].isin(['GIS', 'AI', 'Remote Sensing'])]
         
         # Labs associations
         labs_df = pd.DataFrame(labs_data)
-        labs_df['technology_focus'] = labs_df['lab_name'].apply(self.classify_technology_focus)
+        labs_df['technology_focus'] = self.classify_technology_focus(labs_df['lab_name'])
         tech_labs = labs_df[labs_df['technology_focus'].isin(['GIS', 'AI', 'Remote Sensing'])]
         
         # Count programs by technology focus
@@ -536,45 +505,47 @@ class RQ9ResearchCentersLabsAnalyzer:
         print("🚀 Starting RQ9: Research Centers and Labs Analysis")
         print("="*80)
         
-        # Test connection
-        if not self.connect():
-            print("❌ Cannot proceed without database connection")
-            return
+        # One session for every query of the run
+        with self.executor.session_scope():
+            # Test connection
+            if not self.connect():
+                print("❌ Cannot proceed without database connection")
+                return
         
-        try:
-            # Extract data
-            research_centers_data = self.get_research_centers_data()
-            labs_data = self.get_labs_data()
+            try:
+                # Extract data
+                research_centers_data = self.get_research_centers_data()
+                labs_data = self.get_labs_data()
             
-            if not research_centers_data and not labs_data:
-                print("❌ No research centers or labs data found")
-                return
+                if not research_centers_data and not labs_data:
+                    print("❌ No research centers or labs data found")
+                    return
             
-            # Run analyses
-            research_centers_analysis = self.analyze_research_centers(research_centers_data)
-            labs_analysis = self.analyze_labs(labs_data)
-            combined_infrastructure = self.analyze_combined_infrastructure(research_centers_analysis, labs_analysis)
-            program_associations = self.analyze_program_associations(research_centers_data, labs_data)
+                # Run analyses
+                research_centers_analysis = self.analyze_research_centers(research_centers_data)
+                labs_analysis = self.analyze_labs(labs_data)
+                combined_infrastructure = self.analyze_combined_infrastructure(research_centers_analysis, labs_analysis)
+                program_associations = self.analyze_program_associations(research_centers_data, labs_data)
             
-            # Create visualizations
-            viz_path = self.create_visualizations(research_centers_analysis, labs_analysis, combined_infrastructure, program_associations)
+                # Create visualizations
+                viz_path = self.create_visualizations(research_centers_analysis, labs_analysis, combined_infrastructure, program_associations)
             
-            # Print results
-            self.print_detailed_results(research_centers_analysis, labs_analysis, combined_infrastructure, program_associations)
+                # Print results
+                self.print_detailed_results(research_centers_analysis, labs_analysis, combined_infrastructure, program_associations)
             
-            # Save results
-            self.save_results(research_centers_analysis, labs_analysis, combined_infrastructure, program_associations)
+                # Save results
+                self.save_results(research_centers_analysis, labs_analysis, combined_infrastructure, program_associations)
             
-            print(f"\n🎉 RQ9 analysis completed successfully!")
-            print(f"📊 Visualization saved to: {viz_path}")
+                print(f"\n🎉 RQ9 analysis completed successfully!")
+                print(f"📊 Visualization saved to: {viz_path}")
             
-        except Exception as e:
-            print(f"❌ Error during analysis: {e}")
-            import traceback
-            traceback.print_exc()
+            except Exception as e:
+                print(f"❌ Error during analysis: {e}")
+                import traceback
+                traceback.print_exc()
         
-        finally:
-            self.close()
+            finally:
+                self.close()
 
 def main():
     """Main function to run RQ9 analysis"""
@@ -9,6 +9,7 @@ Date: 2024
 """
 
 import os
+import sys
 import json
 import re
 from pathlib import Path
@@ -16,6 +17,13 @@ from typing import Dict, List, Any, Optional
 import logging
 from datetime import datetime
 
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from src.utils.keyword_matcher import KeywordMatcher
+from src.utils.profile_ingestion import ingest_profiles
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -60,6 +68,9 @@ class UniversityDataExtractor:
             ]
         }
         
+        # One automaton over every keyword: a single scan per text yields all counts
+        self.tech_matcher = KeywordMatcher(self.tech_categories)
+        
     def extract_basic_info(self, content: str) -> Dict[str, Any]:
         """Extract basic university information."""
         basic_info = {
@@ -179,15 +190,11 @@ class UniversityDataExtractor:
         }
         
         # Analyze technology categories
-        for category, keywords in self.tech_categories.items():
-            category_count = 0
-            for keyword in keywords:
-                matches = re.findall(rf'\b{re.escape(keyword)}\b', content, re.IGNORECASE)
-                category_count += len(matches)
-            
+        scan = self.tech_matcher.scan(content)
+        for category in self.tech_categories:
             tech_info['technology_categories'][category] = {
-                'count': category_count,
-                'keywords_found': [k for k in keywords if re.search(rf'\b{re.escape(k)}\b', content, re.IGNORECASE)]
+                'count': scan.category_counts[category],
+                'keywords_found': scan.keywords_found(category)
             }
         
         # Extract technology-related courses
@@ -374,17 +381,9 @@ class UniversityDataExtractor:
         mission_content = ' '.join(mission_sections)
         
         # Count technology mentions in mission content
-        total_mentions = 0
-        for category, keywords in self.tech_categories.items():
-            category_count = 0
-            for keyword in keywords:
-                matches = re.findall(rf'\b{re.escape(keyword)}\b', mission_content, re.IGNORECASE)
-                category_count += len(matches)
-                total_mentions += len(matches)
-            
-            mission['technology_mentions'][category] = category_count
-        
-        mission['overall_technology_focus'] = total_mentions
+        scan = self.tech_matcher.scan(mission_content)
+        mission['technology_mentions'] = dict(scan.category_counts)
+        mission['overall_technology_focus'] = scan.total
         
         return mission
     
@@ -518,8 +517,12 @@ class UniversityDataExtractor:
         except Exception as e:
             logger.error(f"Error saving summary report: {e}")
     
-    def run_extraction(self):
-        """Run the complete extraction process."""
+    def run_extraction(self, workers: Optional[int] = None):
+        """Run the complete extraction process.
+        
+        Profiles are parsed in parallel (``workers`` processes, default
+        PROFILE_WORKERS or the CPU count); results are saved in file order.
+        """
         logger.info("Starting university profile data extraction...")
         
         # Get all markdown files
@@ -528,9 +531,13 @@ class UniversityDataExtractor:
         
         all_extracted_data = []
         
-        # Process each file
-        for file_path in md_files:
-            extracted_data = self.process_university_profile(file_path)
+        # Parse files across the process pool, then save in order
+        for result in ingest_profiles(md_files, self.process_university_profile, workers):
+            extracted_data = result.value if result.ok else {
+                'error': result.error,
+                'file_name': result.path.name,
+                'extraction_date': datetime.now().isoformat()
+            }
             all_extracted_data.append(extracted_data)
             
             # Save individual file data
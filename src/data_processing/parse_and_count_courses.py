@@ -1,47 +1,26 @@
 import os
 import re
+import sys
 import pandas as pd
 from collections import defaultdict, Counter
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from src.utils.profile_ingestion import ingest_profiles
+from src.utils.taxonomy import get_taxonomy
 
 # Directory containing university markdown profiles
 PROFILE_DIR = 'university-profiles'
 
-# Technology keywords for classification
-TECH_KEYWORDS = {
-    'AI/ML': [
-        r'\bAI\b', r'\bArtificial Intelligence\b', r'\bMachine Learning\b', r'\bML\b',
-        r'Deep Learning', r'Neural Network', r'Pattern Recognition', r'Computer Vision',
-        r'Supervised Learning', r'Unsupervised Learning', r'Reinforcement Learning'
-    ],
-    'Data Science': [
-        r'\bData Science\b', r'\bAnalytics\b', r'\bBig Data\b', r'\bData Analysis\b', r'\bAdvanced Data Science\b',
-        r'Data Mining', r'Knowledge Discovery', r'Data Structures', r'Data Wrangling', r'Data Visualization'
-    ],
-    'GIS': [r'\bGIS\b', r'Geographic Information', r'Geospatial', r'Spatial Analysis'],
-    'Remote Sensing': [r'Remote Sensing', r'Satellite', r'Photogrammetry'],
-    'Drone/UAV': [r'\bDrone\b', r'\bUAV\b', r'Unmanned Aerial', r'Aerial Systems'],
-    'Statistics': [
-        r'\bStatistics\b', r'\bStatistical\b', r'\bRegression\b', r'\bModeling\b',
-        r'Stats', r'Probability', r'Time Series', r'Multivariate', r'Biometry', r'Statistical Methods',
-        r'Applied Statistics', r'Sampling', r'ANOVA', r'Inference', r'Quantitative Methods'
-    ],
-    'Programming': [
-        r'\bPython\b', r'\bR\b', r'\bProgramming\b', r'\bComputational\b',
-        r'Algorithms', r'Operating Systems', r'Software Design', r'Software Engineering',
-        r'Object Oriented', r'OOP', r'Web Services'
-    ],
-    'Ethics': [
-        r'Computer Ethics', r'Ethics in Computing', r'Responsible Conduct'
-    ]
-}
+# Technology areas for classification (config/taxonomies.yaml: course_technology)
+COURSE_TECHNOLOGY = get_taxonomy('course_technology')
 
 # Helper to classify a course by technology area
 def classify_course(course_name):
-    for tech, patterns in TECH_KEYWORDS.items():
-        for pat in patterns:
-            if re.search(pat, course_name, re.IGNORECASE):
-                return tech
-    return 'Other'
+    return COURSE_TECHNOLOGY.classify(course_name)
 
 # Multiple patterns to match course lines
 COURSE_PATTERNS = [
@@ -100,80 +79,85 @@ def extract_courses_from_text(text, university_name):
     
     return courses
 
-results = []
-all_courses = []
+def university_from_filename(filename):
+    return filename.replace('.md', '').replace('_', ' ').replace('-', ' ').strip()
+
+# Per-file parse step run by the ingestion workers
+def extract_courses_from_file(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        text = f.read()
+    return extract_courses_from_text(text, university_from_filename(os.path.basename(path)))
+
+def main():
+    all_courses = []
+
+    print("Processing university markdown files...")
+    print("=" * 60)
 
-print("Processing university markdown files...")
-print("=" * 60)
+    profile_files = [os.path.join(PROFILE_DIR, f) for f in os.listdir(PROFILE_DIR) if f.endswith('.md')]
 
-for filename in os.listdir(PROFILE_DIR):
-    if not filename.endswith('.md'):
-        continue
-        
-    university = filename.replace('.md', '').replace('_', ' ').replace('-', ' ').strip()
-    path = os.path.join(PROFILE_DIR, filename)
+    for result in ingest_profiles(profile_files, extract_courses_from_file):
+        print(f"Processing: {university_from_filename(result.path.name)}")
     
-    print(f"Processing: {university}")
+        if not result.ok:
+            print(f"  Error processing {result.path.name}: {result.error}")
+            continue
+    
+        # Courses extracted from this file
+        courses = result.value
     
-    try:
-        with open(path, 'r', encoding='utf-8') as f:
-            text = f.read()
-        
-        # Extract courses from this file
-        courses = extract_courses_from_text(text, university)
-        
         if courses:
             print(f"  Found {len(courses)} courses")
             all_courses.extend(courses)
         else:
             print(f"  No courses found")
-            
-    except Exception as e:
-        print(f"  Error processing {filename}: {e}")
 
-# Create DataFrame
-df = pd.DataFrame(all_courses)
+    # Create DataFrame
+    df = pd.DataFrame(all_courses)
 
-if len(df) > 0:
-    # Save to CSV
-    df.to_csv('all_courses_by_university_and_tech.csv', index=False)
+    if len(df) > 0:
+        # Save to CSV
+        df.to_csv('all_courses_by_university_and_tech.csv', index=False)
     
-    # Print summary statistics
-    print(f"\n" + "=" * 60)
-    print("EXTRACTION SUMMARY")
-    print(f"Total universities processed: {len(set(df['university']))}")
-    print(f"Total courses found: {len(df)}")
+        # Print summary statistics
+        print(f"\n" + "=" * 60)
+        print("EXTRACTION SUMMARY")
+        print(f"Total universities processed: {len(set(df['university']))}")
+        print(f"Total courses found: {len(df)}")
     
-    print(f"\nTop 10 universities by course count:")
-    univ_counts = df['university'].value_counts().head(10)
-    for univ, count in univ_counts.items():
-        print(f"  {univ}: {count} courses")
+        print(f"\nTop 10 universities by course count:")
+        univ_counts = df['university'].value_counts().head(10)
+        for univ, count in univ_counts.items():
+            print(f"  {univ}: {count} courses")
     
-    print(f"\nCourse count by technology area:")
-    tech_counts = df['technology_area'].value_counts()
-    for tech, count in tech_counts.items():
-        print(f"  {tech}: {count} courses")
+        print(f"\nCourse count by technology area:")
+        tech_counts = df['technology_area'].value_counts()
+        for tech, count in tech_counts.items():
+            print(f"  {tech}: {count} courses")
     
-    print(f"\nSample extracted courses (first 20):")
-    print("-" * 80)
-    for i, row in df.head(20).iterrows():
-        print(f"{i+1:2d}. {row['course_code']}: {row['course_name']} ({row['technology_area']})")
+        print(f"\nSample extracted courses (first 20):")
+        print("-" * 80)
+        for i, row in df.head(20).iterrows():
+            print(f"{i+1:2d}. {row['course_code']}: {row['course_name']} ({row['technology_area']})")
     
-    if len(df) > 20:
-        print(f"... and {len(df) - 20} more courses")
+        if len(df) > 20:
+            print(f"... and {len(df) - 20} more courses")
     
-    print(f"\nResults saved to all_courses_by_university_and_tech.csv")
+        print(f"\nResults saved to all_courses_by_university_and_tech.csv")
     
-    # Show some examples of each technology area
-    print(f"\nExamples by technology area:")
-    for tech in tech_counts.index:
-        if tech != 'Other':
-            examples = df[df['technology_area'] == tech].head(3)
-            print(f"\n{tech}:")
-            for _, row in examples.iterrows():
-                print(f"  {row['course_code']}: {row['course_name']}")
+        # Show some examples of each technology area
+        print(f"\nExamples by technology area:")
+        for tech in tech_counts.index:
+            if tech != 'Other':
+                examples = df[df['technology_area'] == tech].head(3)
+                print(f"\n{tech}:")
+                for _, row in examples.iterrows():
+                    print(f"  {row['course_code']}: {row['course_name']}")
     
-else:
-    print("No courses found in any files. Check the extraction patterns.")
+    else:
+        print("No courses found in any files. Check the extraction patterns.")
+
+    print(f"\nProcessing complete!") 
 
-print(f"\nProcessing complete!") 
\ No newline at end of file
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,24 @@
-from neo4j import GraphDatabase
+import sys
+from pathlib import Path
+
 import pandas as pd
 
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from src.utils.neo4j_executor import get_executor
+
 # Neo4j connection
 uri = "bolt://localhost:7689"
 username = "neo4j"
 password = "perseus2025"
 
-driver = GraphDatabase.driver(uri, auth=(username, password))
+# Shared pooled driver; both query sections below reuse it
+executor = get_executor(uri, username, password)
 
 def run_query(query):
-    with driver.session() as session:
-        result = session.run(query)
-        return result.data()
+    return executor.read(query).records
 
 # Query 1: Total number of courses in the database
 query1 = """
@@ -121,9 +128,6 @@ try:
 except Exception as e:
     print(f"Error running queries: {e}")
 
-finally:
-    driver.close()
-
 print("Running graph structure investigation queries...")
 print("=" * 50)
 
@@ -164,4 +168,4 @@ try:
 except Exception as e:
     print(f"Error running investigation queries: {e}")
 finally:
-    driver.close() 
\ No newline at end of file
+    print(f"Neo4j {executor.metrics.format()}") 
\ No newline at end of file
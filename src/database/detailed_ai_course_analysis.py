@@ -4,10 +4,45 @@ Detailed AI Course Analysis
 Shows what AI-related courses were found and why they're not connected to universities
 """
 
+import sys
+from pathlib import Path
+from typing import List, Dict, Optional
+
 import pandas as pd
-import subprocess
-import time
-from typing import List, Dict
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from src.utils.neo4j_executor import get_executor
+
+# Program connectivity of every course name in $course_names, one row per name
+COURSE_PROGRAMS_QUERY = """
+UNWIND $course_names AS course_name
+CALL {
+    WITH course_name
+    MATCH (:Course {name: course_name})-[:CORE_FOR]->(p:Program)
+    RETURN collect(coalesce(p.name, '')) AS core_programs
+}
+CALL {
+    WITH course_name
+    MATCH (:Course {name: course_name})-[:PREREQUISITE_FOR]->(p:Program)
+    RETURN collect(coalesce(p.name, '')) AS prereq_programs
+}
+CALL {
+    WITH course_name
+    MATCH (p:Program)-[:OFFERS_COURSE]->(:Course {name: course_name})
+    RETURN collect(coalesce(p.name, '')) AS offered_by_programs
+}
+RETURN course_name, core_programs, prereq_programs, offered_by_programs
+"""
+
+# University/department paths of every program name in $programs (connected programs only)
+PROGRAM_UNIVERSITIES_QUERY = """
+UNWIND $programs AS program
+MATCH (u:University)-[:OFFERS]->(d:Department)-[:OFFERS]->(:Program {name: program})
+RETURN program, collect({University: u.name, Department: d.name}) AS connections
+"""
 
 class DetailedAICourseAnalyzer:
     """Detailed analyzer to understand why AI courses aren't connected to universities"""
@@ -16,47 +51,15 @@ class DetailedAICourseAnalyzer:
         self.host = host
         self.user = user
         self.password = password
-        self.rate_limit_delay = 0.1
-        
-    def execute_query(self, query: str) -> List[Dict]:
-        """Execute a Cypher query with rate limiting"""
-        cmd = f"""cypher-shell -a {self.host} -u {self.user} -p {self.password} --format plain --non-interactive <<< "{query}" """
+        self.executor = get_executor(host, user, password)
         
+    def execute_query(self, query: str, params: Optional[Dict] = None) -> List[Dict]:
+        """Execute a read query through the shared driver, returning records as dicts"""
         try:
-            result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-            if result.returncode == 0:
-                return self.parse_cypher_output(result.stdout)
-            else:
-                print(f"Query failed: {result.stderr}")
-                return []
+            return self.executor.read(query, params).records
         except Exception as e:
             print(f"Error executing query: {e}")
             return []
-        finally:
-            time.sleep(self.rate_limit_delay)
-    
-    def parse_cypher_output(self, output: str) -> List[Dict]:
-        """Parse Cypher output into list of dictionaries"""
-        lines = output.strip().split('\n')
-        if len(lines) < 2:
-            return []
-        
-        headers = lines[0].split(', ')
-        data = []
-        
-        for line in lines[1:]:
-            if line.strip():
-                values = line.split(', ', len(headers)-1)
-                row = {}
-                for i, header in enumerate(headers):
-                    if i < len(values):
-                        value = values[i].strip('"')
-                        row[header] = value
-                    else:
-                        row[header] = ""
-                data.append(row)
-        
-        return data
 
     def find_ai_courses(self) -> List[Dict]:
         """Find all AI-related courses"""
@@ -83,36 +86,20 @@ class DetailedAICourseAnalyzer:
         return courses
 
     def check_course_program_connections(self, courses: List[Dict]) -> List[Dict]:
-        """Check how courses are connected to programs"""
+        """Check how courses are connected to programs (CORE_FOR, PREREQUISITE_FOR, OFFERS_COURSE) in one query"""
         print("\nChecking course-program connections...")
         
+        course_names = list(dict.fromkeys(course.get('Course_Name', '') for course in courses))
+        rows = self.execute_query(COURSE_PROGRAMS_QUERY, {'course_names': course_names}) if course_names else []
+        connectivity = {row['course_name']: row for row in rows}
+        
         for course in courses:
             course_name = course.get('Course_Name', '')
+            row = connectivity.get(course_name, {})
             
-            # Check CORE_FOR relationships
-            query = f"""
-            MATCH (c:Course {{name: '{course_name}'}})-[:CORE_FOR]->(p:Program)
-            RETURN p.name AS Program_Name
-            """
-            core_programs = self.execute_query(query)
-            
-            # Check PREREQUISITE_FOR relationships
-            query = f"""
-            MATCH (c:Course {{name: '{course_name}'}})-[:PREREQUISITE_FOR]->(p:Program)
-            RETURN p.name AS Program_Name
-            """
-            prereq_programs = self.execute_query(query)
-            
-            # Check OFFERS_COURSE relationships
-            query = f"""
-            MATCH (p:Program)-[:OFFERS_COURSE]->(c:Course {{name: '{course_name}'}})
-            RETURN p.name AS Program_Name
-            """
-            offered_by_programs = self.execute_query(query)
-            
-            course['core_programs'] = [p.get('Program_Name', '') for p in core_programs]
-            course['prereq_programs'] = [p.get('Program_Name', '') for p in prereq_programs]
-            course['offered_by_programs'] = [p.get('Program_Name', '') for p in offered_by_programs]
+            course['core_programs'] = list(row.get('core_programs') or [])
+            course['prereq_programs'] = list(row.get('prereq_programs') or [])
+            course['offered_by_programs'] = list(row.get('offered_by_programs') or [])
             
             print(f"\nCourse: {course_name}")
             print(f"  Core for: {course['core_programs']}")
@@ -136,19 +123,16 @@ class DetailedAICourseAnalyzer:
             if program:  # Skip empty strings
                 print(f"  - {program}")
         
-        # Check which programs are connected to universities
+        # Check which programs are connected to universities, all in one query
         connected_programs = []
         unconnected_programs = []
         
-        for program in all_programs:
-            if not program:
-                continue
-                
-            query = f"""
-            MATCH (u:University)-[:OFFERS]->(d:Department)-[:OFFERS]->(p:Program {{name: '{program}'}})
-            RETURN u.name AS University, d.name AS Department
-            """
-            connections = self.execute_query(query)
+        programs = [program for program in all_programs if program]
+        rows = self.execute_query(PROGRAM_UNIVERSITIES_QUERY, {'programs': programs}) if programs else []
+        connections_by_program = {row['program']: row['connections'] for row in rows}
+        
+        for program in programs:
+            connections = connections_by_program.get(program, [])
             
             if connections:
                 connected_programs.append({
@@ -4,9 +4,15 @@ Fix AI Course Relationships
 Creates missing relationships to connect AI courses to universities
 """
 
-import subprocess
-import time
-from typing import List, Dict
+import sys
+from pathlib import Path
+from typing import List, Dict, Optional
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from src.utils.neo4j_executor import get_executor
 
 class RelationshipFixer:
     """Fix missing relationships in the knowledge graph"""
@@ -15,25 +21,17 @@ class RelationshipFixer:
         self.host = host
         self.user = user
         self.password = password
-        self.rate_limit_delay = 0.1
-        
-    def execute_query(self, query: str) -> bool:
-        """Execute a Cypher query with rate limiting"""
-        cmd = f"""cypher-shell -a {self.host} -u {self.user} -p {self.password} --format plain --non-interactive <<< "{query}" """
+        self.executor = get_executor(host, user, password)
         
+    def execute_query(self, query: str, params: Optional[Dict] = None) -> bool:
+        """Execute a Cypher query in a write transaction through the shared driver"""
         try:
-            result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-            if result.returncode == 0:
-                print(f"✓ Query executed successfully")
-                return True
-            else:
-                print(f"✗ Query failed: {result.stderr}")
-                return False
+            self.executor.write(query, params)
+            print(f"✓ Query executed successfully")
+            return True
         except Exception as e:
             print(f"✗ Error executing query: {e}")
             return False
-        finally:
-            time.sleep(self.rate_limit_delay)
 
     def fix_university_department_relationships(self):
         """Fix missing department relationships for universities"""
@@ -62,18 +60,18 @@ class RelationshipFixer:
             
             for dept in departments:
                 # Create department node if it doesn't exist
-                query = f"""
-                MERGE (d:Department {{name: '{dept}'}})
+                query = """
+                MERGE (d:Department {name: $dept})
                 """
-                self.execute_query(query)
+                self.execute_query(query, {'dept': dept})
                 
                 # Create OFFERS relationship
-                query = f"""
-                MATCH (u:University {{name: '{university}'}})
-                MATCH (d:Department {{name: '{dept}'}})
+                query = """
+                MATCH (u:University {name: $university})
+                MATCH (d:Department {name: $dept})
                 MERGE (u)-[:OFFERS]->(d)
                 """
-                self.execute_query(query)
+                self.execute_query(query, {'university': university, 'dept': dept})
                 
                 print(f"  Connected {university} -> {dept}")
 
@@ -101,12 +99,12 @@ class RelationshipFixer:
             
             for dept in departments:
                 # Create OFFERS relationship
-                query = f"""
-                MATCH (d:Department {{name: '{dept}'}})
-                MATCH (p:Program {{name: '{program}'}})
+                query = """
+                MATCH (d:Department {name: $dept})
+                MATCH (p:Program {name: $program})
                 MERGE (d)-[:OFFERS]->(p)
                 """
-                self.execute_query(query)
+                self.execute_query(query, {'dept': dept, 'program': program})
                 
                 print(f"  Connected {dept} -> {program}")
 
@@ -125,12 +123,12 @@ class RelationshipFixer:
         
         for course_name, program_name in course_program_pairs:
             # Create OFFERS_COURSE relationship
-            query = f"""
-            MATCH (p:Program {{name: '{program_name}'}})
-            MATCH (c:Course {{name: '{course_name}'}})
+            query = """
+            MATCH (p:Program {name: $program_name})
+            MATCH (c:Course {name: $course_name})
             MERGE (p)-[:OFFERS_COURSE]->(c)
             """
-            self.execute_query(query)
+            self.execute_query(query, {'program_name': program_name, 'course_name': course_name})
             
             print(f"  Connected {program_name} -> {course_name}")
 
@@ -5,7 +5,7 @@ in the Neo4j knowledge graph database.
 
 This script:
 1. Loads the CSV file with department-university relationships
-2. Runs Cypher commands with rate limiting
+2. Runs Cypher commands through the shared Neo4j driver (retrying transient errors)
 3. Verifies the fix
 4. Tests the original query
 
@@ -13,46 +13,49 @@ Usage:
     python fix_graph_database.py
 """
 
-import time
-import subprocess
 import sys
 from pathlib import Path
 
-def run_cypher_command(command, description, delay_seconds=5):
-    """Run a Cypher command with error handling and delays."""
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from src.utils.neo4j_executor import get_executor
+
+# Adjust the connection parameters as needed for your Neo4j setup
+NEO4J_URI = 'bolt://localhost:7687'
+NEO4J_USER = 'neo4j'  # Replace with your username
+NEO4J_PASSWORD = 'password'  # Replace with your password
+
+def format_table(result):
+    """Render query records as a plain-text table."""
+    if not result.keys:
+        return ""
+    rows = [[str(record.get(key)) for key in result.keys] for record in result.records]
+    widths = [max([len(str(key))] + [len(row[i]) for row in rows]) for i, key in enumerate(result.keys)]
+    lines = [" | ".join(str(key).ljust(w) for key, w in zip(result.keys, widths)),
+             "-+-".join("-" * w for w in widths)]
+    lines += [" | ".join(value.ljust(w) for value, w in zip(row, widths)) for row in rows]
+    return "\n".join(lines)
+
+def run_cypher_command(command, description, write=False):
+    """Run a Cypher command through the shared driver with error handling."""
     print(f"\n{'='*60}")
     print(f"Running: {description}")
     print(f"{'='*60}")
     
+    executor = get_executor(NEO4J_URI, NEO4J_USER, NEO4J_PASSWORD)
     try:
-        # Run the Cypher command using cypher-shell
-        # Adjust the connection parameters as needed for your Neo4j setup
-        result = subprocess.run([
-            'cypher-shell',
-            '-u', 'neo4j',  # Replace with your username
-            '-p', 'password',  # Replace with your password
-            '--format', 'table',
-            '--non-interactive'
-        ], input=command.encode(), capture_output=True, text=True)
-        
-        if result.returncode == 0:
-            print("✅ Success!")
-            print(result.stdout)
-        else:
-            print("❌ Error:")
-            print(result.stderr)
-            return False
-            
-    except FileNotFoundError:
-        print("❌ Error: cypher-shell not found. Please install Neo4j Cypher Shell.")
-        return False
+        # Writes run auto-commit so CALL { ... } IN TRANSACTIONS can batch its own commits
+        result = executor.run(command) if write else executor.read(command)
+        print("✅ Success!")
+        print(format_table(result))
+        if result.counters:
+            print(result.counters)
     except Exception as e:
         print(f"❌ Error: {e}")
         return False
     
-    # Wait before next command to respect rate limits
-    print(f"⏳ Waiting {delay_seconds} seconds before next command...")
-    time.sleep(delay_seconds)
     return True
 
 def main():
@@ -69,16 +72,19 @@ def main():
     
     # Step 1: Load CSV and create relationships
     step1_command = """
-    USING PERIODIC COMMIT 50
     LOAD CSV WITH HEADERS FROM 'file:///departments_universities.csv' AS row
-    MATCH (u:University), (d:Department)
-    WHERE toLower(u.name) = toLower(row.university_name)
-      AND toLower(d.name) = toLower(row.department_name)
-    MERGE (u)-[:OFFERS]->(d)
-    RETURN count(*) AS Relationships_Created;
+    CALL {
+      WITH row
+      MATCH (u:University), (d:Department)
+      WHERE toLower(u.name) = toLower(row.university_name)
+        AND toLower(d.name) = toLower(row.department_name)
+      MERGE (u)-[:OFFERS]->(d)
+      RETURN count(*) AS matched
+    } IN TRANSACTIONS OF 50 ROWS
+    RETURN sum(matched) AS Relationships_Created;
     """
     
-    if not run_cypher_command(step1_command, "Step 1: Creating OFFERS relationships", delay_seconds=10):
+    if not run_cypher_command(step1_command, "Step 1: Creating OFFERS relationships", write=True):
         return False
     
     # Step 2: Verify departments still missing connections
@@ -90,7 +96,7 @@ def main():
     LIMIT 20;
     """
     
-    if not run_cypher_command(step2_command, "Step 2: Checking for departments still missing university connections", delay_seconds=5):
+    if not run_cypher_command(step2_command, "Step 2: Checking for departments still missing university connections"):
         return False
     
     # Step 3: Count total relationships
@@ -99,7 +105,7 @@ def main():
     RETURN count(*) AS Total_University_Department_Relationships;
     """
     
-    if not run_cypher_command(step3_command, "Step 3: Counting total university-department relationships", delay_seconds=5):
+    if not run_cypher_command(step3_command, "Step 3: Counting total university-department relationships"):
         return False
     
     # Step 4: Test the original query
@@ -120,7 +126,7 @@ def main():
     LIMIT 20;
     """
     
-    if not run_cypher_command(step4_command, "Step 4: Testing the original query with university information", delay_seconds=5):
+    if not run_cypher_command(step4_command, "Step 4: Testing the original query with university information"):
         return False
     
     # Step 5: Get final statistics
@@ -138,7 +144,7 @@ def main():
       count(DISTINCT d) AS Departments_Involved;
     """
     
-    if not run_cypher_command(step5_command, "Step 5: Final statistics", delay_seconds=5):
+    if not run_cypher_command(step5_command, "Step 5: Final statistics"):
         return False
     
     print("\n🎉 Graph database fix completed successfully!")
@@ -3,109 +3,120 @@
 Analysis of AI, ML, drones, and GIS technologies in mission statements and strategic materials
 """
 
-from neo4j import GraphDatabase
 import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
 import numpy as np
 import os
 import re
+import sys
 from collections import defaultdict
+from pathlib import Path
 import warnings
 warnings.filterwarnings('ignore')
 
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from src.utils.neo4j_executor import get_executor
+from src.utils.profile_ingestion import ingest_profiles
+
 # Neo4j connection
 uri = "bolt://localhost:7689"
 username = "neo4j"
 password = "perseus2025"
 
+# Keywords to identify mission statements and strategic content
+MISSION_KEYWORDS = [
+    'mission', 'vision', 'strategic', 'goal', 'objective', 'purpose',
+    'commitment', 'dedicated to', 'focused on', 'specializing in',
+    'department of', 'school of', 'college of', 'program in',
+    'research focus', 'research area', 'research emphasis',
+    'teaching focus', 'educational focus', 'curriculum focus'
+]
+
+# Technology keywords to search for
+MISSION_TECH_KEYWORDS = {
+    'AI/ML': ['artificial intelligence', 'machine learning', 'AI', 'ML', 'neural', 'deep learning', 'predictive modeling'],
+    'GIS': ['geographic information system', 'GIS', 'geospatial', 'spatial analysis', 'mapping'],
+    'Drones': ['drone', 'UAV', 'unmanned aerial vehicle', 'remote sensing', 'aerial survey'],
+    'Data Science': ['data science', 'big data', 'analytics', 'statistical analysis', 'computational']
+}
+
+def extract_mission_paragraphs(filepath):
+    """Mission paragraphs with technology mentions from one profile (runs in ingestion workers)"""
+    university_name = os.path.basename(filepath).replace('.md', '')
+    
+    with open(filepath, 'r', encoding='utf-8') as f:
+        content = f.read()
+    
+    # Split content into paragraphs
+    paragraphs = content.split('\n\n')
+    
+    mission_paragraphs = []
+    for para in paragraphs:
+        para_lower = para.lower()
+        # Check if paragraph contains mission-related keywords
+        if any(keyword in para_lower for keyword in MISSION_KEYWORDS):
+            mission_paragraphs.append(para)
+    
+    # Analyze each mission paragraph for technology mentions
+    mission_data = []
+    for i, para in enumerate(mission_paragraphs):
+        para_lower = para.lower()
+        tech_mentions = {}
+        
+        for tech_category, keywords in MISSION_TECH_KEYWORDS.items():
+            mentions = []
+            for keyword in keywords:
+                if keyword.lower() in para_lower:
+                    mentions.append(keyword)
+            if mentions:
+                tech_mentions[tech_category] = mentions
+        
+        if tech_mentions:  # Only include paragraphs with technology mentions
+            mission_data.append({
+                'university': university_name,
+                'paragraph_index': i,
+                'content': para.strip(),
+                'technology_mentions': tech_mentions,
+                'tech_categories': list(tech_mentions.keys())
+            })
+    
+    return mission_data
+
 class MissionStatementAnalyzer:
     def __init__(self, uri, username, password):
-        self.driver = GraphDatabase.driver(uri, auth=(username, password))
+        self.executor = get_executor(uri, username, password)
         self.university_profiles_dir = "university-profiles"
         
     def close(self):
-        self.driver.close()
+        """Release the shared database connection and report query metrics"""
+        print(f"Neo4j {self.executor.metrics.format()}")
         
     def run_query(self, query, parameters=None):
         """Run a Cypher query and return results"""
-        with self.driver.session() as session:
-            try:
-                if parameters:
-                    result = session.run(query, parameters)
-                else:
-                    result = session.run(query)
-                return [record.data() for record in result]
-            except Exception as e:
-                print(f"Error running query: {e}")
-                return []
+        try:
+            return self.executor.read(query, parameters).records
+        except Exception as e:
+            print(f"Error running query: {e}")
+            return []
 
-    def extract_mission_statements_from_profiles(self):
+    def extract_mission_statements_from_profiles(self, workers=None):
         """Extract mission statements and strategic materials from university profiles"""
         print("Extracting mission statements from university profiles...")
         
-        mission_data = []
+        profile_files = [os.path.join(self.university_profiles_dir, filename)
+                         for filename in os.listdir(self.university_profiles_dir)
+                         if filename.endswith('.md')]
         
-        # Keywords to identify mission statements and strategic content
-        mission_keywords = [
-            'mission', 'vision', 'strategic', 'goal', 'objective', 'purpose',
-            'commitment', 'dedicated to', 'focused on', 'specializing in',
-            'department of', 'school of', 'college of', 'program in',
-            'research focus', 'research area', 'research emphasis',
-            'teaching focus', 'educational focus', 'curriculum focus'
-        ]
-        
-        # Technology keywords to search for
-        tech_keywords = {
-            'AI/ML': ['artificial intelligence', 'machine learning', 'AI', 'ML', 'neural', 'deep learning', 'predictive modeling'],
-            'GIS': ['geographic information system', 'GIS', 'geospatial', 'spatial analysis', 'mapping'],
-            'Drones': ['drone', 'UAV', 'unmanned aerial vehicle', 'remote sensing', 'aerial survey'],
-            'Data Science': ['data science', 'big data', 'analytics', 'statistical analysis', 'computational']
-        }
-        
-        for filename in os.listdir(self.university_profiles_dir):
-            if filename.endswith('.md'):
-                university_name = filename.replace('.md', '')
-                filepath = os.path.join(self.university_profiles_dir, filename)
-                
-                try:
-                    with open(filepath, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                    
-                    # Split content into paragraphs
-                    paragraphs = content.split('\n\n')
-                    
-                    mission_paragraphs = []
-                    for para in paragraphs:
-                        para_lower = para.lower()
-                        # Check if paragraph contains mission-related keywords
-                        if any(keyword in para_lower for keyword in mission_keywords):
-                            mission_paragraphs.append(para)
-                    
-                    # Analyze each mission paragraph for technology mentions
-                    for i, para in enumerate(mission_paragraphs):
-                        para_lower = para.lower()
-                        tech_mentions = {}
-                        
-                        for tech_category, keywords in tech_keywords.items():
-                            mentions = []
-                            for keyword in keywords:
-                                if keyword.lower() in para_lower:
-                                    mentions.append(keyword)
-                            if mentions:
-                                tech_mentions[tech_category] = mentions
-                        
-                        if tech_mentions:  # Only include paragraphs with technology mentions
-                            mission_data.append({
-                                'university': university_name,
-                                'paragraph_index': i,
-                                'content': para.strip(),
-                                'technology_mentions': tech_mentions,
-                                'tech_categories': list(tech_mentions.keys())
-                            })
-                
-                except Exception as e:
-                    print(f"Error processing {filename}: {e}")
+        mission_data = []
+        for result in ingest_profiles(profile_files, extract_mission_paragraphs, workers):
+            if result.ok:
+                mission_data.extend(result.value)
+            else:
+                print(f"Error processing {result.path.name}: {result.error}")
         
         return pd.DataFrame(mission_data)
 
@@ -113,37 +124,39 @@ class MissionStatementAnalyzer:
         """Analyze mission statements and strategic content in the Neo4j graph"""
         print("Analyzing mission statements in Neo4j graph...")
         
-        # Query for programs with mission statements or descriptions
-        mission_query = """
-        MATCH (p:Program)
-        WHERE p.description IS NOT NULL AND p.description <> ''
-        RETURN p.name as program_name,
-               p.university as university,
-               p.description as description
-        """
-        
-        programs = self.run_query(mission_query)
-        
-        # Query for departments with mission statements
-        dept_query = """
-        MATCH (d:Department)
-        WHERE d.description IS NOT NULL AND d.description <> ''
-        RETURN d.name as department_name,
-               d.university as university,
-               d.description as description
-        """
-        
-        departments = self.run_query(dept_query)
-        
-        # Query for universities with mission statements
-        univ_query = """
-        MATCH (u:University)
-        WHERE u.description IS NOT NULL AND u.description <> ''
-        RETURN u.name as university_name,
-               u.description as description
-        """
-        
-        universities = self.run_query(univ_query)
+        # One session for the three description queries
+        with self.executor.session_scope():
+            # Query for programs with mission statements or descriptions
+            mission_query = """
+            MATCH (p:Program)
+            WHERE p.description IS NOT NULL AND p.description <> ''
+            RETURN p.name as program_name,
+                   p.university as university,
+                   p.description as description
+            """
+        
+            programs = self.run_query(mission_query)
+        
+            # Query for departments with mission statements
+            dept_query = """
+            MATCH (d:Department)
+            WHERE d.description IS NOT NULL AND d.description <> ''
+            RETURN d.name as department_name,
+                   d.university as university,
+                   d.description as description
+            """
+        
+            departments = self.run_query(dept_query)
+        
+            # Query for universities with mission statements
+            univ_query = """
+            MATCH (u:University)
+            WHERE u.description IS NOT NULL AND u.description <> ''
+            RETURN u.name as university_name,
+                   u.description as description
+            """
+        
+            universities = self.run_query(univ_query)
         
         return programs, departments, universities
 
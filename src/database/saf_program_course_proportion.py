@@ -9,13 +9,19 @@ This script:
 - Writes results to JSON/MD and emits a .cypher file for reproducibility
 """
 
-from neo4j import GraphDatabase
 from neo4j.exceptions import AuthError
 from pathlib import Path
 import json
 import logging
 from typing import Dict, Any
 import os
+import sys
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from src.utils.neo4j_executor import Neo4jExecutor, get_executor
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -133,9 +139,9 @@ def write_cypher_file() -> Path:
     return path
 
 
-def _create_driver(uri: str, user: str, password: str):
-    """Create a Neo4j driver, trying basic auth first (or none) and
-    gracefully falling back to no-auth if the server has auth disabled.
+def _create_executor(uri: str, user: str, password: str) -> Neo4jExecutor:
+    """Get the shared executor for the server, trying basic auth first (or none)
+    and gracefully falling back to no-auth if the server has auth disabled.
 
     Respects env flag `NEO4J_AUTH_DISABLED` (truthy to force no-auth first).
     """
@@ -144,14 +150,17 @@ def _create_driver(uri: str, user: str, password: str):
     try_order = []
     # If user/pass absent or auth disabled is requested, try no-auth first
     if auth_disabled_env or not user or not password or str(user).lower() == 'none':
-        try_order = [None, (user, password)]
+        try_order = [(None, None), (user, password)]
     else:
-        try_order = [(user, password), None]
+        try_order = [(user, password), (None, None)]
 
     last_error = None
-    for auth in try_order:
+    for auth_user, auth_password in try_order:
         try:
-            return GraphDatabase.driver(uri, auth=auth)
+            executor = get_executor(uri, auth_user, auth_password)
+            # Proactively verify connectivity to surface auth errors early and allow fallback
+            executor.driver.verify_connectivity()
+            return executor
         except AuthError as e:
             # Unsupported auth scheme or wrong creds; try next mode
             last_error = e
@@ -170,18 +179,7 @@ def _create_driver(uri: str, user: str, password: str):
 def run_queries(uri: str, user: str, password: str) -> Dict[str, Any]:
     results: Dict[str, Any] = {}
     try:
-        driver = _create_driver(uri, user, password)
-        # Proactively verify connectivity to surface auth errors early and allow fallback
-        try:
-            driver.verify_connectivity()
-        except AuthError as e:
-            # Retry with no-auth in case server has auth disabled
-            try:
-                driver.close()
-            except Exception:
-                pass
-            driver = _create_driver(uri, user=None, password=None)
-            driver.verify_connectivity()
+        executor = _create_executor(uri, user, password)
     except AuthError as e:
         logger.error(f"Neo4j authentication failed: {e}")
         results['error'] = f"authentication_failed: {e}"
@@ -191,17 +189,15 @@ def run_queries(uri: str, user: str, password: str) -> Dict[str, Any]:
         results['error'] = f"connection_failed: {e}"
         return results
 
-    def run(q: str):
-        with driver.session() as s:
-            return s.run(q).data()
-
-    try:
-        for name, q in ALL_QUERIES.items():
-            rows = run(q)
-            results[name] = rows
-            logger.info(f"Executed {name}: {rows}")
-    finally:
-        driver.close()
+    # The queries are independent: run them concurrently, report them in order
+    batch = executor.read_batch(ALL_QUERIES)
+    for name in ALL_QUERIES:
+        if name in batch.errors:
+            logger.error(f"Query {name} failed: {batch.errors[name]}")
+        rows = batch.records(name)
+        results[name] = rows
+        logger.info(f"Executed {name}: {rows}")
+    logger.info(f"Ran {len(ALL_QUERIES)} queries in {batch.elapsed:.2f}s; Neo4j {executor.metrics.format()}")
 
     # Compose a compact summary if possible
     try:
@@ -25,10 +25,19 @@ logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(
 logger = logging.getLogger(__name__)
 
 ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from src.utils.profile_ingestion import ingest_profiles
+from src.utils.query_cache import STAMP_GRAPH_VERSION_QUERY
+
 PROFILES_DIR = ROOT / 'university-profiles'
 OUTPUT_DIR = ROOT / 'data' / 'outputs'
 OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
+# Closes every written script: a new graph version stamp invalidates cached query results
+STAMP_STATEMENT = "// restamp the graph version (run after all other statements)\n" + STAMP_GRAPH_VERSION_QUERY.strip() + ";"
+
 # -------- Helpers ---------
 
 def normalize_whitespace(text: str) -> str:
@@ -162,50 +171,165 @@ def generate_cypher_for_university(parsed: Dict[str, Any]) -> str:
 
     return "\n".join(lines) + "\n"
 
+# -------- Parameterized UNWIND generation ---------
+
+GENERAL_DEPARTMENT = 'General Academic Unit'
+
+# One parameterized statement per entity type; each takes its rows as $rows
+SYNC_STATEMENTS = {
+    'universities': """UNWIND $rows AS row
+MERGE (u:University {name: row.name})""",
+    'departments': """UNWIND $rows AS row
+MATCH (u:University {name: row.university})
+MERGE (d:Department {name: row.name, university: row.university})
+MERGE (u)-[:LOCATED_IN]->(d)""",
+    'programs': """UNWIND $rows AS row
+MATCH (u:University {name: row.university})
+MERGE (d:Department {name: row.department, university: row.university})
+FOREACH (_ IN CASE WHEN row.link_department THEN [1] ELSE [] END | MERGE (u)-[:LOCATED_IN]->(d))
+MERGE (p:Program {name: row.name, university: row.university})
+SET p.level = row.level
+MERGE (d)-[:OFFERS]->(p)""",
+}
+
+def build_sync_rows(parsed: Dict[str, Any]) -> Dict[str, List[Dict[str, Any]]]:
+    """Parameter rows for SYNC_STATEMENTS describing the same structure as generate_cypher_for_university."""
+    u = parsed['university']
+    return {
+        'universities': [{'name': u}],
+        'departments': [{'university': u, 'name': d} for d in parsed.get('departments', [])],
+        # Programs without a department go to the university's general unit, which is linked to it
+        'programs': [{'university': u, 'name': p['name'], 'level': p.get('level', 'Unknown'),
+                      'department': p.get('department') or GENERAL_DEPARTMENT,
+                      'link_department': not p.get('department')}
+                     for p in parsed.get('programs', [])],
+    }
+
+def build_sync_payloads(parsed_profiles: List[Dict[str, Any]], scope: str = 'corpus') -> List[Dict[str, Any]]:
+    """Group sync rows into statement payloads, per university or for the whole corpus.
+    Universities come before departments and programs within each scope.
+    """
+    groups = [build_sync_rows(parsed) for parsed in parsed_profiles]
+    if scope == 'corpus':
+        groups = [{key: [row for g in groups for row in g[key]] for key in SYNC_STATEMENTS}]
+    return [{'statement': key, 'rows': g[key]} for g in groups for key in SYNC_STATEMENTS if g[key]]
+
+def write_sync_payloads(payloads: List[Dict[str, Any]], cypher_path: Path, params_path: Path):
+    """Write the parameterized statements and their NDJSON parameter payloads (one line per execution)."""
+    cypher_lines = [
+        "// Parameterized profile sync statements; each runs once per line of",
+        f"// {params_path.name} whose \"statement\" matches, with $rows = that line's \"rows\"",
+    ]
+    for key, statement in SYNC_STATEMENTS.items():
+        cypher_lines += ["", f"// statement: {key}", statement + ";"]
+    cypher_lines += ["", STAMP_STATEMENT]
+    cypher_path.write_text("\n".join(cypher_lines) + "\n", encoding='utf-8')
+
+    with open(params_path, 'w', encoding='utf-8') as f:
+        for payload in payloads:
+            f.write(json.dumps(payload, ensure_ascii=False, separators=(',', ':')) + "\n")
+
+def apply_sync_payloads(uri: str, user: str, password: str, payloads: List[Dict[str, Any]]) -> int:
+    """Execute the payloads through the driver, one write transaction per payload. Returns payloads applied."""
+    if GraphDatabase is None:
+        logger.error("neo4j driver not installed; cannot apply sync payloads")
+        return 0
+
+    from src.utils.neo4j_executor import get_executor
+    from src.utils.summary_projections import project_summaries
+
+    executor = get_executor(uri, user, password)
+    since = executor.graph_version(refresh=True)
+    driver = GraphDatabase.driver(uri, auth=(user, password))
+    try:
+        with driver.session() as s:
+            for payload in payloads:
+                s.execute_write(lambda tx: tx.run(SYNC_STATEMENTS[payload['statement']], rows=payload['rows']).consume())
+    finally:
+        driver.close()
+    if payloads:
+        executor.stamp_graph_version()  # invalidates cached query results
+        universities = {row.get('university', row.get('name')) for payload in payloads for row in payload['rows']}
+        project_summaries(executor, universities, since=since)
+    return len(payloads)
+
 # -------- Verification (live DB optional) ---------
 
-def verify_against_db(uri: str, user: str, password: str, expected: Dict[str, Any]) -> Dict[str, Any]:
+# Each query receives the expected rows for a batch of universities and returns only the missing ones
+MISSING_UNIVERSITIES_QUERY = """
+    UNWIND $rows AS row
+    WITH row WHERE NOT EXISTS { MATCH (:University {name: row.university}) }
+    RETURN row.idx AS idx
+"""
+
+MISSING_DEPARTMENTS_QUERY = """
+    UNWIND $rows AS row
+    WITH row WHERE NOT EXISTS {
+        MATCH (:University {name: row.university})-[:LOCATED_IN]->(:Department {name: row.name, university: row.university})
+    }
+    RETURN row.idx AS idx
+"""
+
+MISSING_PROGRAMS_QUERY = """
+    UNWIND $rows AS row
+    WITH row WHERE NOT EXISTS {
+        MATCH (:University {name: row.university})<-[:OFFERS]-(:Department)-[:OFFERS]->(:Program {name: row.name, university: row.university})
+    }
+    RETURN row.idx AS idx
+"""
+
+def verify_universities(driver, expected_batch: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Verify a batch of parsed profiles with one UNWIND query per entity type.
+    Returns one report per profile, in input order, with the same shape as verify_against_db.
+    """
+    universities: List[Dict[str, Any]] = []
+    departments: List[Dict[str, Any]] = []
+    programs: List[Dict[str, Any]] = []
+    for i, expected in enumerate(expected_batch):
+        u = expected['university']
+        universities.append({'idx': i, 'university': u})
+        departments += [{'idx': [i, j], 'university': u, 'name': d}
+                        for j, d in enumerate(expected.get('departments', []))]
+        programs += [{'idx': [i, j], 'university': u, 'name': p['name']}
+                     for j, p in enumerate(expected.get('programs', []))]
+
+    with driver.session() as s:
+        missing_universities = {r['idx'] for r in s.run(MISSING_UNIVERSITIES_QUERY, rows=universities).data()}
+        missing_departments = sorted(r['idx'] for r in s.run(MISSING_DEPARTMENTS_QUERY, rows=departments).data())
+        missing_programs = sorted(r['idx'] for r in s.run(MISSING_PROGRAMS_QUERY, rows=programs).data())
+
+    reports = [{'university': e['university'], 'mismatches': []} for e in expected_batch]
+    for i in sorted(missing_universities):
+        reports[i]['mismatches'].append({'type': 'missing_university', 'name': expected_batch[i]['university']})
+    for i, j in missing_departments:
+        reports[i]['mismatches'].append({'type': 'missing_department', 'department': expected_batch[i]['departments'][j]})
+    for i, j in missing_programs:
+        reports[i]['mismatches'].append({'type': 'missing_program', 'program': expected_batch[i]['programs'][j]['name']})
+
+    for report in reports:
+        report['status'] = 'ok' if not report['mismatches'] else 'mismatch'
+    return reports
+
+def verify_all_against_db(uri: str, user: str, password: str, expected: List[Dict[str, Any]],
+                          batch_size: int = 25) -> List[Dict[str, Any]]:
+    """Verify every parsed profile over a single shared driver, batch_size universities per round of queries."""
     if GraphDatabase is None:
-        return {'status': 'skipped', 'reason': 'neo4j driver not installed'}
+        return [{'status': 'skipped', 'reason': 'neo4j driver not installed'} for _ in expected]
     try:
         driver = GraphDatabase.driver(uri, auth=(user, password))
     except Exception as e:
-        return {'status': 'skipped', 'reason': f'connection_failed: {e}'}
+        return [{'status': 'skipped', 'reason': f'connection_failed: {e}'} for _ in expected]
 
-    def run(q: str, params: Dict[str, Any] = None) -> List[Dict[str, Any]]:
-        with driver.session() as s:
-            return s.run(q, params or {}).data()
-
-    u = expected['university']
-    report = {'university': u, 'mismatches': []}
-
-    # Verify University exists
-    rows = run("MATCH (u:University {name:$u}) RETURN count(u) as c", {'u': u})
-    if not rows or rows[0]['c'] == 0:
-        report['mismatches'].append({'type': 'missing_university', 'name': u})
-
-    # Verify Departments
-    for d in expected.get('departments', []):
-        rows = run("""
-            MATCH (u:University {name:$u})-[:LOCATED_IN]->(d:Department {name:$d, university:$u})
-            RETURN count(d) as c
-        """, {'u': u, 'd': d})
-        if not rows or rows[0]['c'] == 0:
-            report['mismatches'].append({'type': 'missing_department', 'department': d})
-
-    # Verify Programs
-    for p in expected.get('programs', []):
-        p_name = p['name']
-        rows = run("""
-            MATCH (u:University {name:$u})<-[:OFFERS]-(d:Department)-[:OFFERS]->(p:Program {name:$p, university:$u})
-            RETURN count(p) as c
-        """, {'u': u, 'p': p_name})
-        if not rows or rows[0]['c'] == 0:
-            report['mismatches'].append({'type': 'missing_program', 'program': p_name})
+    reports: List[Dict[str, Any]] = []
+    try:
+        for start in range(0, len(expected), max(1, batch_size)):
+            reports += verify_universities(driver, expected[start:start + max(1, batch_size)])
+    finally:
+        driver.close()
+    return reports
 
-    driver.close()
-    report['status'] = 'ok' if not report['mismatches'] else 'mismatch'
-    return report
+def verify_against_db(uri: str, user: str, password: str, expected: Dict[str, Any]) -> Dict[str, Any]:
+    return verify_all_against_db(uri, user, password, [expected])[0]
 
 # -------- Main workflow ---------
 
@@ -213,11 +337,19 @@ def main():
     parser = argparse.ArgumentParser(description='Synchronize graph with university profiles and verify.')
     parser.add_argument('--profiles-dir', default=str(PROFILES_DIR), help='Directory with university profiles (.md)')
     parser.add_argument('--output-cypher', default=str(OUTPUT_DIR / 'profile_graph_sync.cypher'), help='Path to write Cypher upserts')
+    parser.add_argument('--cypher-mode', choices=['statements', 'unwind'], default='statements',
+                        help='statements: one inlined MERGE per entity; unwind: parameterized UNWIND statements plus an NDJSON payload')
+    parser.add_argument('--unwind-scope', choices=['university', 'corpus'], default='corpus',
+                        help='In unwind mode, one payload per entity type per university or for the whole corpus')
+    parser.add_argument('--output-params', default=str(OUTPUT_DIR / 'profile_graph_sync_params.ndjson'), help='Path to write UNWIND parameter payloads')
+    parser.add_argument('--apply', action='store_true', help='Execute the UNWIND payloads against Neo4j through the driver')
     parser.add_argument('--verify', action='store_true', help='Verify against live Neo4j')
     parser.add_argument('--uri', default='bolt://localhost:7689')
     parser.add_argument('--user', default='neo4j')
     parser.add_argument('--password', default='perseus2025')
     parser.add_argument('--limit', type=int, default=0, help='Limit number of profiles processed (0 = all)')
+    parser.add_argument('--workers', type=int, default=None, help='Parser processes (default: PROFILE_WORKERS or CPU count)')
+    parser.add_argument('--verify-batch-size', type=int, default=25, help='Universities checked per round of verification queries')
 
     args = parser.parse_args()
 
@@ -237,21 +369,39 @@ def main():
 
     all_cypher: List[str] = []
     verification_reports: List[Dict[str, Any]] = []
+    parsed_profiles: List[Dict[str, Any]] = []
 
-    for i, md_path in enumerate(profile_files, 1):
-        logger.info(f"Processing [{i}/{len(profile_files)}]: {md_path.name}")
-        parsed = parse_profile_markdown(md_path)
-        cypher = generate_cypher_for_university(parsed)
-        all_cypher.append(f"// === {parsed['university']} ===\n" + cypher)
+    results = ingest_profiles(profile_files, parse_profile_markdown, args.workers)
+    unwind_mode = args.cypher_mode == 'unwind' or args.apply
 
-        if args.verify:
-            report = verify_against_db(args.uri, args.user, args.password, parsed)
-            verification_reports.append(report)
+    for i, result in enumerate(results, 1):
+        if not result.ok:
+            continue
+        parsed = result.value
+        logger.info(f"Processing [{i}/{len(profile_files)}]: {result.path.name}")
+        if not unwind_mode:
+            cypher = generate_cypher_for_university(parsed)
+            all_cypher.append(f"// === {parsed['university']} ===\n" + cypher)
+        parsed_profiles.append(parsed)
 
     # Write outputs
     cypher_path = Path(args.output_cypher)
-    cypher_path.write_text("\n".join(all_cypher), encoding='utf-8')
-    logger.info(f"Cypher upsert written: {cypher_path}")
+    params_path = Path(args.output_params)
+    if unwind_mode:
+        payloads = build_sync_payloads(parsed_profiles, args.unwind_scope)
+        write_sync_payloads(payloads, cypher_path, params_path)
+        logger.info(f"UNWIND statements written: {cypher_path} ({len(payloads)} payloads in {params_path})")
+        if args.apply:
+            applied = apply_sync_payloads(args.uri, args.user, args.password, payloads)
+            logger.info(f"Applied {applied}/{len(payloads)} UNWIND payloads")
+    else:
+        cypher_path.write_text("\n".join(all_cypher + [STAMP_STATEMENT]), encoding='utf-8')
+        logger.info(f"Cypher upsert written: {cypher_path}")
+
+    # Verify after any --apply so the report reflects the synchronized graph
+    if args.verify:
+        verification_reports = verify_all_against_db(args.uri, args.user, args.password, parsed_profiles,
+                                                     args.verify_batch_size)
 
     if verification_reports:
         report_path = OUTPUT_DIR / 'profile_graph_verification_report.json'
@@ -266,6 +416,8 @@ def main():
         f"Cypher file: `{cypher_path.relative_to(ROOT)}`",
         "",
     ]
+    if unwind_mode:
+        md_lines[-1:-1] = [f"UNWIND parameters: `{params_path.relative_to(ROOT)}` ({args.unwind_scope} scope)"]
     if verification_reports:
         mismatches = sum(1 for r in verification_reports if r.get('status') == 'mismatch')
         md_lines += [
@@ -7,12 +7,18 @@ This script provides the most accurate data on what proportion of universities o
 
 import pandas as pd
 import json
-from neo4j import GraphDatabase
 from typing import Dict, List, Any, Tuple
 import logging
 from pathlib import Path
 import sys
 
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from src.utils.neo4j_executor import get_executor
+from src.utils.taxonomy import get_taxonomy
+
 # Setup logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -24,43 +30,17 @@ class UniversityCourseAnalyzer:
                  username: str = "neo4j", 
                  password: str = "perseus2025"):
         """Initialize the analyzer with database connection."""
-        self.driver = GraphDatabase.driver(uri, auth=(username, password))
+        self.executor = get_executor(uri, username, password)
         self.results = {}
         
-        # Define technology categories and their keywords
-        self.technology_categories = {
-            'AI_ML': [
-                'artificial intelligence', 'ai', 'machine learning', 'ml', 
-                'deep learning', 'neural networks', 'data science', 'predictive analytics',
-                'computer vision', 'natural language processing', 'nlp'
-            ],
-            'GIS': [
-                'geographic information systems', 'gis', 'geospatial', 'spatial analysis',
-                'cartography', 'mapping', 'remote sensing', 'satellite imagery'
-            ],
-            'Drones_UAV': [
-                'drone', 'uav', 'unmanned aerial vehicle', 'aerial photography',
-                'drone technology', 'uav applications', 'aerial mapping'
-            ],
-            'Remote_Sensing': [
-                'remote sensing', 'satellite imagery', 'aerial imagery', 'sensor data',
-                'image processing', 'spectral analysis', 'multispectral'
-            ],
-            'Data_Analytics': [
-                'data analytics', 'statistical analysis', 'big data', 'data mining',
-                'business intelligence', 'analytics', 'data visualization'
-            ]
-        }
+        # Technology categories and their keywords (config/taxonomies.yaml: course_technology_areas)
+        self.technology_taxonomy = get_taxonomy('course_technology_areas')
+        self.technology_categories = dict(self.technology_taxonomy.rules)
     
     def run_query(self, query: str, parameters: Dict = None) -> List[Dict]:
         """Execute a Cypher query and return results."""
         try:
-            with self.driver.session() as session:
-                if parameters:
-                    result = session.run(query, parameters)
-                else:
-                    result = session.run(query)
-                return result.data()
+            return self.executor.read(query, parameters).records
         except Exception as e:
             logger.error(f"Query execution failed: {e}")
             return []
@@ -78,9 +58,13 @@ class UniversityCourseAnalyzer:
             'relationship_types': "CALL db.relationshipTypes() YIELD relationshipType RETURN collect(relationshipType) as types"
         }
         
+        # The counts are independent: run them concurrently
+        batch = self.executor.read_batch(queries)
         overview = {}
-        for name, query in queries.items():
-            result = self.run_query(query)
+        for name in queries:
+            if name in batch.errors:
+                logger.error(f"Query execution failed: {batch.errors[name]}")
+            result = batch.records(name)
             if result:
                 overview[name] = result[0]
         
@@ -150,18 +134,15 @@ class UniversityCourseAnalyzer:
             
             courses_text = courses_text.lower()
             
-            # Check each technology category
-            for category, keywords in self.technology_categories.items():
-                for keyword in keywords:
-                    if keyword in courses_text:
-                        technology_courses[category].append({
-                            'program_name': program.get('program_name', 'Unknown'),
-                            'university': program.get('university_name', 'Unknown'),
-                            'department': program.get('department_name', 'Unknown'),
-                            'matched_keyword': keyword,
-                            'course_text': courses_text[:200] + "..." if len(courses_text) > 200 else courses_text
-                        })
-                        break  # Only count once per category per program
+            # Check every technology category in one scan (once per category per program)
+            for category, keyword in self.technology_taxonomy.matches(courses_text).items():
+                technology_courses[category].append({
+                    'program_name': program.get('program_name', 'Unknown'),
+                    'university': program.get('university_name', 'Unknown'),
+                    'department': program.get('department_name', 'Unknown'),
+                    'matched_keyword': keyword,
+                    'course_text': courses_text[:200] + "..." if len(courses_text) > 200 else courses_text
+                })
         
         return technology_courses
     
@@ -223,11 +204,8 @@ class UniversityCourseAnalyzer:
         for program in technology_programs:
             description = program.get('description', '').lower()
             
-            for category, keywords in self.technology_categories.items():
-                for keyword in keywords:
-                    if keyword in description:
-                        categorized_programs[category].append(program)
-                        break
+            for category in self.technology_taxonomy.matches(description):
+                categorized_programs[category].append(program)
         
         return categorized_programs
     
@@ -260,11 +238,8 @@ class UniversityCourseAnalyzer:
         for dept in technology_departments:
             description = dept.get('description', '').lower()
             
-            for category, keywords in self.technology_categories.items():
-                for keyword in keywords:
-                    if keyword in description:
-                        categorized_departments[category].append(dept)
-                        break
+            for category in self.technology_taxonomy.matches(description):
+                categorized_departments[category].append(dept)
         
         return categorized_departments
     
@@ -272,23 +247,25 @@ class UniversityCourseAnalyzer:
         """Generate comprehensive report on university course offerings."""
         logger.info("Generating comprehensive report...")
         
-        # Get database overview
-        overview = self.get_database_overview()
+        # One session for every query of the report
+        with self.executor.session_scope():
+            # Get database overview
+            overview = self.get_database_overview()
         
-        # Analyze program courses
-        program_analysis = self.analyze_program_courses()
+            # Analyze program courses
+            program_analysis = self.analyze_program_courses()
         
-        # Identify technology courses
-        technology_courses = self.identify_technology_courses(program_analysis['university_programs'])
+            # Identify technology courses
+            technology_courses = self.identify_technology_courses(program_analysis['university_programs'])
         
-        # Calculate proportions
-        proportions = self.calculate_university_proportions(technology_courses)
+            # Calculate proportions
+            proportions = self.calculate_university_proportions(technology_courses)
         
-        # Get detailed analysis
-        detailed_analysis = self.get_detailed_course_analysis()
+            # Get detailed analysis
+            detailed_analysis = self.get_detailed_course_analysis()
         
-        # Analyze department focus
-        department_analysis = self.analyze_department_technology_focus()
+            # Analyze department focus
+            department_analysis = self.analyze_department_technology_focus()
         
         # Compile comprehensive report
         report = {
@@ -390,8 +367,8 @@ class UniversityCourseAnalyzer:
         print("\n" + "="*80)
     
     def close(self):
-        """Close database connection."""
-        self.driver.close()
+        """Release the shared database connection and log query metrics."""
+        logger.info(f"Neo4j {self.executor.metrics.format()}")
 
 def main():
     """Main execution function."""
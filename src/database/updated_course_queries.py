@@ -6,12 +6,17 @@ Provides accurate queries that reflect the proper hierarchy: University -> Depar
 
 import pandas as pd
 import json
-from neo4j import GraphDatabase
 from typing import Dict, List, Any, Tuple
 import logging
 from pathlib import Path
 import sys
 
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from src.utils.neo4j_executor import get_executor
+
 # Setup logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -23,7 +28,7 @@ class UpdatedCourseQueries:
                  username: str = "neo4j", 
                  password: str = "perseus2025"):
         """Initialize with database connection."""
-        self.driver = GraphDatabase.driver(uri, auth=(username, password))
+        self.executor = get_executor(uri, username, password)
         self.results = {}
         
         # Technology categories for analysis
@@ -54,12 +59,7 @@ class UpdatedCourseQueries:
     def run_query(self, query: str, parameters: Dict = None) -> List[Dict]:
         """Execute a Cypher query and return results."""
         try:
-            with self.driver.session() as session:
-                if parameters:
-                    result = session.run(query, parameters)
-                else:
-                    result = session.run(query)
-                return result.data()
+            return self.executor.read(query, parameters).records
         except Exception as e:
             logger.error(f"Query execution failed: {e}")
             return []
@@ -183,14 +183,15 @@ class UpdatedCourseQueries:
         queries = self.get_corrected_hierarchy_queries()
         results = {}
         
-        for query_name, query in queries.items():
-            try:
-                result = self.run_query(query)
-                results[query_name] = result
-                logger.info(f"Executed {query_name}: {len(result)} results")
-            except Exception as e:
-                logger.error(f"Error executing {query_name}: {e}")
-                results[query_name] = []
+        # The queries are independent: run them concurrently
+        batch = self.executor.read_batch(queries)
+        for query_name in queries:
+            if query_name in batch.errors:
+                logger.error(f"Error executing {query_name}: {batch.errors[query_name]}")
+            result = batch.records(query_name)
+            results[query_name] = result
+            logger.info(f"Executed {query_name}: {len(result)} results")
+        logger.info(f"Ran {len(queries)} queries in {batch.elapsed:.2f}s")
         
         return results
     
@@ -374,8 +375,8 @@ class UpdatedCourseQueries:
         print("\n" + "="*80)
     
     def close(self):
-        """Close database connection."""
-        self.driver.close()
+        """Release the shared database connection and log query metrics."""
+        logger.info(f"Neo4j {self.executor.metrics.format()}")
 
 def main():
     """Main execution function."""
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+KG-Perseus Classification Materializer
+Stores taxonomy classifications on graph nodes as indexed properties and labels,
+so RQ queries filter by value instead of repeating toLower(...) CONTAINS chains.
+"""
+
+import logging
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional
+
+from src.utils.neo4j_executor import Neo4jExecutor
+from src.utils.taxonomy import get_taxonomy
+
+logger = logging.getLogger(__name__)
+
+# Distinct names classified per write transaction
+MATERIALIZE_BATCH_SIZE = 500
+
+
+@dataclass(frozen=True)
+class MaterializedClassification:
+    """A taxonomy applied to the names of one node label.
+
+    Each node gets ``property`` (the first matching rule's label, as in a Cypher
+    ``CASE`` chain) and ``<property>_version`` (the taxonomy fingerprint), plus
+    one marker label per matching rule (``GIS`` -> ``:GISFocus``), which stands
+    in for an ``OR``-ed ``CONTAINS`` filter on any term of that rule. Without a
+    ``label_suffix`` only the property is stored.
+    """
+    label: str
+    taxonomy: str
+    property: str
+    label_suffix: Optional[str] = None
+
+    @property
+    def version_property(self) -> str:
+        return f'{self.property}_version'
+
+    @property
+    def index_name(self) -> str:
+        return f"{re.sub(r'(?<!^)(?=[A-Z])', '_', self.label).lower()}_{self.property}"
+
+    def marker_label(self, category: str) -> str:
+        """Node label marking a match of ``category`` ('Remote Sensing' -> 'RemoteSensingFocus')."""
+        return re.sub(r'[^0-9A-Za-z]', '', category) + self.label_suffix
+
+    def marker_labels(self) -> Dict[str, str]:
+        """Marker label for every rule of the taxonomy, in rule order (none without a label_suffix)."""
+        if not self.label_suffix:
+            return {}
+        return {category: self.marker_label(category) for category, _ in get_taxonomy(self.taxonomy).rules}
+
+
+MATERIALIZED_CLASSIFICATIONS = [
+    MaterializedClassification('ResearchCenter', 'research_focus', 'research_focus', 'Focus'),
+    MaterializedClassification('Lab', 'research_focus', 'research_focus', 'Focus'),
+    MaterializedClassification('Department', 'department_type', 'department_type', 'Department'),
+    MaterializedClassification('Program', 'program_level', 'program_level'),
+    MaterializedClassification('Program', 'program_type', 'program_type'),
+]
+
+
+def marker_labels() -> List[str]:
+    """Every marker label the materializer can set (to ignore when counting nodes by label)."""
+    return sorted({marker for spec in MATERIALIZED_CLASSIFICATIONS for marker in spec.marker_labels().values()})
+
+
+def classification_index_statements(specs: Optional[Iterable[MaterializedClassification]] = None) -> List[str]:
+    """CREATE INDEX statements for the materialized classification properties."""
+    return [f"CREATE INDEX {spec.index_name} IF NOT EXISTS FOR (n:{spec.label}) ON (n.{spec.property})"
+            for spec in (specs or MATERIALIZED_CLASSIFICATIONS)]
+
+
+def _stale_names_query(spec: MaterializedClassification) -> str:
+    return f"""
+    MATCH (n:{spec.label})
+    WHERE $force OR coalesce(n.{spec.version_property}, '') <> $version
+    RETURN DISTINCT n.name AS name
+    """
+
+
+def _remove_markers(spec: MaterializedClassification) -> str:
+    markers = spec.marker_labels()
+    return f"REMOVE n:{':'.join(markers.values())}" if markers else ''
+
+
+def _write_query(spec: MaterializedClassification) -> str:
+    """Set the property, version and marker labels of the nodes named in $rows."""
+    markers = spec.marker_labels()
+    set_markers = '\n'.join(
+        f"    FOREACH (_ IN CASE WHEN {category!r} IN row.matches THEN [1] ELSE [] END | SET n:{marker})"
+        for category, marker in markers.items())
+    return f"""
+    UNWIND $rows AS row
+    MATCH (n:{spec.label} {{name: row.name}})
+    SET n.{spec.property} = row.category, n.{spec.version_property} = $version
+    {_remove_markers(spec)}
+{set_markers}
+    """
+
+
+def _unnamed_query(spec: MaterializedClassification) -> str:
+    """Classify nodes without a name as the taxonomy default (as a CASE chain does)."""
+    return f"""
+    MATCH (n:{spec.label})
+    WHERE n.name IS NULL AND ($force OR coalesce(n.{spec.version_property}, '') <> $version)
+    SET n.{spec.property} = $default, n.{spec.version_property} = $version
+    {_remove_markers(spec)}
+    """
+
+
+def classification_rows(spec: MaterializedClassification, names: Iterable[Any]) -> List[Dict[str, Any]]:
+    """
+    Classify node names with the spec's taxonomy
+
+    Args:
+        spec: Classification to compute
+        names: Node names
+
+    Returns:
+        One row per name: name, category (first matching rule) and matches (every matching rule)
+    """
+    taxonomy = get_taxonomy(spec.taxonomy)
+    return [{'name': name, 'category': taxonomy.classify(name), 'matches': list(taxonomy.matches(name))}
+            for name in names]
+
+
+def materialize_classification(executor: Neo4jExecutor, spec: MaterializedClassification,
+                               force: bool = False, batch_size: int = MATERIALIZE_BATCH_SIZE) -> int:
+    """
+    Store one classification on the nodes that lack it or were classified with older rules
+
+    Args:
+        executor: Neo4j executor
+        spec: Classification to materialize
+        force: Reclassify every node
+        batch_size: Distinct names per write transaction
+
+    Returns:
+        Number of distinct names classified
+    """
+    taxonomy = get_taxonomy(spec.taxonomy)
+    params = {'force': force, 'version': taxonomy.fingerprint}
+
+    names = [record['name'] for record in executor.read(_stale_names_query(spec), params)]
+    rows = classification_rows(spec, [name for name in names if name is not None])
+    write_query = _write_query(spec)
+    for start in range(0, len(rows), batch_size):
+        executor.write(write_query, {'rows': rows[start:start + batch_size], 'version': taxonomy.fingerprint})
+    if None in names:
+        executor.write(_unnamed_query(spec), {**params, 'default': taxonomy.default})
+
+    if rows:
+        logger.info(f"Materialized {spec.label}.{spec.property} for {len(rows)} names")
+    return len(rows)
+
+
+def materialize_classifications(executor: Neo4jExecutor, labels: Optional[Iterable[str]] = None,
+                                force: bool = False) -> Dict[str, int]:
+    """
+    Materialize the classifications of the given node labels (default: all)
+
+    Without ``force`` only unclassified or stale nodes are written, so calling
+    this before a query is cheap once the graph is up to date.
+
+    Args:
+        executor: Neo4j executor
+        labels: Node labels to classify (None = every MATERIALIZED_CLASSIFICATIONS entry)
+        force: Reclassify every node
+
+    Returns:
+        Mapping of 'Label.property' to the number of names classified
+    """
+    wanted = set(labels) if labels is not None else None
+    return {f'{spec.label}.{spec.property}': materialize_classification(executor, spec, force=force)
+            for spec in MATERIALIZED_CLASSIFICATIONS if wanted is None or spec.label in wanted}
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+KG-Perseus Multi-Keyword Matcher
+Aho-Corasick automaton that counts many whole-word keywords in one scan.
+"""
+
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Dict, List, Tuple
+
+# Case folding that mirrors re.IGNORECASE for ASCII keywords: besides A-Z,
+# these are the only characters re treats as equal to an ASCII letter
+CASE_FOLD = str.maketrans({
+    **{chr(c): chr(c + 32) for c in range(ord('A'), ord('Z') + 1)},
+    'İ': 'i',  # LATIN CAPITAL LETTER I WITH DOT ABOVE
+    'ı': 'i',  # LATIN SMALL LETTER DOTLESS I
+    'ſ': 's',  # LATIN SMALL LETTER LONG S
+    'K': 'k',  # KELVIN SIGN
+})
+
+
+def is_word_char(char: str) -> bool:
+    """Whether ``char`` is a regex word character (``\\w`` for str patterns)."""
+    return char.isalnum() or char == '_'
+
+
+def has_boundary(text: str, pos: int) -> bool:
+    """Whether a regex ``\\b`` holds at ``pos`` in ``text``."""
+    before = pos > 0 and is_word_char(text[pos - 1])
+    after = pos < len(text) and is_word_char(text[pos])
+    return before != after
+
+
+@dataclass
+class KeywordScan:
+    """Per-keyword counts and start offsets, plus per-category totals."""
+    counts: Dict[str, int] = field(default_factory=dict)
+    positions: Dict[str, List[int]] = field(default_factory=dict)
+    category_counts: Dict[str, int] = field(default_factory=dict)
+    categories: Dict[str, List[str]] = field(default_factory=dict)
+
+    def keywords_found(self, category: str) -> List[str]:
+        """Keywords of ``category`` that matched at least once, in taxonomy order."""
+        return [k for k in self.categories[category] if self.counts[k] > 0]
+
+    @property
+    def total(self) -> int:
+        """Total matches across all categories."""
+        return sum(self.category_counts.values())
+
+
+class KeywordMatcher:
+    """Counts case-insensitive keyword matches for many keywords at once.
+
+    With ``whole_words`` (the default) the counts are identical to running
+    ``len(re.findall(rf'\\b{re.escape(k)}\\b', text, re.IGNORECASE))`` for every
+    keyword ``k``. Otherwise keywords match as plain substrings, except that a
+    keyword written as ``'\\bAI\\b'`` (or with just one ``\\b`` marker) requires a
+    word boundary at the marked end. A keyword that overlaps itself counts only
+    non-overlapping matches, but different keywords may overlap (both 'drone'
+    and 'drone mapping' count in "drone mapping"). Keywords are expected to be ASCII.
+    """
+
+    def __init__(self, categories: Dict[str, List[str]], whole_words: bool = True):
+        """
+        Build the automaton once for a keyword taxonomy
+
+        Args:
+            categories: Mapping of category name to its keywords
+            whole_words: Require a word boundary at both ends of every keyword
+        """
+        self.categories = {category: list(keywords) for category, keywords in categories.items()}
+        self.keywords: List[str] = list(dict.fromkeys(
+            k for keywords in self.categories.values() for k in keywords))
+
+        # Keywords differing only in case share one pattern
+        self.patterns: List[str] = []
+        self.boundaries: List[Tuple[bool, bool]] = []
+        self.pattern_keywords: List[List[str]] = []
+        pattern_ids: Dict[Tuple[str, bool, bool], int] = {}
+        for keyword in self.keywords:
+            literal, bounds = (keyword, (True, True)) if whole_words else self._parse_markers(keyword)
+            key = (literal.translate(CASE_FOLD),) + bounds
+            if key not in pattern_ids:
+                pattern_ids[key] = len(self.patterns)
+                self.patterns.append(key[0])
+                self.boundaries.append(bounds)
+                self.pattern_keywords.append([])
+            self.pattern_keywords[pattern_ids[key]].append(keyword)
+
+        self.transitions, self.outputs = self._build(self.patterns)
+
+    @staticmethod
+    def _parse_markers(keyword: str) -> Tuple[str, Tuple[bool, bool]]:
+        """Strip leading/trailing ``\\b`` markers, returning (literal, (start_boundary, end_boundary))."""
+        start = keyword.startswith('\\b')
+        end = keyword.endswith('\\b') and len(keyword) > (2 if start else 0) + 1
+        literal = keyword[2 if start else 0:len(keyword) - 2 if end else len(keyword)]
+        return literal, (start, end)
+
+    @staticmethod
+    def _build(patterns: List[str]) -> Tuple[List[Dict[str, int]], List[List[int]]]:
+        """Build a full Aho-Corasick transition table with failure links folded in."""
+        transitions: List[Dict[str, int]] = [{}]
+        outputs: List[List[int]] = [[]]
+
+        for pattern_id, pattern in enumerate(patterns):
+            state = 0
+            for char in pattern:
+                if char not in transitions[state]:
+                    transitions.append({})
+                    outputs.append([])
+                    transitions[state][char] = len(transitions) - 1
+                state = transitions[state][char]
+            outputs[state].append(pattern_id)
+
+        # Breadth-first: each state inherits its failure state's transitions and outputs
+        fail = [0] * len(transitions)
+        queue = deque(transitions[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, child in list(transitions[state].items()):
+                queue.append(child)
+                fallback = fail[state]
+                while fallback and char not in transitions[fallback]:
+                    fallback = fail[fallback]
+                target = transitions[fallback].get(char, 0)
+                fail[child] = target if target != child else 0
+                outputs[child].extend(outputs[fail[child]])
+            if state:
+                for char, target in transitions[fail[state]].items():
+                    transitions[state].setdefault(char, target)
+
+        return transitions, outputs
+
+    def scan(self, text: str) -> KeywordScan:
+        """
+        Count every keyword in a single pass over ``text``
+
+        Args:
+            text: Text to search
+
+        Returns:
+            KeywordScan with per-keyword counts and positions and per-category totals
+        """
+        folded = text.translate(CASE_FOLD)
+        transitions, outputs, patterns, boundaries = self.transitions, self.outputs, self.patterns, self.boundaries
+        starts: List[List[int]] = [[] for _ in patterns]
+        last_end = [0] * len(patterns)
+
+        state = 0
+        for end, char in enumerate(folded, 1):
+            state = transitions[state].get(char, 0)
+            for pattern_id in outputs[state]:
+                start = end - len(patterns[pattern_id])
+                # re.findall resumes after each match, so one keyword never overlaps itself
+                if start < last_end[pattern_id]:
+                    continue
+                start_bound, end_bound = boundaries[pattern_id]
+                if (not start_bound or has_boundary(folded, start)) and (not end_bound or has_boundary(folded, end)):
+                    starts[pattern_id].append(start)
+                    last_end[pattern_id] = end
+
+        result = KeywordScan(categories=self.categories)
+        for pattern_id, keywords in enumerate(self.pattern_keywords):
+            for keyword in keywords:
+                result.positions[keyword] = starts[pattern_id]
+                result.counts[keyword] = len(starts[pattern_id])
+        for category, keywords in self.categories.items():
+            result.category_counts[category] = sum(result.counts[k] for k in keywords)
+        return result
@@ -0,0 +1,557 @@
+#!/usr/bin/env python3
+"""
+KG-Perseus Neo4j Query Executor
+Runs Cypher over one pooled neo4j driver per process with explicit transactions,
+retry, per-run session reuse, concurrent read batches, a graph-versioned result
+cache and pool-wait/latency metrics.
+"""
+
+import atexit
+import logging
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from neo4j import GraphDatabase, unit_of_work
+from neo4j.exceptions import ServiceUnavailable, SessionExpired, TransientError
+
+from src.utils.query_cache import GRAPH_VERSION_QUERY, STAMP_GRAPH_VERSION_QUERY, QueryCache
+
+logger = logging.getLogger(__name__)
+
+# Errors worth retrying: deadlocks and other transient server errors, lost connections
+RETRYABLE_ERRORS = (TransientError, ServiceUnavailable, SessionExpired)
+
+# Update counters copied from the result summary
+COUNTER_NAMES = [
+    'nodes_created', 'nodes_deleted', 'relationships_created', 'relationships_deleted',
+    'properties_set', 'labels_added', 'labels_removed', 'indexes_added', 'indexes_removed',
+    'constraints_added', 'constraints_removed',
+]
+
+# Counters meaning the data (not just the schema) changed, so the graph version is restamped
+DATA_COUNTERS = [
+    'nodes_created', 'nodes_deleted', 'relationships_created', 'relationships_deleted',
+    'properties_set', 'labels_added', 'labels_removed',
+]
+
+
+@dataclass
+class QueryResult:
+    """Records of one query as dicts of native Python values, plus column names and update counters."""
+    keys: List[str] = field(default_factory=list)
+    records: List[Dict[str, Any]] = field(default_factory=list)
+    counters: Dict[str, int] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __iter__(self):
+        return iter(self.records)
+
+    def value(self, key: Optional[str] = None, default: Any = None) -> Any:
+        """Value of ``key`` (default: the first column) in the first record."""
+        if not self.records:
+            return default
+        return self.records[0].get(key or self.keys[0], default)
+
+
+@dataclass
+class BatchResult:
+    """Results of a query batch keyed by query name, plus the errors of queries that failed."""
+    results: Dict[str, QueryResult] = field(default_factory=dict)
+    errors: Dict[str, Exception] = field(default_factory=dict)
+    elapsed: float = 0.0
+
+    def result(self, name: str) -> QueryResult:
+        """Result of query ``name``, re-raising its error if it failed."""
+        if name in self.errors:
+            raise self.errors[name]
+        return self.results[name]
+
+    def records(self, name: str) -> List[Dict[str, Any]]:
+        """Records of query ``name``, or an empty list if it failed."""
+        return self.results[name].records if name in self.results else []
+
+
+def percentile(samples: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of ``samples`` (0 when empty)."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, max(0, int(round(fraction * len(ordered))) - 1))]
+
+
+@dataclass
+class QueryMetrics:
+    """Connection pool waits and query latencies of the queries run through one executor.
+
+    The pool wait of a managed transaction is the time from submitting it until
+    its transaction function first runs (connection acquisition plus BEGIN);
+    latency is the rest. Auto-commit queries only record latency. Reads served
+    from the result cache are counted as cache hits, not queries.
+    """
+    queries: int = 0
+    retries: int = 0
+    failures: int = 0
+    cache_hits: int = 0
+    cache_misses: int = 0
+    pool_waits: List[float] = field(default_factory=list)
+    latencies: List[float] = field(default_factory=list)
+    lock: Any = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def record(self, pool_wait: Optional[float], latency: float):
+        """Record one successful query."""
+        with self.lock:
+            self.queries += 1
+            self.latencies.append(latency)
+            if pool_wait is not None:
+                self.pool_waits.append(pool_wait)
+
+    def record_retry(self):
+        with self.lock:
+            self.retries += 1
+
+    def record_failure(self):
+        with self.lock:
+            self.failures += 1
+
+    def record_cache(self, hit: bool):
+        with self.lock:
+            if hit:
+                self.cache_hits += 1
+            else:
+                self.cache_misses += 1
+
+    def summary(self) -> Dict[str, Any]:
+        """Counts plus pool-wait and latency statistics in milliseconds."""
+        with self.lock:
+            waits, latencies = list(self.pool_waits), list(self.latencies)
+            counts = {'queries': self.queries, 'retries': self.retries, 'failures': self.failures,
+                      'cache_hits': self.cache_hits, 'cache_misses': self.cache_misses}
+        return {
+            **counts,
+            'pool_wait_ms': {
+                'total': round(sum(waits) * 1000, 2),
+                'mean': round(sum(waits) / len(waits) * 1000, 2) if waits else 0.0,
+                'max': round(max(waits, default=0.0) * 1000, 2),
+            },
+            'latency_ms': {
+                'mean': round(sum(latencies) / len(latencies) * 1000, 2) if latencies else 0.0,
+                'p50': round(percentile(latencies, 0.5) * 1000, 2),
+                'p95': round(percentile(latencies, 0.95) * 1000, 2),
+                'max': round(max(latencies, default=0.0) * 1000, 2),
+            },
+        }
+
+    def format(self) -> str:
+        """One-line summary for logs and console output."""
+        stats = self.summary()
+        wait, latency = stats['pool_wait_ms'], stats['latency_ms']
+        line = (f"queries: {stats['queries']} ({stats['retries']} retries, {stats['failures']} failed); "
+                f"pool wait mean {wait['mean']}ms, max {wait['max']}ms; "
+                f"latency p50 {latency['p50']}ms, p95 {latency['p95']}ms, max {latency['max']}ms")
+        if stats['cache_hits'] or stats['cache_misses']:
+            line += f"; cache hits {stats['cache_hits']}/{stats['cache_hits'] + stats['cache_misses']}"
+        return line
+
+
+class _QueryTimer:
+    """Marks when a query was submitted and when its transaction function first ran."""
+
+    def __init__(self):
+        self.submitted = time.perf_counter()
+        self.acquired: Optional[float] = None
+
+    def mark_acquired(self):
+        if self.acquired is None:
+            self.acquired = time.perf_counter()
+
+
+def normalize_uri(address: str) -> str:
+    """Driver URI for a cypher-shell style address ('localhost:7690' -> 'bolt://localhost:7690')."""
+    return address if '://' in address else f'bolt://{address}'
+
+
+def statement(query: str) -> str:
+    """Query text without the trailing ';' that cypher-shell scripts use."""
+    return query.strip().rstrip(';').rstrip()
+
+
+def _collect(result) -> QueryResult:
+    """Drain a driver result into a QueryResult."""
+    keys = list(result.keys())
+    records = [record.data() for record in result]
+    counters = result.consume().counters
+    return QueryResult(keys=keys, records=records,
+                       counters={name: getattr(counters, name) for name in COUNTER_NAMES
+                                 if getattr(counters, name, 0)})
+
+
+def _run_in_transaction(tx, query: str, params: Dict[str, Any],
+                        timer: Optional[_QueryTimer] = None) -> QueryResult:
+    """Transaction function running one query."""
+    if timer is not None:
+        timer.mark_acquired()
+    return _collect(tx.run(query, params))
+
+
+def _changes_data(result: QueryResult) -> bool:
+    return any(result.counters.get(name) for name in DATA_COUNTERS)
+
+
+def _write_in_transaction(tx, query: str, params: Dict[str, Any],
+                          timer: Optional[_QueryTimer] = None) -> Tuple[QueryResult, Optional[str]]:
+    """Transaction function running one write query and, if it changed data, restamping the graph version."""
+    result = _run_in_transaction(tx, query, params, timer)
+    version = tx.run(STAMP_GRAPH_VERSION_QUERY).single()['version'] if _changes_data(result) else None
+    return result, version
+
+
+class Neo4jExecutor:
+    """Executes Cypher through a single pooled driver.
+
+    Reads and writes run as managed transactions (``execute_read`` /
+    ``execute_write``); :meth:`run` uses an auto-commit transaction for
+    statements that manage their own (``CALL { ... } IN TRANSACTIONS``).
+    Retryable errors are retried with jittered exponential backoff. Queries
+    open a session each, except inside :meth:`session_scope`, where the
+    calling thread reuses one session for the whole block.
+    :meth:`read_batch` runs a named set of independent reads concurrently.
+
+    With a :class:`QueryCache`, reads are answered from disk while the graph
+    version stamp is unchanged. Writes that change data restamp the version in
+    the same transaction. The stamp itself is looked up at most once per
+    ``cache_ttl`` seconds. With ``shared_version``, a stamp recorded in the
+    cache by another process is trusted for as long too, so a repeated report
+    against an unchanged graph runs no queries at all; a writer that records
+    its stamp in a different cache file then goes unnoticed for up to
+    ``cache_ttl`` seconds, which is why it is off by default.
+    """
+
+    def __init__(self, uri: str, user: Optional[str], password: Optional[str], database: Optional[str] = None,
+                 retry_attempts: int = 3, backoff_seconds: float = 0.5,
+                 max_connection_pool_size: Optional[int] = None,
+                 connection_acquisition_timeout: Optional[float] = None,
+                 batch_concurrency: int = 4, batch_timeout: Optional[float] = None,
+                 cache: Optional[QueryCache] = None, cache_ttl: float = 300.0,
+                 shared_version: bool = False):
+        """
+        Create the driver (connections are opened lazily and pooled)
+
+        Args:
+            uri: Bolt/neo4j URI, or a cypher-shell style 'host:port' address
+            user: Neo4j username (None connects without authentication)
+            password: Neo4j password
+            database: Database name (None = server default)
+            retry_attempts: Attempts per query for retryable errors
+            backoff_seconds: Base delay before the first retry
+            max_connection_pool_size: Pool size (None = driver default)
+            connection_acquisition_timeout: Seconds to wait for a pooled connection (None = driver default)
+            batch_concurrency: Default number of queries a read batch runs at once
+            batch_timeout: Default per-query transaction timeout in seconds for read batches (None = server default)
+            cache: Result cache for reads (None = always query the database)
+            cache_ttl: Seconds a known graph version is trusted before the stamp is read again
+            shared_version: Trust a graph version another process recorded in the cache within ``cache_ttl``
+        """
+        self.uri = normalize_uri(uri)
+        self.database = database
+        self.retry_attempts = max(1, retry_attempts)
+        self.backoff_seconds = backoff_seconds
+        self.max_connection_pool_size = max_connection_pool_size
+        self.batch_concurrency = max(1, batch_concurrency)
+        self.batch_timeout = batch_timeout
+        self.cache = cache
+        self.cache_ttl = cache_ttl
+        self.shared_version = shared_version
+        self.scope = f'{self.uri}/{database or ""}'
+        self.metrics = QueryMetrics()
+        self.closed = False
+        self._local = threading.local()
+        self._graph_version: Optional[str] = None
+        self._version_checked: Optional[float] = None
+        self._version_lock = threading.Lock()
+
+        pool_settings = {'max_connection_pool_size': max_connection_pool_size,
+                         'connection_acquisition_timeout': connection_acquisition_timeout}
+        self.driver = GraphDatabase.driver(self.uri, auth=(user, password) if user else None,
+                                           **{k: v for k, v in pool_settings.items() if v is not None})
+
+    def read(self, query: str, params: Optional[Dict[str, Any]] = None,
+             timeout: Optional[float] = None, cache: bool = True) -> QueryResult:
+        """
+        Run a query in a read transaction, or answer it from the result cache
+
+        Args:
+            query: Cypher query
+            params: Query parameters
+            timeout: Transaction timeout in seconds (None = server default)
+            cache: Use the result cache (if the executor has one and the graph is stamped)
+
+        Returns:
+            The query result
+        """
+        version = self.graph_version() if cache and self.cache is not None else None
+        if version is None:
+            return self._read(query, params, timeout)
+
+        key = QueryCache.key(self.scope, query, params)
+        result = self.cache.get(key, version)
+        self.metrics.record_cache(result is not None)
+        if result is None:
+            result = self._read(query, params, timeout)
+            self.cache.put(key, self.scope, version, result)
+        return result
+
+    def _read(self, query: str, params: Optional[Dict[str, Any]] = None,
+              timeout: Optional[float] = None) -> QueryResult:
+        work = _run_in_transaction if timeout is None else unit_of_work(timeout=timeout)(_run_in_transaction)
+        return self._with_retry(lambda session, timer: session.execute_read(
+            work, statement(query), params or {}, timer))
+
+    def read_batch(self, queries: Dict[str, str], params: Optional[Dict[str, Dict[str, Any]]] = None,
+                   max_concurrency: Optional[int] = None, timeout: Optional[float] = None) -> BatchResult:
+        """
+        Run independent read queries concurrently
+
+        Each query runs in its own session and read transaction on a worker
+        thread, so the batch takes about as long as its slowest query. A query
+        that fails (or exceeds ``timeout``) does not stop the others.
+
+        Args:
+            queries: Query name -> Cypher, in the order results should be reported
+            params: Query name -> parameters, for the queries that take any
+            max_concurrency: Queries in flight at once (default: batch_concurrency,
+                capped by the connection pool size)
+            timeout: Per-query transaction timeout in seconds (default: batch_timeout)
+
+        Returns:
+            BatchResult with results and errors keyed by query name
+        """
+        concurrency = max_concurrency or self.batch_concurrency
+        if self.max_connection_pool_size:
+            concurrency = min(concurrency, self.max_connection_pool_size)
+        concurrency = max(1, min(concurrency, len(queries)))
+        timeout = self.batch_timeout if timeout is None else timeout
+        params = params or {}
+
+        batch = BatchResult()
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix='neo4j-batch') as pool:
+            futures = {name: pool.submit(self.read, query, params.get(name), timeout)
+                       for name, query in queries.items()}
+            for name, future in futures.items():
+                try:
+                    batch.results[name] = future.result()
+                except Exception as e:
+                    batch.errors[name] = e
+        batch.elapsed = time.perf_counter() - started
+        return batch
+
+    def write(self, query: str, params: Optional[Dict[str, Any]] = None, restamp: bool = True) -> QueryResult:
+        """
+        Run a query in a write transaction
+
+        Args:
+            query: Cypher query
+            params: Query parameters
+            restamp: Restamp the graph version if the query changed data (False only for
+                bookkeeping writes that no cached read depends on)
+
+        Returns:
+            The query result
+        """
+        if not restamp:
+            return self._with_retry(lambda session, timer: session.execute_write(
+                _run_in_transaction, statement(query), params or {}, timer))
+        result, version = self._with_retry(lambda session, timer: session.execute_write(
+            _write_in_transaction, statement(query), params or {}, timer))
+        if version is not None:
+            self._set_graph_version(version)
+        return result
+
+    def run(self, query: str, params: Optional[Dict[str, Any]] = None) -> QueryResult:
+        """Run a query in an auto-commit transaction (restamping the graph version if it changed data)."""
+        result = self._with_retry(lambda session, timer: _collect(session.run(statement(query), params or {})))
+        if _changes_data(result):
+            self.stamp_graph_version()
+        return result
+
+    def stamp_graph_version(self) -> str:
+        """Give the graph a new version stamp, invalidating cached results; for writers outside this executor."""
+        version = self._with_retry(lambda session, timer: session.execute_write(
+            _run_in_transaction, STAMP_GRAPH_VERSION_QUERY, {}, timer)).value('version')
+        self._set_graph_version(version)
+        return version
+
+    def graph_version(self, refresh: bool = False) -> Optional[str]:
+        """
+        Current graph version stamp (None if the graph was never stamped)
+
+        Within ``cache_ttl`` seconds of the last lookup the known version is
+        reused; with ``shared_version`` a version recorded in the cache by
+        another process counts too.
+
+        Args:
+            refresh: Read the stamp from the database regardless of its age
+        """
+        with self._version_lock:
+            now = time.time()
+            if not refresh and self._version_checked is not None and now - self._version_checked < self.cache_ttl:
+                return self._graph_version
+
+            version = None
+            if not refresh and self.shared_version and self.cache is not None:
+                version = self.cache.known_version(self.scope, self.cache_ttl)
+            if version is None:
+                version = self._read(GRAPH_VERSION_QUERY).value('version')
+                if version is not None and self.cache is not None:
+                    self.cache.record_version(self.scope, version)
+            self._graph_version, self._version_checked = version, now
+            return version
+
+    def _set_graph_version(self, version: str):
+        """Adopt a version this executor just stamped."""
+        with self._version_lock:
+            self._graph_version, self._version_checked = version, time.time()
+            if self.cache is not None:
+                self.cache.record_version(self.scope, version)
+
+    @contextmanager
+    def session_scope(self) -> Iterator['Neo4jExecutor']:
+        """
+        Reuse one session for every query this thread runs inside the block
+
+        Meant to wrap one analysis run; nested scopes share the outer session.
+        """
+        if getattr(self._local, 'session', None) is not None:
+            yield self
+            return
+        self._local.session = self.driver.session(database=self.database)
+        try:
+            yield self
+        finally:
+            session, self._local.session = self._local.session, None
+            session.close()
+
+    def _with_retry(self, work: Callable[[Any, _QueryTimer], Any]) -> Any:
+        """Run ``work`` in the scoped (or a fresh) session, retrying retryable errors with backoff."""
+        for attempt in range(1, self.retry_attempts + 1):
+            timer = _QueryTimer()
+            try:
+                scoped = getattr(self._local, 'session', None)
+                if scoped is not None:
+                    result = work(scoped, timer)
+                else:
+                    with self.driver.session(database=self.database) as session:
+                        result = work(session, timer)
+            except RETRYABLE_ERRORS as e:
+                if attempt == self.retry_attempts:
+                    self.metrics.record_failure()
+                    raise
+                self.metrics.record_retry()
+                self._renew_scoped_session()
+                delay = self.backoff_seconds * 2 ** (attempt - 1) * random.uniform(0.5, 1.5)
+                logger.warning(f"{type(e).__name__}: {e}; retrying in {delay:.1f}s "
+                               f"(attempt {attempt}/{self.retry_attempts})")
+                time.sleep(delay)
+            except Exception:
+                self.metrics.record_failure()
+                raise
+            else:
+                finished = time.perf_counter()
+                if timer.acquired is None:
+                    self.metrics.record(None, finished - timer.submitted)
+                else:
+                    self.metrics.record(timer.acquired - timer.submitted, finished - timer.acquired)
+                return result
+
+    def _renew_scoped_session(self):
+        """Replace this thread's scoped session after a connection-level failure."""
+        if getattr(self._local, 'session', None) is not None:
+            try:
+                self._local.session.close()
+            except Exception:
+                pass
+            self._local.session = self.driver.session(database=self.database)
+
+    def close(self):
+        """Close the driver and its connection pool."""
+        self.closed = True
+        self.driver.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+_executors: Dict[Tuple[str, Optional[str], Optional[str]], Neo4jExecutor] = {}
+_executors_lock = threading.Lock()
+_query_caches: Dict[str, QueryCache] = {}
+
+
+def _get_query_cache(path: str) -> QueryCache:
+    """Process-wide QueryCache per file (called with _executors_lock held)."""
+    if path not in _query_caches:
+        _query_caches[path] = QueryCache(path)
+    return _query_caches[path]
+
+
+def get_executor(uri: Optional[str] = None, user: Optional[str] = None, password: Optional[str] = None,
+                 database: Optional[str] = None) -> Neo4jExecutor:
+    """
+    Process-wide executor, and so one driver and connection pool, per URI, user and database
+
+    Pool size, acquisition timeout, retry attempts, read-batch concurrency
+    and timeout and the result cache come from ``config.Config``; without a ``uri``
+    the connection settings do too (``database_config``).
+
+    Args:
+        uri: Bolt/neo4j URI or 'host:port' address (None = configured database)
+        user: Neo4j username (None with a uri connects without authentication)
+        password: Neo4j password
+        database: Database name (None = server default)
+
+    Returns:
+        The shared executor
+    """
+    from config.settings import config
+
+    if uri is None:
+        settings = config.database_config
+        uri, user, password = settings['uri'], settings['user'], settings['password']
+        database = database or settings.get('database')
+
+    key = (normalize_uri(uri), user, database)
+    with _executors_lock:
+        if key not in _executors or _executors[key].closed:
+            cache_settings = config.get_query_cache_settings()
+            _executors[key] = Neo4jExecutor(uri, user, password, database=database,
+                                            retry_attempts=config.get_retry_attempts(),
+                                            batch_concurrency=config.get_query_concurrency(),
+                                            batch_timeout=config.get_query_timeout() or None,
+                                            cache=_get_query_cache(cache_settings['path'])
+                                            if cache_settings['enabled'] else None,
+                                            cache_ttl=cache_settings['ttl'],
+                                            shared_version=cache_settings['shared_version'],
+                                            **config.get_pool_settings())
+        return _executors[key]
+
+
+@atexit.register
+def close_executors():
+    """Close every shared executor's driver and query cache (runs at interpreter exit)."""
+    with _executors_lock:
+        for executor in _executors.values():
+            if not executor.closed:
+                executor.close()
+        _executors.clear()
+        for cache in _query_caches.values():
+            cache.close()
+        _query_caches.clear()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+KG-Perseus Profile Ingestion Runner
+Parses university profile files in parallel over a process pool.
+"""
+
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Environment override for the worker count used by every ingestion entry point
+WORKERS_ENV_VAR = 'PROFILE_WORKERS'
+
+
+@dataclass
+class IngestionResult:
+    """Outcome of parsing one profile file."""
+    path: Path
+    value: Any = None
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the file was parsed without raising."""
+        return self.error is None
+
+
+def resolve_worker_count(workers: Optional[int] = None) -> int:
+    """Worker count from the argument, then PROFILE_WORKERS, then the CPU count."""
+    if workers is None:
+        workers = int(os.getenv(WORKERS_ENV_VAR, '0')) or os.cpu_count() or 1
+    return max(1, workers)
+
+
+def _parse_one(parse_fn: Callable[[Path], Any], path: Path) -> IngestionResult:
+    """Run the parser on one file, capturing any exception as the result's error."""
+    try:
+        return IngestionResult(path=path, value=parse_fn(path))
+    except Exception as e:
+        return IngestionResult(path=path, error=f"{type(e).__name__}: {e}")
+
+
+def ingest_profiles(paths: Iterable[Path], parse_fn: Callable[[Path], Any],
+                    workers: Optional[int] = None, chunksize: int = 1) -> List[IngestionResult]:
+    """
+    Parse profile files over a process pool, collecting results in input order.
+
+    A file whose parser raises yields a result with ``error`` set instead of
+    aborting the run. ``parse_fn`` must be picklable (a module-level function,
+    a ``functools.partial`` of one, or a bound method of a picklable object),
+    and so must its return value.
+
+    Args:
+        paths: Profile files to parse
+        parse_fn: Callable taking one path and returning its parsed data
+        workers: Number of worker processes (None = PROFILE_WORKERS or CPU count);
+            1 parses serially in this process
+        chunksize: Files handed to a worker per task
+
+    Returns:
+        One IngestionResult per input path, in the same order
+    """
+    paths = [Path(p) for p in paths]
+    workers = min(resolve_worker_count(workers), len(paths) or 1)
+    parse_one = partial(_parse_one, parse_fn)
+
+    if workers == 1:
+        results = [parse_one(path) for path in paths]
+    else:
+        logger.info(f"Parsing {len(paths)} profiles with {workers} worker processes")
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(parse_one, paths, chunksize=chunksize))
+
+    for result in results:
+        if not result.ok:
+            logger.error(f"Error processing {result.path.name}: {result.error}")
+    return results
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+KG-Perseus Query Result Cache
+On-disk (SQLite) cache of read query results, valid for one graph version stamp.
+"""
+
+import hashlib
+import json
+import logging
+import pickle
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Label of the single node whose version property changes with every graph mutation
+GRAPH_VERSION_LABEL = 'GraphVersion'
+
+GRAPH_VERSION_QUERY = f"""
+    MATCH (v:{GRAPH_VERSION_LABEL} {{name: 'graph'}})
+    RETURN v.version AS version
+"""
+
+# A fresh random version (not a counter, so a rebuilt database never reuses an old stamp)
+STAMP_GRAPH_VERSION_QUERY = f"""
+    MERGE (v:{GRAPH_VERSION_LABEL} {{name: 'graph'}})
+    SET v.version = randomUUID(), v.updated_at = datetime()
+    RETURN v.version AS version
+"""
+
+# String literals and identifiers are kept verbatim; other whitespace runs collapse to one space
+_QUERY_TOKENS = re.compile(r"""('(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*"|`[^`]*`)|\s+""")
+
+
+def normalize_query(query: str) -> str:
+    """Query text with insignificant whitespace and the trailing ';' removed (the cache key form)."""
+    text = _QUERY_TOKENS.sub(lambda m: m.group(1) or ' ', query.strip().rstrip(';'))
+    return text.strip()
+
+
+class QueryCache:
+    """Read query results stored in SQLite, keyed by query text and parameters.
+
+    Each entry records the graph version it was computed against and is only
+    returned for that version, so any mutation that restamps the graph
+    invalidates every entry of that database at once. The last graph version
+    seen per database is stored too, so a new process can trust it for a while
+    without asking the database.
+    """
+
+    def __init__(self, path: str):
+        """
+        Open (or create) the cache database
+
+        Args:
+            path: SQLite file
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+        with self.lock, self.connection:
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.execute("""
+                CREATE TABLE IF NOT EXISTS results (
+                    key TEXT PRIMARY KEY, scope TEXT NOT NULL, version TEXT NOT NULL,
+                    created_at REAL NOT NULL, payload BLOB NOT NULL)
+            """)
+            self.connection.execute("""
+                CREATE TABLE IF NOT EXISTS versions (
+                    scope TEXT PRIMARY KEY, version TEXT NOT NULL, checked_at REAL NOT NULL)
+            """)
+
+    @staticmethod
+    def key(scope: str, query: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """Cache key of a query: hash of the database scope, normalized text and parameters."""
+        spec = json.dumps([scope, normalize_query(query), params or {}], sort_keys=True, default=str)
+        return hashlib.sha256(spec.encode('utf-8')).hexdigest()
+
+    def get(self, key: str, version: str) -> Optional[Any]:
+        """Cached result for ``key`` computed against graph ``version``, or None."""
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT payload FROM results WHERE key = ? AND version = ?", (key, version)).fetchone()
+        return pickle.loads(row[0]) if row else None
+
+    def put(self, key: str, scope: str, version: str, result: Any):
+        """Store a result computed against graph ``version``."""
+        payload = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+        with self.lock, self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO results (key, scope, version, created_at, payload) VALUES (?, ?, ?, ?, ?)",
+                (key, scope, version, time.time(), payload))
+
+    def known_version(self, scope: str, max_age: float) -> Optional[str]:
+        """Graph version last recorded for ``scope`` if it was seen within ``max_age`` seconds."""
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT version, checked_at FROM versions WHERE scope = ?", (scope,)).fetchone()
+        if row and time.time() - row[1] < max_age:
+            return row[0]
+        return None
+
+    def record_version(self, scope: str, version: str):
+        """Remember the current graph version of ``scope`` and drop entries of older versions."""
+        with self.lock, self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO versions (scope, version, checked_at) VALUES (?, ?, ?)",
+                (scope, version, time.time()))
+            dropped = self.connection.execute(
+                "DELETE FROM results WHERE scope = ? AND version <> ?", (scope, version)).rowcount
+        if dropped:
+            logger.info(f"Graph version changed; dropped {dropped} cached results")
+
+    def clear(self):
+        """Remove every cached result and recorded version."""
+        with self.lock, self.connection:
+            self.connection.execute("DELETE FROM results")
+            self.connection.execute("DELETE FROM versions")
+
+    def close(self):
+        with self.lock:
+            self.connection.close()
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+KG-Perseus RQ Summary Projections
+Maintains pre-aggregated per-university and whole-graph counts as summary nodes,
+so RQ reports read O(universities) aggregates instead of scanning the raw graph.
+"""
+
+import hashlib
+import json
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional
+
+from src.utils.classification_materializer import materialize_classifications
+from src.utils.neo4j_executor import Neo4jExecutor
+
+logger = logging.getLogger(__name__)
+
+# One node per projection, scope and category; whole-graph rows have no university
+SUMMARY_LABEL = 'RQSummary'
+
+# Single node recording the graph version and projection definitions the summaries reflect
+STATE_LABEL = 'RQSummaryState'
+
+# Bookkeeping labels to leave out of node counts
+SUMMARY_LABELS = [SUMMARY_LABEL, STATE_LABEL]
+
+# Node labels whose materialized classifications the projections group by
+PROJECTED_LABELS = ['Program', 'Department']
+
+
+@dataclass(frozen=True)
+class SummaryProjection:
+    """An aggregate computed for the whole graph and per university.
+
+    ``graph_query`` returns one row per category; ``university_query`` returns
+    the same columns plus ``university`` for the universities in
+    ``$universities`` (null = every university).
+    """
+    name: str
+    graph_query: str
+    university_query: str
+
+
+SUMMARY_PROJECTIONS = [
+    # Programs per level and type, and how many of them use any categorized technology (RQ8)
+    SummaryProjection(
+        'program_totals',
+        """
+        MATCH (p:Program)
+        WITH p, EXISTS { MATCH (p)-[:USES_TECHNOLOGY]->(t:Technology) WHERE t.category IS NOT NULL } AS has_technology
+        RETURN p.program_level AS program_level, p.program_type AS program_type,
+               count(DISTINCT p.name) AS programs,
+               count(DISTINCT CASE WHEN has_technology THEN p.name END) AS tech_programs
+        """,
+        """
+        MATCH (u:University)-[:OFFERS]->(p:Program)
+        WHERE $universities IS NULL OR u.name IN $universities
+        WITH u, p, EXISTS { MATCH (p)-[:USES_TECHNOLOGY]->(t:Technology) WHERE t.category IS NOT NULL } AS has_technology
+        RETURN u.name AS university, p.program_level AS program_level, p.program_type AS program_type,
+               count(DISTINCT p.name) AS programs,
+               count(DISTINCT CASE WHEN has_technology THEN p.name END) AS tech_programs
+        """),
+    # Program x technology category rows (one per offering university) per level and type (RQ8)
+    SummaryProjection(
+        'program_technology',
+        """
+        MATCH (p:Program)-[:USES_TECHNOLOGY]->(t:Technology)
+        WHERE t.category IS NOT NULL
+        OPTIONAL MATCH (u:University)-[:OFFERS]->(p)
+        WITH DISTINCT p.name AS program, p.program_level AS program_level, p.program_type AS program_type,
+             t.category AS technology, u.name AS university
+        RETURN program_level, program_type, technology, count(*) AS rows, count(DISTINCT program) AS programs
+        """,
+        """
+        MATCH (u:University)-[:OFFERS]->(p:Program)-[:USES_TECHNOLOGY]->(t:Technology)
+        WHERE ($universities IS NULL OR u.name IN $universities) AND t.category IS NOT NULL
+        WITH DISTINCT u.name AS university, p.name AS program, p.program_level AS program_level,
+             p.program_type AS program_type, t.category AS technology
+        RETURN university, program_level, program_type, technology,
+               count(*) AS rows, count(DISTINCT program) AS programs
+        """),
+    # Faculty appointed to each department type (RQ10)
+    SummaryProjection(
+        'faculty_department',
+        """
+        MATCH (f:Faculty)-[:APPOINTED_TO]->(d:Department)
+        RETURN d.department_type AS department_type, count(DISTINCT f.name) AS faculty
+        """,
+        """
+        MATCH (u:University)-[:HAS]->(d:Department)<-[:APPOINTED_TO]-(f:Faculty)
+        WHERE $universities IS NULL OR u.name IN $universities
+        RETURN u.name AS university, d.department_type AS department_type, count(DISTINCT f.name) AS faculty
+        """),
+    # All faculty (RQ10 percentages)
+    SummaryProjection(
+        'faculty_totals',
+        """
+        MATCH (f:Faculty)
+        RETURN count(f) AS faculty
+        """,
+        """
+        MATCH (u:University)-[:HAS]->(f:Faculty)
+        WHERE $universities IS NULL OR u.name IN $universities
+        RETURN u.name AS university, count(DISTINCT f) AS faculty
+        """),
+]
+
+# Replaces a projection's rows for the whole graph and the given universities (null = all) in one transaction
+REPLACE_SUMMARIES_QUERY = f"""
+    MATCH (s:{SUMMARY_LABEL} {{projection: $projection}})
+    WHERE $universities IS NULL OR s.university IS NULL OR s.university IN $universities
+    WITH collect(s) AS stale
+    FOREACH (s IN stale | DELETE s)
+    WITH 1 AS _
+    UNWIND $rows AS row
+    CREATE (s:{SUMMARY_LABEL})
+    SET s = row, s.projection = $projection
+"""
+
+# Drops rows of projections that are no longer defined (run on full rebuilds)
+DROP_RETIRED_SUMMARIES_QUERY = f"""
+    MATCH (s:{SUMMARY_LABEL})
+    WHERE NOT s.projection IN $projections
+    DELETE s
+"""
+
+STATE_QUERY = f"""
+    MATCH (m:{STATE_LABEL} {{name: 'rq'}})
+    RETURN m.graph_version AS graph_version, m.fingerprint AS fingerprint
+"""
+
+WRITE_STATE_QUERY = f"""
+    MERGE (m:{STATE_LABEL} {{name: 'rq'}})
+    SET m.graph_version = $graph_version, m.fingerprint = $fingerprint, m.updated_at = datetime()
+"""
+
+SUMMARY_ROWS_QUERY = f"""
+    MATCH (s:{SUMMARY_LABEL} {{projection: $projection}})
+    WHERE CASE WHEN $per_university THEN s.university IS NOT NULL ELSE s.university IS NULL END
+    RETURN properties(s) AS summary
+"""
+
+
+def projection_fingerprint() -> str:
+    """Short hash of the projection queries; stored summaries from other definitions are rebuilt."""
+    spec = json.dumps([[p.name, p.graph_query, p.university_query] for p in SUMMARY_PROJECTIONS])
+    return hashlib.sha1(spec.encode('utf-8')).hexdigest()[:12]
+
+
+def summaries_current(executor: Neo4jExecutor, graph_version: Optional[str] = None) -> bool:
+    """
+    Whether the stored summaries reflect the graph at ``graph_version``
+
+    Both the state and the version stamp are read from the database: the state
+    is written without restamping the graph, so a cached answer for the current
+    version could be stale, and a version trusted from the cache could predate
+    the last import.
+
+    Args:
+        executor: Neo4j executor
+        graph_version: Version to compare with (default: the current graph version)
+    """
+    state = executor.read(STATE_QUERY, cache=False)
+    if not state.records:
+        return False
+    version = graph_version if graph_version is not None else executor.graph_version(refresh=True)
+    return (version is not None and state.value('graph_version') == version
+            and state.value('fingerprint') == projection_fingerprint())
+
+
+def project_summaries(executor: Neo4jExecutor, universities: Optional[Iterable[str]] = None,
+                      since: Optional[str] = None, force: bool = False) -> Dict[str, int]:
+    """
+    Bring the summary nodes up to date with the graph
+
+    Without ``universities`` nothing is written while the summaries are current;
+    otherwise every projection is rebuilt. With ``universities`` (the ones a
+    writer changed since graph version ``since``) only their rows and the
+    whole-graph rows are rebuilt, provided the summaries were current at
+    ``since``; if they were not, everything is. Whole-graph rows are always
+    recomputed because distinct counts do not add up across universities.
+
+    Args:
+        executor: Neo4j executor
+        universities: Names of the universities changed since ``since``
+        since: Graph version before those changes
+        force: Rebuild everything
+
+    Returns:
+        Mapping of projection name to the number of summary rows written (empty if already current)
+    """
+    materialize_classifications(executor, labels=PROJECTED_LABELS)
+
+    if universities is not None and not force and since is not None and summaries_current(executor, since):
+        scope = sorted(set(universities))
+    elif not force and summaries_current(executor):
+        return {}
+    else:
+        scope = None
+
+    if scope is None:
+        executor.write(DROP_RETIRED_SUMMARIES_QUERY, {'projections': [p.name for p in SUMMARY_PROJECTIONS]})
+
+    counts = {}
+    for projection in SUMMARY_PROJECTIONS:
+        rows = [dict(record, university=None) for record in executor.read(projection.graph_query, cache=False)]
+        rows += executor.read(projection.university_query, {'universities': scope}, cache=False).records
+        executor.write(REPLACE_SUMMARIES_QUERY, {'projection': projection.name, 'universities': scope, 'rows': rows})
+        counts[projection.name] = len(rows)
+
+    # Bookkeeping only: restamping here would make the summaries look stale again
+    executor.write(WRITE_STATE_QUERY, {'graph_version': executor.graph_version(refresh=True),
+                                       'fingerprint': projection_fingerprint()}, restamp=False)
+
+    described = 'all universities' if scope is None else f'{len(scope)} universities'
+    logger.info(f"Projected RQ summaries for {described}: {counts}")
+    return counts
+
+
+def summary_rows(executor: Neo4jExecutor, projection: str, per_university: bool = False) -> List[Dict[str, Any]]:
+    """
+    Stored rows of one projection
+
+    Args:
+        executor: Neo4j executor
+        projection: Projection name (see SUMMARY_PROJECTIONS)
+        per_university: Per-university rows instead of the whole-graph rows
+
+    Returns:
+        One dict of summary properties per row
+    """
+    result = executor.read(SUMMARY_ROWS_QUERY, {'projection': projection, 'per_university': per_university})
+    return [record['summary'] for record in result]
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+KG-Perseus Keyword Taxonomies
+Loads classification rules from YAML and compiles each taxonomy into one matcher.
+"""
+
+import hashlib
+import json
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import yaml
+
+from src.utils.keyword_matcher import KeywordMatcher
+
+TAXONOMY_FILE = Path(__file__).resolve().parents[2] / 'config' / 'taxonomies.yaml'
+
+# Distinct values remembered per taxonomy by the memoized classify()
+CLASSIFY_CACHE_SIZE = 65536
+
+
+class Taxonomy:
+    """Ordered keyword rules compiled into a single Aho-Corasick matcher.
+
+    A value is classified by the first rule (in priority order) with any term
+    occurring in it, or ``default`` when none do. Terms are case-insensitive
+    substrings unless marked with ``\\b`` (see :class:`KeywordMatcher`).
+    """
+
+    def __init__(self, name: str, rules: List[Tuple[str, List[str]]],
+                 default: str = 'Other', description: str = ''):
+        """
+        Compile a taxonomy
+
+        Args:
+            name: Taxonomy name
+            rules: (label, terms) pairs in priority order
+            default: Label for values matching no rule (and for empty values)
+            description: Human-readable summary
+        """
+        labels = [label for label, _ in rules]
+        if len(set(labels)) != len(labels):
+            raise ValueError(f"Taxonomy {name!r} has duplicate labels: {labels}")
+
+        self.name = name
+        self.default = default
+        self.description = description
+        self.rules = [(label, list(terms)) for label, terms in rules]
+        self.matcher = KeywordMatcher(dict(self.rules), whole_words=False)
+        self.classify_text = lru_cache(maxsize=CLASSIFY_CACHE_SIZE)(self._classify_text)
+
+    @property
+    def labels(self) -> List[str]:
+        """Every label this taxonomy can produce, in priority order."""
+        labels = [label for label, _ in self.rules]
+        return labels if self.default in labels else labels + [self.default]
+
+    @property
+    def fingerprint(self) -> str:
+        """Short hash of the rules and default; changes whenever a classification can."""
+        spec = json.dumps([self.default, self.rules], ensure_ascii=False)
+        return hashlib.sha1(spec.encode('utf-8')).hexdigest()[:12]
+
+    def _classify_text(self, text: str) -> str:
+        """Label of the first rule with a term in ``text``."""
+        counts = self.matcher.scan(text).category_counts
+        return next((label for label, _ in self.rules if counts[label]), self.default)
+
+    def classify(self, value: Any):
+        """
+        Classify one value (memoized) or every value of a pandas Series
+
+        Args:
+            value: A string-like value, or a pandas Series of them
+
+        Returns:
+            The label, or a Series of labels aligned with the input
+        """
+        if hasattr(value, 'index') and hasattr(value, 'map'):
+            return self.classify_series(value)
+        if value is None or value == '' or value != value:  # None, empty or NaN
+            return self.default
+        return self.classify_text(str(value))
+
+    def classify_series(self, series, categorical: bool = False):
+        """
+        Classify a pandas Series, matching each distinct value only once
+
+        Args:
+            series: Values to classify
+            categorical: Return a categorical Series with :attr:`labels` as categories
+
+        Returns:
+            Series of labels with the same index as ``series``
+        """
+        import numpy as np
+        import pandas as pd
+
+        categories = self.labels
+        codes, uniques = pd.factorize(series)
+        # One lookup per distinct value; the trailing entry serves missing values (code -1)
+        label_codes = np.array([categories.index(self.classify(value)) for value in uniques] +
+                               [categories.index(self.default)], dtype=np.int64)
+        labels = pd.Categorical.from_codes(label_codes[codes], categories=categories)
+
+        result = pd.Series(labels, index=series.index, name=series.name)
+        return result if categorical else result.astype(object)
+
+    def matches(self, value: Any) -> Dict[str, str]:
+        """
+        Every matching label with its highest-priority matching term (multi-label use)
+
+        Args:
+            value: Text to search
+
+        Returns:
+            Mapping of label to the first of its terms found, in rule order
+        """
+        if not value or value != value:
+            return {}
+        scan = self.matcher.scan(str(value))
+        return {label: scan.keywords_found(label)[0]
+                for label, _ in self.rules if scan.category_counts[label]}
+
+
+def load_taxonomies(path: Optional[Path] = None) -> Dict[str, Taxonomy]:
+    """
+    Load and compile every taxonomy in a YAML file
+
+    Args:
+        path: YAML file (defaults to config/taxonomies.yaml)
+
+    Returns:
+        Mapping of taxonomy name to compiled Taxonomy
+    """
+    with open(path or TAXONOMY_FILE, 'r', encoding='utf-8') as f:
+        spec = yaml.safe_load(f) or {}
+
+    return {
+        name: Taxonomy(
+            name,
+            [(rule['label'], rule['terms']) for rule in body['rules']],
+            default=body.get('default', 'Other'),
+            description=body.get('description', '')
+        )
+        for name, body in spec.items()
+    }
+
+
+@lru_cache(maxsize=None)
+def _default_taxonomies() -> Dict[str, Taxonomy]:
+    """Taxonomies from config/taxonomies.yaml, compiled once per process."""
+    return load_taxonomies()
+
+
+def get_taxonomy(name: str) -> Taxonomy:
+    """Compiled taxonomy from config/taxonomies.yaml by name."""
+    taxonomies = _default_taxonomies()
+    if name not in taxonomies:
+        raise KeyError(f"Unknown taxonomy {name!r}; available: {sorted(taxonomies)}")
+    return taxonomies[name]
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Tests for the graph-versioned read query cache (src/utils/query_cache.py and Neo4jExecutor.read)
+"""
+
+import sqlite3
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from src.utils.neo4j_executor import Neo4jExecutor, QueryResult
+from src.utils.query_cache import GRAPH_VERSION_QUERY, QueryCache, normalize_query
+
+
+class FakeGraphExecutor(Neo4jExecutor):
+    """Executor whose database reads are answered in memory and counted"""
+
+    def __init__(self, cache: QueryCache, cache_ttl: float = 300.0):
+        super().__init__('bolt://localhost:7687', None, None, cache=cache, cache_ttl=cache_ttl)
+        self.version = 'v1'
+        self.database_reads = []
+
+    def _read(self, query, params=None, timeout=None):
+        if query == GRAPH_VERSION_QUERY:
+            return QueryResult(keys=['version'], records=[{'version': self.version}])
+        self.database_reads.append(query)
+        return QueryResult(keys=['version'], records=[{'version': self.version}])
+
+
+def cached_versions(path: Path):
+    """Graph versions of the rows left in the results table"""
+    with sqlite3.connect(str(path)) as connection:
+        return sorted(row[0] for row in connection.execute("SELECT version FROM results"))
+
+
+def test_normalize_query_keeps_literals():
+    assert normalize_query("MATCH  (n)\n WHERE n.x = 'a  b'\n RETURN n ;") == "MATCH (n) WHERE n.x = 'a  b' RETURN n"
+
+
+def test_hit_only_for_same_version(tmp_path):
+    cache = QueryCache(str(tmp_path / 'cache.sqlite'))
+    key = QueryCache.key('scope', "MATCH (n) RETURN n", {'a': 1})
+
+    cache.put(key, 'scope', 'v1', {'rows': 1})
+    assert cache.get(key, 'v1') == {'rows': 1}
+    assert cache.get(key, 'v2') is None
+    assert QueryCache.key('scope', "MATCH (n)\n   RETURN n;", {'a': 1}) == key
+    assert QueryCache.key('scope', "MATCH (n) RETURN n", {'a': 2}) != key
+    assert QueryCache.key('other', "MATCH (n) RETURN n", {'a': 1}) != key
+    cache.close()
+
+
+def test_record_version_purges_older_rows(tmp_path):
+    path = tmp_path / 'cache.sqlite'
+    cache = QueryCache(str(path))
+    cache.put(QueryCache.key('scope', "RETURN 1"), 'scope', 'v1', 1)
+    cache.put(QueryCache.key('other', "RETURN 1"), 'other', 'v1', 1)
+
+    cache.record_version('scope', 'v2')
+    assert cache.known_version('scope', max_age=60) == 'v2'
+    assert cache.known_version('scope', max_age=0) is None
+    # Only the restamped database loses its rows
+    assert cached_versions(path) == ['v1']
+    assert cache.get(QueryCache.key('other', "RETURN 1"), 'v1') == 1
+    cache.close()
+
+
+def test_executor_serves_hits_until_restamp(tmp_path):
+    path = tmp_path / 'cache.sqlite'
+    executor = FakeGraphExecutor(QueryCache(str(path)))
+
+    first = executor.read("MATCH (n) RETURN n", {'a': 1})
+    again = executor.read("MATCH (n)\n  RETURN n;", {'a': 1})
+    assert again.records == first.records
+    assert len(executor.database_reads) == 1
+    assert executor.metrics.cache_hits == 1
+
+    # A write by this executor adopts its new stamp: the old entry misses and is purged
+    executor.version = 'v2'
+    executor._set_graph_version('v2')
+    assert cached_versions(path) == []
+    assert executor.read("MATCH (n) RETURN n", {'a': 1}).records == [{'version': 'v2'}]
+    assert len(executor.database_reads) == 2
+    assert cached_versions(path) == ['v2']
+    executor.driver.close()
+
+
+def test_executor_sees_new_version_after_ttl(tmp_path):
+    path = tmp_path / 'cache.sqlite'
+    executor = FakeGraphExecutor(QueryCache(str(path)), cache_ttl=0)
+    executor.read("MATCH (n) RETURN n")
+
+    # Another process restamped the graph; with no TTL the stamp is read again before the query
+    executor.version = 'v2'
+    assert executor.read("MATCH (n) RETURN n").records == [{'version': 'v2'}]
+    assert len(executor.database_reads) == 2
+    assert cached_versions(path) == ['v2']
+    executor.driver.close()
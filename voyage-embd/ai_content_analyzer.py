@@ -9,10 +9,15 @@ import os
 from pathlib import Path
 from typing import List, Dict, Any, Tuple
 import numpy as np
-from sklearn.metrics.pairwise import cosine_similarity
 from sklearn.cluster import DBSCAN
 import pandas as pd
-from voyage_extractor import VoyageAIExtractor, ContentSection
+from voyage_extractor import VoyageAIExtractor
+from section_store import SectionStore
+from profile_manifest import ProfileManifest, build_section_store, MANIFEST_FILE, SECTION_STORE_DIR
+from embedding_cache import EmbeddingCache
+from async_embedding_client import AsyncVoyageClient, aiohttp
+from anchor_registry import AnchorRegistry
+from section_splitter import load_section_headings
 
 class AIContentAnalyzer:
     """Specialized analyzer for AI-related content"""
@@ -35,166 +40,145 @@ class AIContentAnalyzer:
             "intelligent systems", "automated", "algorithmic", "computational thinking"
         ]
         
-    def extract_ai_programs(self, sections: List[ContentSection]) -> List[Dict[str, Any]]:
+        # Keyword anchor sets, embedded once and shared by all scorers
+        self.anchors = AnchorRegistry(voyage_extractor)
+        self.anchors.register('program', [
+            "AI program", "artificial intelligence degree", "machine learning major",
+            "data science program", "computer science AI", "AI concentration",
+            "AI minor", "AI certificate", "AI specialization"
+        ])
+        self.anchors.register('faculty', [
+            "AI researcher", "machine learning expert", "data scientist",
+            "computer scientist", "AI professor", "ML faculty",
+            "artificial intelligence faculty", "AI specialist", "computational researcher"
+        ])
+        self.anchors.register('research', [
+            "AI research center", "machine learning lab", "data science institute",
+            "AI laboratory", "computational research", "AI infrastructure",
+            "high performance computing", "AI computing cluster", "AI research facility"
+        ])
+        self.anchors.register('readiness', [
+            "AI readiness", "artificial intelligence readiness", "AI adoption",
+            "AI integration", "AI strategy", "AI implementation", "AI transformation",
+            "digital readiness", "technology readiness", "AI maturity"
+        ])
+        self.anchors.register('ai_keywords', self.ai_keywords[:5])  # Use top 5 keywords
+        
+    def _relevance_scores(self, store: SectionStore, rows: np.ndarray, anchor_name: str) -> np.ndarray:
+        """
+        Best similarity of each selected section against a named anchor set
+        
+        Args:
+            store: SectionStore with embeddings attached
+            rows: Row indices of the sections to score
+            anchor_name: Registered anchor set to score against
+            
+        Returns:
+            Array of per-section maximum similarities, floored at 0
+        """
+        result = self.anchors.score(anchor_name, store.matrix(rows))
+        return np.maximum(result.max_scores, 0.0)
+    
+    def extract_ai_programs(self, store: SectionStore) -> List[Dict[str, Any]]:
         """
         Extract AI-related academic programs
         
         Args:
-            sections: List of content sections
+            store: SectionStore of content sections
             
         Returns:
             List of AI program information
         """
-        ai_programs = []
+        rows = store.embedded_rows('programs')
+        scores = self._relevance_scores(store, rows, 'program')
         
-        for section in sections:
-            if section.section_type == 'programs' and section.embedding:
-                # Get embeddings for AI program keywords
-                program_keywords = [
-                    "AI program", "artificial intelligence degree", "machine learning major",
-                    "data science program", "computer science AI", "AI concentration",
-                    "AI minor", "AI certificate", "AI specialization"
-                ]
-                
-                keyword_embeddings = self.extractor.get_embeddings(program_keywords)
-                section_embedding = np.array(section.embedding)
-                
-                max_similarity = 0
-                for keyword_emb in keyword_embeddings:
-                    if keyword_emb and any(keyword_emb):
-                        similarity = cosine_similarity([section_embedding], [keyword_emb])[0][0]
-                        max_similarity = max(max_similarity, similarity)
-                
-                if max_similarity > 0.25:  # Lower threshold for programs
-                    ai_programs.append({
-                        'university': section.university,
-                        'content': section.content,
-                        'ai_relevance_score': float(max_similarity),
-                        'metadata': section.metadata
-                    })
+        ai_programs = []
+        for section, max_similarity in zip(store.select(rows), scores):
+            if max_similarity > 0.25:  # Lower threshold for programs
+                ai_programs.append({
+                    'university': section.university,
+                    'content': section.content,
+                    'ai_relevance_score': float(max_similarity),
+                    'metadata': section.metadata
+                })
         
         return sorted(ai_programs, key=lambda x: x['ai_relevance_score'], reverse=True)
     
-    def extract_ai_faculty(self, sections: List[ContentSection]) -> List[Dict[str, Any]]:
+    def extract_ai_faculty(self, store: SectionStore) -> List[Dict[str, Any]]:
         """
         Extract AI-related faculty expertise
         
         Args:
-            sections: List of content sections
+            store: SectionStore of content sections
             
         Returns:
             List of AI faculty information
         """
-        ai_faculty = []
+        rows = store.embedded_rows('faculty')
+        scores = self._relevance_scores(store, rows, 'faculty')
         
-        for section in sections:
-            if section.section_type == 'faculty' and section.embedding:
-                # Get embeddings for AI faculty keywords
-                faculty_keywords = [
-                    "AI researcher", "machine learning expert", "data scientist",
-                    "computer scientist", "AI professor", "ML faculty",
-                    "artificial intelligence faculty", "AI specialist", "computational researcher"
-                ]
-                
-                keyword_embeddings = self.extractor.get_embeddings(faculty_keywords)
-                section_embedding = np.array(section.embedding)
-                
-                max_similarity = 0
-                for keyword_emb in keyword_embeddings:
-                    if keyword_emb and any(keyword_emb):
-                        similarity = cosine_similarity([section_embedding], [keyword_emb])[0][0]
-                        max_similarity = max(max_similarity, similarity)
-                
-                if max_similarity > 0.25:
-                    ai_faculty.append({
-                        'university': section.university,
-                        'content': section.content,
-                        'ai_relevance_score': float(max_similarity),
-                        'metadata': section.metadata
-                    })
+        ai_faculty = []
+        for section, max_similarity in zip(store.select(rows), scores):
+            if max_similarity > 0.25:
+                ai_faculty.append({
+                    'university': section.university,
+                    'content': section.content,
+                    'ai_relevance_score': float(max_similarity),
+                    'metadata': section.metadata
+                })
         
         return sorted(ai_faculty, key=lambda x: x['ai_relevance_score'], reverse=True)
     
-    def extract_ai_research(self, sections: List[ContentSection]) -> List[Dict[str, Any]]:
+    def extract_ai_research(self, store: SectionStore) -> List[Dict[str, Any]]:
         """
         Extract AI-related research centers and infrastructure
         
         Args:
-            sections: List of content sections
+            store: SectionStore of content sections
             
         Returns:
             List of AI research information
         """
-        ai_research = []
+        rows = store.embedded_rows('research')
+        scores = self._relevance_scores(store, rows, 'research')
         
-        for section in sections:
-            if section.section_type == 'research' and section.embedding:
-                # Get embeddings for AI research keywords
-                research_keywords = [
-                    "AI research center", "machine learning lab", "data science institute",
-                    "AI laboratory", "computational research", "AI infrastructure",
-                    "high performance computing", "AI computing cluster", "AI research facility"
-                ]
-                
-                keyword_embeddings = self.extractor.get_embeddings(research_keywords)
-                section_embedding = np.array(section.embedding)
-                
-                max_similarity = 0
-                for keyword_emb in keyword_embeddings:
-                    if keyword_emb and any(keyword_emb):
-                        similarity = cosine_similarity([section_embedding], [keyword_emb])[0][0]
-                        max_similarity = max(max_similarity, similarity)
-                
-                if max_similarity > 0.25:
-                    ai_research.append({
-                        'university': section.university,
-                        'content': section.content,
-                        'ai_relevance_score': float(max_similarity),
-                        'metadata': section.metadata
-                    })
+        ai_research = []
+        for section, max_similarity in zip(store.select(rows), scores):
+            if max_similarity > 0.25:
+                ai_research.append({
+                    'university': section.university,
+                    'content': section.content,
+                    'ai_relevance_score': float(max_similarity),
+                    'metadata': section.metadata
+                })
         
         return sorted(ai_research, key=lambda x: x['ai_relevance_score'], reverse=True)
     
-    def analyze_ai_readiness_patterns(self, sections: List[ContentSection]) -> Dict[str, Any]:
+    def analyze_ai_readiness_patterns(self, store: SectionStore) -> Dict[str, Any]:
         """
         Analyze patterns in AI readiness across universities
         
         Args:
-            sections: List of content sections
+            store: SectionStore of content sections
             
         Returns:
             Dictionary containing AI readiness analysis
         """
-        ai_readiness_sections = [s for s in sections if s.section_type == 'ai_readiness']
+        ai_readiness_sections = [s for s in store if s.section_type == 'ai_readiness']
         
         if not ai_readiness_sections:
             return {"error": "No AI readiness sections found"}
         
-        # Get embeddings for AI readiness keywords
-        readiness_keywords = [
-            "AI readiness", "artificial intelligence readiness", "AI adoption",
-            "AI integration", "AI strategy", "AI implementation", "AI transformation",
-            "digital readiness", "technology readiness", "AI maturity"
-        ]
-        
-        keyword_embeddings = self.extractor.get_embeddings(readiness_keywords)
+        rows = store.embedded_rows('ai_readiness')
+        scores = self._relevance_scores(store, rows, 'readiness')
         
         readiness_scores = []
-        for section in ai_readiness_sections:
-            if section.embedding:
-                section_embedding = np.array(section.embedding)
-                max_similarity = 0
-                
-                for keyword_emb in keyword_embeddings:
-                    if keyword_emb and any(keyword_emb):
-                        similarity = cosine_similarity([section_embedding], [keyword_emb])[0][0]
-                        max_similarity = max(max_similarity, similarity)
-                
-                readiness_scores.append({
-                    'university': section.university,
-                    'readiness_score': float(max_similarity),
-                    'content_preview': section.content[:300] + "..."
-                })
+        for section, max_similarity in zip(store.select(rows), scores):
+            readiness_scores.append({
+                'university': section.university,
+                'readiness_score': float(max_similarity),
+                'content_preview': section.content[:300] + "..."
+            })
         
         # Sort by readiness score
         readiness_scores.sort(key=lambda x: x['readiness_score'], reverse=True)
@@ -216,24 +200,24 @@ class AIContentAnalyzer:
             'bottom_performers': readiness_scores[-10:]
         }
     
-    def cluster_universities_by_ai_focus(self, sections: List[ContentSection]) -> Dict[str, Any]:
+    def cluster_universities_by_ai_focus(self, store: SectionStore) -> Dict[str, Any]:
         """
         Cluster universities by their AI focus using DBSCAN
         
         Args:
-            sections: List of content sections
+            store: SectionStore of content sections
             
         Returns:
             Dictionary containing clustering results
         """
         # Get all sections with embeddings
-        sections_with_embeddings = [s for s in sections if s.embedding]
+        rows = store.embedded_rows()
+        sections_with_embeddings = store.select(rows)
         
         if len(sections_with_embeddings) < 5:
             return {"error": "Insufficient sections with embeddings for clustering"}
         
-        # Create embeddings matrix
-        embeddings_matrix = np.array([s.embedding for s in sections_with_embeddings])
+        embeddings_matrix = store.matrix(rows)
         
         # Use DBSCAN for clustering (handles varying cluster sizes)
         dbscan = DBSCAN(eps=0.3, min_samples=3)
@@ -261,9 +245,7 @@ class AIContentAnalyzer:
                 }
             else:
                 # Calculate cluster centroid
-                cluster_embeddings = [sections_with_embeddings[i].embedding 
-                                    for i, label in enumerate(cluster_labels) if label == cluster_id]
-                centroid = np.mean(cluster_embeddings, axis=0)
+                centroid = embeddings_matrix[cluster_labels == cluster_id].mean(axis=0)
                 
                 cluster_analysis[f'cluster_{cluster_id}'] = {
                     'count': len(cluster_items),
@@ -279,58 +261,51 @@ class AIContentAnalyzer:
             'total_sections': len(sections_with_embeddings)
         }
     
-    def generate_ai_readiness_report(self, sections: List[ContentSection]) -> Dict[str, Any]:
+    def generate_ai_readiness_report(self, store: SectionStore) -> Dict[str, Any]:
         """
         Generate comprehensive AI readiness report
         
         Args:
-            sections: List of content sections
+            store: SectionStore of content sections
             
         Returns:
             Dictionary containing comprehensive AI readiness report
         """
         print("🔍 Analyzing AI programs...")
-        ai_programs = self.extract_ai_programs(sections)
+        ai_programs = self.extract_ai_programs(store)
         
         print("🔍 Analyzing AI faculty...")
-        ai_faculty = self.extract_ai_faculty(sections)
+        ai_faculty = self.extract_ai_faculty(store)
         
         print("🔍 Analyzing AI research...")
-        ai_research = self.extract_ai_research(sections)
+        ai_research = self.extract_ai_research(store)
         
         print("🔍 Analyzing AI readiness patterns...")
-        readiness_patterns = self.analyze_ai_readiness_patterns(sections)
+        readiness_patterns = self.analyze_ai_readiness_patterns(store)
         
         print("🔍 Clustering universities by AI focus...")
-        ai_clusters = self.cluster_universities_by_ai_focus(sections)
+        ai_clusters = self.cluster_universities_by_ai_focus(store)
         
         # Calculate overall AI readiness score for each university
+        # AI relevance of every embedded section, computed in one pass
+        rows = store.embedded_rows()
+        scores = self._relevance_scores(store, rows, 'ai_keywords')
+        
         university_scores = {}
-        for section in sections:
-            if section.embedding:
-                if section.university not in university_scores:
-                    university_scores[section.university] = {
-                        'sections': [],
-                        'total_score': 0,
-                        'section_count': 0
-                    }
-                
-                # Calculate AI relevance for this section
-                section_embedding = np.array(section.embedding)
-                keyword_embeddings = self.extractor.get_embeddings(self.ai_keywords[:5])  # Use top 5 keywords
-                
-                max_similarity = 0
-                for keyword_emb in keyword_embeddings:
-                    if keyword_emb and any(keyword_emb):
-                        similarity = cosine_similarity([section_embedding], [keyword_emb])[0][0]
-                        max_similarity = max(max_similarity, similarity)
-                
-                university_scores[section.university]['sections'].append({
-                    'type': section.section_type,
-                    'ai_score': float(max_similarity)
-                })
-                university_scores[section.university]['total_score'] += max_similarity
-                university_scores[section.university]['section_count'] += 1
+        for section, max_similarity in zip(store.select(rows), scores):
+            if section.university not in university_scores:
+                university_scores[section.university] = {
+                    'sections': [],
+                    'total_score': 0,
+                    'section_count': 0
+                }
+            
+            university_scores[section.university]['sections'].append({
+                'type': section.section_type,
+                'ai_score': float(max_similarity)
+            })
+            university_scores[section.university]['total_score'] += float(max_similarity)
+            university_scores[section.university]['section_count'] += 1
         
         # Calculate average scores
         for university, data in university_scores.items():
@@ -373,8 +348,11 @@ def main():
         print("export VOYAGE_API_KEY='your-api-key-here'")
         return
     
-    # Initialize extractor and analyzer
-    extractor = VoyageAIExtractor(api_key)
+    # Initialize extractor (backed by the on-disk embedding cache) and analyzer
+    cache = EmbeddingCache(os.getenv('VOYAGE_CACHE_DIR', '.embedding_cache'))
+    client = AsyncVoyageClient.from_config(api_key) if aiohttp is not None else None
+    extractor = VoyageAIExtractor(api_key, cache=cache, client=client,
+                                  section_headings=load_section_headings())
     analyzer = AIContentAnalyzer(extractor)
     
     # Get university profile files
@@ -383,39 +361,26 @@ def main():
     
     print(f"🔍 Processing {len(markdown_files)} university profile files...")
     
-    all_sections = []
+    # Re-extract and re-embed only profiles that changed since the last run
+    manifest = ProfileManifest(MANIFEST_FILE)
+    previous_store = SectionStore.load(SECTION_STORE_DIR) if Path(SECTION_STORE_DIR).exists() else None
+    store, changed_universities = build_section_store(extractor, markdown_files, manifest, previous_store)
     
-    # Process each file
-    for i, file_path in enumerate(markdown_files):
-        print(f"\n📚 Processing {i+1}/{len(markdown_files)}: {file_path.stem}")
-        
-        try:
-            sections = extractor.extract_sections(file_path)
-            all_sections.extend(sections)
-            print(f"  ✓ Extracted {len(sections)} content sections")
-        except Exception as e:
-            print(f"  ✗ Error processing {file_path.name}: {e}")
-    
-    if not all_sections:
+    if not len(store):
         print("❌ No content sections extracted")
         return
     
-    print(f"\n🎯 Total sections extracted: {len(all_sections)}")
-    
-    # Get embeddings for all sections
-    print("\n🚀 Generating embeddings with Voyage AI...")
-    texts = [section.content for section in all_sections]
-    embeddings = extractor.get_embeddings(texts)
-    
-    # Assign embeddings to sections
-    for section, embedding in zip(all_sections, embeddings):
-        section.embedding = embedding
+    store.save(SECTION_STORE_DIR)
+    manifest.save()
     
-    print(f"✓ Generated embeddings for {len(all_sections)} sections")
+    print(f"✓ Embeddings ready for {len(store)} sections "
+          f"({len(changed_universities)} universities changed)")
+    cache_stats = cache.stats()
+    print(f"✓ Embedding cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses")
     
     # Generate comprehensive AI readiness report
     print("\n🔬 Generating comprehensive AI readiness report...")
-    ai_report = analyzer.generate_ai_readiness_report(all_sections)
+    ai_report = analyzer.generate_ai_readiness_report(store)
     
     # Save results
     output_file = "ai_readiness_report.json"
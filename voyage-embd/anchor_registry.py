@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Anchor Registry for Keyword Embeddings
+Embeds each named keyword set once per process and keeps it as a normalized matrix
+"""
+
+from typing import List, Dict, Tuple
+
+import numpy as np
+
+from relevance_scoring import RelevanceScores, normalize_rows, score_sections
+
+# Process-wide store of fully embedded anchor sets, keyed by (model_name, keywords)
+_ANCHOR_MATRICES: Dict[Tuple[str, Tuple[str, ...]], np.ndarray] = {}
+
+
+class AnchorRegistry:
+    """Named keyword sets embedded once and reused by every scorer"""
+
+    def __init__(self, voyage_extractor):
+        """
+        Initialize the anchor registry
+
+        Args:
+            voyage_extractor: Initialized VoyageAIExtractor used to embed keywords
+        """
+        self.extractor = voyage_extractor
+        self.keyword_sets: Dict[str, List[str]] = {}
+
+    def register(self, name: str, keywords: List[str]):
+        """
+        Register a named keyword set (embedding is deferred until first use)
+
+        Args:
+            name: Anchor set name, e.g. 'program' or 'readiness'
+            keywords: Keywords making up the anchor set
+        """
+        self.keyword_sets[name] = list(keywords)
+
+    def keywords(self, name: str) -> List[str]:
+        """Return the keywords of a registered anchor set"""
+        return self.keyword_sets[name]
+
+    def anchors(self, name: str) -> Tuple[np.ndarray, List[str]]:
+        """
+        Get the normalized embedding matrix of an anchor set and the keywords of its rows
+
+        Keywords whose embedding failed (zero vectors) are dropped, so every
+        row of the matrix has unit length; anchor indices from scoring refer
+        to the returned keyword list, not to :meth:`keywords`. Only complete
+        sets are memoized, so failed keywords are retried on the next call.
+
+        Args:
+            name: Registered anchor set name
+
+        Returns:
+            (array of shape (n_valid_keywords, dim), keywords aligned with its rows)
+        """
+        key = (self.extractor.model_name, tuple(self.keyword_sets[name]))
+        if key in _ANCHOR_MATRICES:
+            return _ANCHOR_MATRICES[key], list(key[1])
+
+        embeddings = self.extractor.get_embeddings(list(key[1]))
+        valid = [(keyword, e) for keyword, e in zip(key[1], embeddings) if e and any(e)]
+        if not valid:
+            return np.zeros((0, 0), dtype=np.float32), []
+
+        matrix = normalize_rows(np.array([e for _, e in valid]))
+        if len(valid) == len(embeddings):
+            _ANCHOR_MATRICES[key] = matrix
+        return matrix, [keyword for keyword, _ in valid]
+
+    def matrix(self, name: str) -> np.ndarray:
+        """Get the normalized embedding matrix of an anchor set (see :meth:`anchors`)"""
+        return self.anchors(name)[0]
+
+    def score(self, name: str, section_embeddings: np.ndarray, top_k: int = 3) -> RelevanceScores:
+        """
+        Score a matrix of section embeddings against an anchor set
+
+        Args:
+            name: Registered anchor set name
+            section_embeddings: Array of shape (n_sections, dim)
+            top_k: Number of best anchors to report per section
+
+        Returns:
+            RelevanceScores for every section
+        """
+        return score_sections(section_embeddings, self.matrix(name),
+                              top_k=top_k, anchors_normalized=True)
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Async Batched Client for the Voyage AI Embeddings Endpoint
+Sends token-budgeted batches concurrently over a pooled HTTP session
+"""
+
+import asyncio
+import random
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Tuple
+
+try:
+    import aiohttp  # optional: only needed for the async client
+except ImportError:
+    aiohttp = None  # type: ignore
+
+DEFAULT_BASE_URL = "https://api.voyageai.com/v1/embeddings"
+
+# Status codes worth retrying: rate limiting and transient server errors
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+
+class EmbeddingRequestError(Exception):
+    """Raised when a batch still fails after all retries"""
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token estimate (~4 characters per token) used for batch packing"""
+    return len(text) // 4 + 1
+
+
+def pack_batches(texts: List[str], max_batch_tokens: int,
+                 max_batch_size: int) -> List[Tuple[int, List[str]]]:
+    """
+    Pack texts into consecutive batches bounded by a token budget
+
+    Args:
+        texts: Texts to embed, in order
+        max_batch_tokens: Estimated token budget per request
+        max_batch_size: Maximum number of texts per request
+
+    Returns:
+        List of (start_index, batch_texts) tuples covering all texts in order
+    """
+    batches = []
+    start, batch, batch_tokens = 0, [], 0
+
+    for i, text in enumerate(texts):
+        tokens = estimate_tokens(text)
+        if batch and (batch_tokens + tokens > max_batch_tokens or len(batch) >= max_batch_size):
+            batches.append((start, batch))
+            start, batch, batch_tokens = i, [], 0
+        batch.append(text)
+        batch_tokens += tokens
+
+    if batch:
+        batches.append((start, batch))
+    return batches
+
+
+class AsyncVoyageClient:
+    """Concurrent embeddings client with connection pooling and rate-limit backoff"""
+
+    def __init__(self, api_key: str, model_name: str = "voyage-large-2",
+                 base_url: str = DEFAULT_BASE_URL, max_concurrency: int = 4,
+                 max_batch_tokens: int = 100000, max_batch_size: int = 128,
+                 max_retries: int = 5, backoff_base: float = 1.0,
+                 timeout: int = 30):
+        """
+        Initialize the async client
+
+        Args:
+            api_key: Voyage AI API key
+            model_name: Model to use for embeddings
+            base_url: Embeddings endpoint (point at a local stub server for testing)
+            max_concurrency: Maximum number of in-flight requests
+            max_batch_tokens: Estimated token budget per request
+            max_batch_size: Maximum number of texts per request
+            max_retries: Retries per batch on rate limits and transient errors
+            backoff_base: Base delay in seconds for exponential backoff
+            timeout: Request timeout in seconds
+        """
+        if aiohttp is None:
+            raise ImportError("aiohttp is required for AsyncVoyageClient (pip install aiohttp)")
+
+        self.api_key = api_key
+        self.model_name = model_name
+        self.base_url = base_url
+        self.max_concurrency = max_concurrency
+        self.max_batch_tokens = max_batch_tokens
+        self.max_batch_size = max_batch_size
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.timeout = timeout
+        self.headers = {
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json"
+        }
+
+    @classmethod
+    def from_config(cls, api_key: str, config_path: str = "config.yaml") -> "AsyncVoyageClient":
+        """
+        Build a client from the ``voyage_ai`` section of config.yaml
+
+        Args:
+            api_key: Voyage AI API key
+            config_path: Path to the YAML configuration file
+
+        Returns:
+            Configured AsyncVoyageClient
+        """
+        settings: Dict[str, Any] = {}
+        if Path(config_path).exists():
+            import yaml
+            with open(config_path, 'r') as f:
+                settings = (yaml.safe_load(f) or {}).get('voyage_ai', {})
+
+        keys = ['model_name', 'base_url', 'max_concurrency', 'max_batch_tokens',
+                'max_batch_size', 'max_retries', 'backoff_base', 'timeout']
+        return cls(api_key, **{k: settings[k] for k in keys if k in settings})
+
+    def _retry_delay(self, attempt: int, retry_after: Optional[str]) -> float:
+        """Delay before the next attempt, honouring a Retry-After header if present"""
+        if retry_after:
+            try:
+                return max(0.0, float(retry_after))
+            except ValueError:
+                pass
+        return self.backoff_base * (2 ** attempt) * (0.5 + random.random() / 2)
+
+    async def _post_batch(self, session, semaphore: asyncio.Semaphore,
+                          batch: List[str]) -> List[List[float]]:
+        """POST one batch, retrying on rate limits and transient failures"""
+        payload = {"model": self.model_name, "input": batch}
+        last_error: Optional[str] = None
+
+        for attempt in range(self.max_retries + 1):
+            retry_after = None
+            async with semaphore:
+                try:
+                    async with session.post(self.base_url, json=payload) as response:
+                        if response.status == 200:
+                            data = (await response.json())["data"]
+                            data.sort(key=lambda item: item.get("index", 0))
+                            return [item["embedding"] for item in data]
+
+                        last_error = f"HTTP {response.status}: {(await response.text())[:200]}"
+                        if response.status not in RETRYABLE_STATUS:
+                            break
+                        retry_after = response.headers.get("Retry-After")
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    last_error = f"{type(e).__name__}: {e}"
+
+            if attempt < self.max_retries:
+                await asyncio.sleep(self._retry_delay(attempt, retry_after))
+
+        raise EmbeddingRequestError(f"Embedding batch of {len(batch)} texts failed: {last_error}")
+
+    async def embed(self, texts: List[str]) -> List[List[float]]:
+        """
+        Embed texts concurrently, preserving input order
+
+        Args:
+            texts: List of text strings to embed
+
+        Returns:
+            List of embedding vectors aligned with ``texts``
+
+        Raises:
+            EmbeddingRequestError: If any batch fails after all retries
+        """
+        if not texts:
+            return []
+
+        batches = pack_batches(texts, self.max_batch_tokens, self.max_batch_size)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        connector = aiohttp.TCPConnector(limit=self.max_concurrency)
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+
+        async with aiohttp.ClientSession(headers=self.headers, connector=connector,
+                                         timeout=timeout) as session:
+            results = await asyncio.gather(
+                *(self._post_batch(session, semaphore, batch) for _, batch in batches)
+            )
+
+        embeddings: List[List[float]] = [None] * len(texts)  # type: ignore
+        for (start, batch), batch_embeddings in zip(batches, results):
+            if len(batch_embeddings) != len(batch):
+                raise EmbeddingRequestError(
+                    f"Expected {len(batch)} embeddings, got {len(batch_embeddings)}")
+            embeddings[start:start + len(batch)] = batch_embeddings
+
+        print(f"✓ Embedded {len(texts)} texts in {len(batches)} batches "
+              f"(concurrency {self.max_concurrency})")
+        return embeddings
+
+    def embed_sync(self, texts: List[str]) -> List[List[float]]:
+        """Blocking wrapper around :meth:`embed` for synchronous callers"""
+        return asyncio.run(self.embed(texts))
@@ -146,7 +146,11 @@ def show_sample_config():
         },
         "extraction": {
             "min_section_length": 50,
-            "section_patterns": ["overview", "ai_readiness", "programs"]
+            "section_patterns": {
+                "overview": "## Overview",
+                "ai_readiness": "## AI Readiness Assessment",
+                "programs": "## Academic Programs"
+            }
         },
         "analysis": {
             "similarity_threshold": 0.3,
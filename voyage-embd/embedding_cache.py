@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Persistent Embedding Cache for Voyage AI Embeddings
+Content-addressed on-disk cache so repeated runs only embed new or changed text
+"""
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import List, Dict, Any, Optional
+
+import numpy as np
+
+
+class EmbeddingCache:
+    """On-disk cache of embedding vectors keyed by (model_name, text hash)
+
+    Vectors are stored as raw float32 rows in ``vectors.f32`` and read back
+    through ``np.memmap``; ``index.json`` maps each key to its row number and
+    last access time. When the cache grows past ``max_entries`` the least
+    recently used entries are evicted down to ``low_water`` of that limit and
+    the vector file is compacted, so the rewrite happens once per
+    ``(1 - low_water) * max_entries`` new vectors rather than on every write.
+    """
+
+    VECTORS_FILE = "vectors.f32"
+    INDEX_FILE = "index.json"
+
+    def __init__(self, cache_dir: str = ".embedding_cache", max_entries: int = 50000,
+                 low_water: float = 0.9):
+        """
+        Initialize the embedding cache
+
+        Args:
+            cache_dir: Directory holding the vector file and index
+            max_entries: Maximum number of vectors kept before LRU eviction
+            low_water: Fraction of max_entries kept after an eviction
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        self.low_water = low_water
+        self.vectors_path = self.cache_dir / self.VECTORS_FILE
+        self.index_path = self.cache_dir / self.INDEX_FILE
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self.dim: Optional[int] = None
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self._rows = 0
+        self._mmap: Optional[np.memmap] = None
+        self._load_index()
+
+    @staticmethod
+    def make_key(model_name: str, text: str) -> str:
+        """Build the content-addressed key for a text under a given model"""
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        return f"{model_name}:{digest}"
+
+    def _load_index(self):
+        """Load the index from disk, discarding it if it does not match the vector file"""
+        if not self.index_path.exists() or not self.vectors_path.exists():
+            return
+
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                index = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"⚠ Ignoring unreadable embedding cache index: {e}")
+            return
+
+        dim = index.get("dim")
+        if not dim:
+            return
+
+        rows = self.vectors_path.stat().st_size // (4 * dim)
+        entries = index.get("entries", {})
+        if any(entry["row"] >= rows for entry in entries.values()):
+            print("⚠ Embedding cache index is out of sync with vector file, starting fresh")
+            return
+
+        self.dim = dim
+        self._rows = rows
+        self.entries = entries
+
+    def _vectors(self) -> np.memmap:
+        """Return a read-only memory map over all stored rows"""
+        if self._mmap is None or self._mmap.shape[0] != self._rows:
+            self._mmap = np.memmap(self.vectors_path, dtype=np.float32, mode="r",
+                                   shape=(self._rows, self.dim))
+        return self._mmap
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def get_many(self, model_name: str, texts: List[str]) -> List[Optional[List[float]]]:
+        """
+        Look up cached embeddings for a list of texts
+
+        Args:
+            model_name: Embedding model the vectors were produced with
+            texts: Texts to look up
+
+        Returns:
+            List aligned with ``texts`` holding a vector or None on a miss
+        """
+        results: List[Optional[List[float]]] = []
+        now = time.time()
+
+        for text in texts:
+            entry = self.entries.get(self.make_key(model_name, text))
+            if entry is None:
+                self.misses += 1
+                results.append(None)
+                continue
+
+            self.hits += 1
+            entry["last_used"] = now
+            results.append(self._vectors()[entry["row"]].tolist())
+
+        return results
+
+    def put_many(self, model_name: str, texts: List[str], embeddings: List[List[float]]):
+        """
+        Store embeddings for a list of texts
+
+        Args:
+            model_name: Embedding model the vectors were produced with
+            texts: Texts that were embedded
+            embeddings: Embedding vectors aligned with ``texts``
+        """
+        new_rows = []
+        now = time.time()
+
+        for text, embedding in zip(texts, embeddings):
+            key = self.make_key(model_name, text)
+            if key in self.entries:
+                continue
+
+            vector = np.asarray(embedding, dtype=np.float32)
+            if self.dim is None:
+                self.dim = int(vector.shape[0])
+            if vector.shape[0] != self.dim:
+                print(f"⚠ Skipping cache write for vector of dim {vector.shape[0]} (cache dim {self.dim})")
+                continue
+
+            self.entries[key] = {"row": self._rows + len(new_rows), "last_used": now}
+            new_rows.append(vector)
+
+        if not new_rows:
+            return
+
+        with open(self.vectors_path, "ab") as f:
+            f.write(np.vstack(new_rows).tobytes())
+        self._rows += len(new_rows)
+
+        if len(self.entries) > self.max_entries:
+            self._evict()
+
+        self.flush()
+
+    def _evict(self):
+        """Drop least recently used entries down to the low-water mark and compact the vector file"""
+        keep = sorted(self.entries.items(), key=lambda item: item[1]["last_used"], reverse=True)
+        keep = keep[:int(self.max_entries * self.low_water)]
+        self.evictions += len(self.entries) - len(keep)
+
+        vectors = self._vectors()
+        rows = np.array([entry["row"] for _, entry in keep], dtype=np.int64)
+        compacted = np.ascontiguousarray(vectors[np.sort(rows)])
+        remap = {int(old): new for new, old in enumerate(np.sort(rows))}
+
+        tmp_path = self.vectors_path.with_suffix(".tmp")
+        compacted.tofile(tmp_path)
+        self._mmap = None
+        os.replace(tmp_path, self.vectors_path)
+
+        self.entries = {key: {"row": remap[entry["row"]], "last_used": entry["last_used"]}
+                        for key, entry in keep}
+        self._rows = len(self.entries)
+
+    def flush(self):
+        """Write the index to disk atomically"""
+        tmp_path = self.index_path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"dim": self.dim, "entries": self.entries}, f)
+        os.replace(tmp_path, self.index_path)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and current size"""
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self.entries),
+            'max_entries': self.max_entries,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'size_bytes': self._rows * 4 * (self.dim or 0)
+        }
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Profile Manifest for Incremental Runs
+Tracks per-file hashes so only changed profiles are re-extracted, and only changed sections re-embedded
+"""
+
+import hashlib
+import json
+import os
+import sys
+from functools import partial
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Tuple
+
+import numpy as np
+
+from section_store import SectionStore
+
+# Shared profile-ingestion runner lives in the parent project's src/utils
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from src.utils.profile_ingestion import ingest_profiles
+
+# Shared state files used by voyage_extractor.py and ai_content_analyzer.py
+MANIFEST_FILE = "profile_manifest.json"
+SECTION_STORE_DIR = "section_store"
+
+
+def file_hash(path: Path) -> str:
+    """SHA-256 of a file's bytes"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def section_hash(section) -> str:
+    """SHA-256 of a section's type and content"""
+    return hashlib.sha256(f"{section.section_type}\0{section.content}".encode('utf-8')).hexdigest()
+
+
+class ProfileManifest:
+    """Per-file mtime, size and content hash
+
+    Section-level reuse needs no manifest state: build_section_store matches
+    section hashes against the sections of the previous SectionStore.
+    """
+
+    def __init__(self, path: str = MANIFEST_FILE):
+        """
+        Initialize the manifest, loading it from disk if present
+
+        Args:
+            path: JSON file the manifest is stored in
+        """
+        self.path = Path(path)
+        self.files: Dict[str, Dict[str, Any]] = {}
+        if self.path.exists():
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    self.files = json.load(f).get('files', {})
+            except (OSError, ValueError) as e:
+                print(f"⚠ Ignoring unreadable manifest {self.path}: {e}")
+
+    def is_unchanged(self, file_path: Path) -> bool:
+        """
+        Whether a profile matches its manifest entry
+
+        mtime and size are checked first; the content hash is only computed
+        when they differ, so touched-but-identical files still count as unchanged.
+        """
+        entry = self.files.get(str(file_path))
+        if entry is None:
+            return False
+
+        stat = os.stat(file_path)
+        if stat.st_mtime == entry['mtime'] and stat.st_size == entry['size']:
+            return True
+        if stat.st_size != entry['size'] or file_hash(file_path) != entry['sha256']:
+            return False
+
+        entry['mtime'] = stat.st_mtime
+        return True
+
+    def record(self, file_path: Path):
+        """Store the current state of a profile"""
+        stat = os.stat(file_path)
+        self.files[str(file_path)] = {
+            'mtime': stat.st_mtime,
+            'size': stat.st_size,
+            'sha256': file_hash(file_path)
+        }
+
+    def prune(self, file_paths: List[Path]) -> List[str]:
+        """Drop entries for profiles that no longer exist; returns the removed paths"""
+        keep = {str(p) for p in file_paths}
+        removed = [p for p in self.files if p not in keep]
+        for p in removed:
+            del self.files[p]
+        return removed
+
+    def save(self):
+        """Write the manifest to disk"""
+        with open(self.path, 'w', encoding='utf-8') as f:
+            json.dump({'files': self.files}, f, indent=2)
+
+
+def build_section_store(extractor, markdown_files: List[Path], manifest: ProfileManifest,
+                        previous_store: Optional[SectionStore] = None,
+                        workers: Optional[int] = None) -> Tuple[SectionStore, List[str]]:
+    """
+    Build an embedded SectionStore, reusing everything unchanged since the last run
+
+    Unchanged profiles keep their previous sections and embeddings. Changed
+    profiles are re-extracted in parallel worker processes, and only sections
+    whose hash is new are sent to the embeddings API. A profile that fails to
+    parse keeps its previous sections and is retried on the next run.
+
+    Args:
+        extractor: VoyageAIExtractor used for extraction and embedding
+        markdown_files: Profile files to include
+        manifest: Manifest from the previous run (updated in place)
+        previous_store: SectionStore saved by the previous run, if any
+        workers: Extraction processes (None = PROFILE_WORKERS or CPU count)
+
+    Returns:
+        (store, changed_universities)
+    """
+    from voyage_extractor import extract_profile_sections
+
+    previous_by_file: Dict[str, List[Any]] = {}
+    previous_vectors: Dict[str, np.ndarray] = {}
+    if previous_store is not None and previous_store.has_embeddings:
+        for section in previous_store:
+            file_key = (section.metadata or {}).get('file_path')
+            previous_by_file.setdefault(file_key, []).append(section)
+            # Zero vectors mark failed embedding batches: leave them out so the section is re-embedded
+            vector = previous_store.embeddings[section.row]
+            if vector.any():
+                previous_vectors[section_hash(section)] = vector
+
+    removed = manifest.prune(markdown_files)
+    changed_universities = sorted({s.university for p in removed for s in previous_by_file.get(p, [])})
+
+    changed_files = [p for p in markdown_files
+                     if not (str(p) in previous_by_file and manifest.is_unchanged(p))]
+    print(f"\n📚 Extracting {len(changed_files)}/{len(markdown_files)} changed profiles")
+    parse = partial(extract_profile_sections, splitter=extractor.splitter)
+    extracted = {str(r.path): r for r in ingest_profiles(changed_files, parse, workers)}
+
+    all_sections = []
+    for file_path in markdown_files:
+        key = str(file_path)
+        if key not in extracted:
+            all_sections.extend(previous_by_file[key])
+            continue
+
+        result = extracted[key]
+        if not result.ok:
+            # Keep the last good sections; the manifest entry stays stale so the next run retries
+            kept = previous_by_file.get(key, [])
+            all_sections.extend(kept)
+            print(f"  ✗ Error processing {file_path.name}: {result.error} (kept {len(kept)} previous sections)")
+            continue
+
+        sections = result.value
+        manifest.record(file_path)
+        all_sections.extend(sections)
+        changed_universities.extend(s.university for s in sections[:1])
+        print(f"  ✓ {file_path.stem}: extracted {len(sections)} content sections")
+
+    # Rows are reassigned by the new store; reused sections keep their vectors
+    hashes = [section_hash(s) for s in all_sections]
+    store = SectionStore(all_sections)
+    if not len(store):
+        return store, changed_universities
+
+    missing = [i for i, h in enumerate(hashes) if h not in previous_vectors]
+    print(f"\n🎯 Sections: {len(store)} total, {len(missing)} new or changed")
+
+    new_embeddings = extractor.get_embeddings([all_sections[i].content for i in missing]) if missing else []
+    fetched = dict(zip(missing, new_embeddings))
+
+    store.set_embeddings([fetched[i] if i in fetched else previous_vectors[h] for i, h in enumerate(hashes)])
+    return store, sorted(set(changed_universities))
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Vectorized Relevance Scoring
+Scores every section against every anchor keyword with a single matrix product
+"""
+
+from dataclasses import dataclass
+from typing import List
+
+import numpy as np
+
+
+def normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """L2-normalize the rows of a matrix, leaving all-zero rows as zeros"""
+    matrix = np.asarray(matrix, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return np.divide(matrix, norms, out=np.zeros_like(matrix), where=norms > 0)
+
+
+@dataclass
+class RelevanceScores:
+    """Per-section similarity results against an anchor matrix"""
+    max_scores: np.ndarray       # (n_sections,) best cosine similarity
+    best_anchor: np.ndarray      # (n_sections,) index of the best anchor
+    top_k_anchors: np.ndarray    # (n_sections, k) anchor indices, best first
+    top_k_scores: np.ndarray     # (n_sections, k) matching similarities
+
+    def above(self, threshold: float) -> np.ndarray:
+        """Boolean mask of sections whose best score exceeds the threshold"""
+        return self.max_scores > threshold
+
+
+def embedding_matrix(embeddings: List[List[float]]) -> np.ndarray:
+    """Stack a list of embedding vectors into a float32 matrix"""
+    if not len(embeddings):
+        return np.zeros((0, 0), dtype=np.float32)
+    return np.asarray(embeddings, dtype=np.float32)
+
+
+def score_sections(section_embeddings: np.ndarray, anchors: np.ndarray,
+                   top_k: int = 3, anchors_normalized: bool = False) -> RelevanceScores:
+    """
+    Compute cosine similarity of all sections against all anchors at once
+
+    Args:
+        section_embeddings: Array of shape (n_sections, dim)
+        anchors: Array of shape (n_anchors, dim)
+        top_k: Number of best anchors to report per section
+        anchors_normalized: Skip normalizing anchors (e.g. AnchorRegistry matrices)
+
+    Returns:
+        RelevanceScores with per-section max, argmax and top-k anchors
+    """
+    n_sections = len(section_embeddings)
+    n_anchors = len(anchors)
+    k = max(0, min(top_k, n_anchors))
+
+    if n_sections == 0 or n_anchors == 0:
+        return RelevanceScores(
+            max_scores=np.zeros(n_sections, dtype=np.float32),
+            best_anchor=np.full(n_sections, -1, dtype=np.int64),
+            top_k_anchors=np.zeros((n_sections, 0), dtype=np.int64),
+            top_k_scores=np.zeros((n_sections, 0), dtype=np.float32)
+        )
+
+    sections = normalize_rows(section_embeddings)
+    if not anchors_normalized:
+        anchors = normalize_rows(anchors)
+
+    similarities = sections @ anchors.T
+
+    best_anchor = similarities.argmax(axis=1)
+    max_scores = similarities[np.arange(n_sections), best_anchor]
+
+    # Partial sort for the top-k, then order those k columns by score
+    if k < n_anchors:
+        top = np.argpartition(-similarities, k - 1, axis=1)[:, :k]
+    else:
+        top = np.tile(np.arange(n_anchors), (n_sections, 1))
+    top_scores = np.take_along_axis(similarities, top, axis=1)
+    order = np.argsort(-top_scores, axis=1)
+
+    return RelevanceScores(
+        max_scores=max_scores,
+        best_anchor=best_anchor,
+        top_k_anchors=np.take_along_axis(top, order, axis=1),
+        top_k_scores=np.take_along_axis(top_scores, order, axis=1)
+    )
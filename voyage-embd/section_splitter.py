@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Single-Pass Markdown Section Splitter
+Indexes every heading once and slices section bodies out by offset
+"""
+
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Dict, Tuple
+
+# Any line starting with '#' is a heading and ends the previous section body
+HEADING_RE = re.compile(r'^(#+)[ \t]*(.*?)[ \t]*$', re.MULTILINE)
+
+# section_type -> heading spec ("<min hashes> <title>"); mirrors config.yaml
+DEFAULT_SECTION_HEADINGS = {
+    'overview': '## Overview',
+    'ai_readiness': '## AI Readiness Assessment',
+    'programs': '## Academic Programs',
+    'faculty': '## Faculty Expertise',
+    'research': '## Research Centers and Infrastructure',
+    'technology': '## Technology Integration',
+    'strategic': '## Strategic Recommendations',
+    'references': '#### Works cited',
+}
+
+
+def load_section_headings(config_path: str = "config.yaml") -> Dict[str, str]:
+    """Read extraction.section_patterns from config.yaml, falling back to the defaults"""
+    if Path(config_path).exists():
+        import yaml
+        with open(config_path, 'r') as f:
+            patterns = ((yaml.safe_load(f) or {}).get('extraction') or {}).get('section_patterns')
+        if isinstance(patterns, dict) and patterns:
+            return patterns
+    return dict(DEFAULT_SECTION_HEADINGS)
+
+
+@dataclass
+class Heading:
+    """A markdown heading and the offsets of the body that follows it"""
+    level: int
+    title: str
+    start: int       # offset of the heading line
+    body_start: int  # offset just past the heading line
+    body_end: int    # offset of the next heading (or end of text)
+
+
+def normalize_title(title: str) -> str:
+    """Heading text without bold markers, lowercased"""
+    return title.strip().strip('*').strip().lower()
+
+
+def parse_heading_spec(spec: str) -> Tuple[int, str]:
+    """Split a heading spec like '## Overview' into (min_level, normalized title)"""
+    hashes = len(spec) - len(spec.lstrip('#'))
+    return hashes, normalize_title(spec[hashes:])
+
+
+def index_headings(content: str) -> List[Heading]:
+    """
+    Walk the markdown once and index every heading with its body offsets
+
+    Args:
+        content: Markdown text
+
+    Returns:
+        Headings in document order
+    """
+    matches = list(HEADING_RE.finditer(content))
+    headings = []
+    for k, match in enumerate(matches):
+        body_end = matches[k + 1].start() if k + 1 < len(matches) else len(content)
+        headings.append(Heading(
+            level=len(match.group(1)),
+            title=match.group(2),
+            start=match.start(),
+            body_start=min(match.end() + 1, body_end),
+            body_end=body_end
+        ))
+    return headings
+
+
+class SectionSplitter:
+    """Maps headings to section types and extracts their bodies in one pass"""
+
+    def __init__(self, section_headings: Dict[str, str] = None):
+        """
+        Initialize the splitter
+
+        Args:
+            section_headings: Mapping of section_type to heading spec, e.g.
+                {'overview': '## Overview'}; a heading matches when its
+                normalized title is equal and it has at least that many '#'
+        """
+        section_headings = section_headings or DEFAULT_SECTION_HEADINGS
+        self.section_types = list(section_headings)
+        self.by_title: Dict[str, List[Tuple[str, int]]] = {}
+        for section_type, spec in section_headings.items():
+            min_level, title = parse_heading_spec(spec)
+            self.by_title.setdefault(title, []).append((section_type, min_level))
+
+    def split(self, content: str) -> Dict[str, str]:
+        """
+        Extract the body of the first heading matching each section type
+
+        Args:
+            content: Markdown text
+
+        Returns:
+            Mapping of section_type to stripped body text, in mapping order
+        """
+        found: Dict[str, str] = {}
+        headings = index_headings(content)
+        for k, heading in enumerate(headings):
+            for section_type, min_level in self.by_title.get(normalize_title(heading.title), []):
+                if heading.level < min_level or section_type in found:
+                    continue
+                body = content[heading.body_start:heading.body_end]
+                # A heading directly followed by a subheading takes that
+                # subheading and its body instead of coming back empty
+                if not body.strip() and k + 1 < len(headings):
+                    body = content[headings[k + 1].start:headings[k + 1].body_end]
+                found[section_type] = body.strip()
+
+        return {t: found[t] for t in self.section_types if t in found}
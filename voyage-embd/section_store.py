@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Columnar Section Store
+Keeps section records alongside one contiguous float32 embedding matrix
+"""
+
+import json
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Iterator
+
+import numpy as np
+
+
+class SectionStore:
+    """Content sections plus a single (n_sections, dim) float32 embedding matrix
+
+    Each section carries ``row``, its index into :attr:`embeddings`, so
+    analyzers slice the matrix directly instead of rebuilding arrays from
+    per-section lists.
+    """
+
+    EMBEDDINGS_FILE = "embeddings.npy"
+    SECTIONS_FILE = "sections.json"
+
+    def __init__(self, sections: Optional[List[Any]] = None):
+        """
+        Initialize the store
+
+        Args:
+            sections: Optional ContentSection objects to add
+        """
+        self.sections: List[Any] = []
+        self.embeddings: Optional[np.ndarray] = None
+        for section in sections or []:
+            self.add(section)
+
+    def add(self, section):
+        """Append a section and assign its row index"""
+        if self.embeddings is not None:
+            raise ValueError("Cannot add sections after embeddings have been set")
+        section.row = len(self.sections)
+        self.sections.append(section)
+
+    def __len__(self) -> int:
+        return len(self.sections)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.sections)
+
+    def __getitem__(self, row: int):
+        return self.sections[row]
+
+    @property
+    def has_embeddings(self) -> bool:
+        """Whether an embedding matrix is attached"""
+        return self.embeddings is not None and len(self.sections) > 0
+
+    def set_embeddings(self, embeddings):
+        """
+        Attach embeddings for all sections as one contiguous float32 matrix
+
+        Args:
+            embeddings: Array or list of vectors aligned with section rows
+        """
+        matrix = np.ascontiguousarray(np.asarray(embeddings, dtype=np.float32))
+        if matrix.ndim != 2 or matrix.shape[0] != len(self.sections):
+            raise ValueError(f"Expected {len(self.sections)} embedding rows, got shape {matrix.shape}")
+        self.embeddings = matrix
+
+    def embedded_rows(self, section_type: Optional[str] = None) -> np.ndarray:
+        """
+        Row indices of sections that have embeddings
+
+        Args:
+            section_type: Optional section type to filter on
+
+        Returns:
+            Integer array of row indices (empty if no embeddings are attached)
+        """
+        if not self.has_embeddings:
+            return np.zeros(0, dtype=np.int64)
+        if section_type is None:
+            return np.arange(len(self.sections))
+        return np.array([s.row for s in self.sections if s.section_type == section_type],
+                        dtype=np.int64)
+
+    def select(self, rows: np.ndarray) -> List[Any]:
+        """Sections at the given row indices, in order"""
+        return [self.sections[row] for row in rows]
+
+    def matrix(self, rows: Optional[np.ndarray] = None) -> np.ndarray:
+        """Embedding matrix, optionally restricted to the given rows"""
+        if rows is None:
+            return self.embeddings
+        return self.embeddings[rows]
+
+    def save(self, directory: str):
+        """
+        Save embeddings as .npy and section records as a JSON sidecar
+
+        Args:
+            directory: Output directory (created if missing)
+        """
+        out_dir = Path(directory)
+        out_dir.mkdir(parents=True, exist_ok=True)
+
+        records = [{
+            'university': s.university,
+            'section_type': s.section_type,
+            'content': s.content,
+            'metadata': s.metadata
+        } for s in self.sections]
+
+        with open(out_dir / self.SECTIONS_FILE, 'w', encoding='utf-8') as f:
+            json.dump(records, f, ensure_ascii=False)
+        if self.embeddings is not None:
+            np.save(out_dir / self.EMBEDDINGS_FILE, self.embeddings)
+
+    @classmethod
+    def load(cls, directory: str, mmap: bool = False) -> "SectionStore":
+        """
+        Load a store written by :meth:`save`
+
+        Args:
+            directory: Directory containing the .npy file and JSON sidecar
+            mmap: Memory-map the embedding matrix instead of reading it
+
+        Returns:
+            Populated SectionStore
+        """
+        from voyage_extractor import ContentSection
+
+        in_dir = Path(directory)
+        with open(in_dir / cls.SECTIONS_FILE, 'r', encoding='utf-8') as f:
+            records: List[Dict[str, Any]] = json.load(f)
+
+        store = cls([ContentSection(**record) for record in records])
+
+        embeddings_path = in_dir / cls.EMBEDDINGS_FILE
+        if embeddings_path.exists():
+            store.embeddings = np.load(embeddings_path, mmap_mode='r' if mmap else None)
+        return store
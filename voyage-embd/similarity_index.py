@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+"""
+Similarity Search over Section Embeddings
+Top-k neighbours per section and top-k global pairs without an N x N matrix
+"""
+
+import heapq
+from typing import List, Tuple, Optional
+
+import numpy as np
+
+from relevance_scoring import normalize_rows
+
+try:
+    import hnswlib  # optional: approximate backend for very large corpora
+except ImportError:
+    hnswlib = None  # type: ignore
+
+# Above this many sections the 'auto' backend switches to HNSW when available
+HNSW_AUTO_THRESHOLD = 50000
+
+
+def pairs_from_neighbors(indices: np.ndarray, scores: np.ndarray, k: int) -> List[Tuple[int, int, float]]:
+    """
+    Derive the top-k global pairs from per-section neighbour lists
+
+    Any pair in the global top-k is also within the top-k neighbours of both
+    its endpoints, so merging k-NN lists is exact when the lists are exact.
+
+    Args:
+        indices: (n, k) neighbour indices, -1 for padding
+        scores: (n, k) neighbour similarities
+        k: Number of pairs to return
+
+    Returns:
+        List of (i, j, similarity) with i < j, best first
+    """
+    best = {}
+    for i in range(indices.shape[0]):
+        for j, score in zip(indices[i], scores[i]):
+            if j < 0:
+                continue
+            pair = (min(i, int(j)), max(i, int(j)))
+            if pair not in best:
+                best[pair] = float(score)
+
+    ranked = sorted(best.items(), key=lambda item: (-item[1], item[0]))
+    return [(i, j, score) for (i, j), score in ranked[:k]]
+
+
+def streaming_top_pairs(embeddings: np.ndarray, k: int,
+                        tile_size: int = 512) -> List[Tuple[int, int, float]]:
+    """
+    Exact top-k most similar pairs computed tile by tile
+
+    Only one (tile_size x tile_size) block of similarities and a heap of k
+    pairs are alive at any time, so peak memory is O(tile_size^2 + k)
+    rather than O(n^2). Ties are broken by (i, j) ascending, matching a
+    stable sort over all pairs enumerated in row-major order.
+
+    Args:
+        embeddings: (n, dim) embedding matrix
+        k: Number of pairs to return
+        tile_size: Rows per tile
+
+    Returns:
+        List of (i, j, similarity) with i < j, best first
+    """
+    if k <= 0:
+        return []
+
+    vectors = normalize_rows(embeddings).astype(np.float64)
+    n = vectors.shape[0]
+    # Min-heap of (score, -i, -j): the root is the current worst kept pair
+    heap: List[Tuple[float, int, int]] = []
+
+    for row_start in range(0, n, tile_size):
+        row_stop = min(row_start + tile_size, n)
+        for col_start in range(row_start, n, tile_size):
+            col_stop = min(col_start + tile_size, n)
+            block = vectors[row_start:row_stop] @ vectors[col_start:col_stop].T
+
+            # Keep only pairs with i < j
+            rows = np.arange(row_start, row_stop)[:, np.newaxis]
+            cols = np.arange(col_start, col_stop)[np.newaxis, :]
+            block[rows >= cols] = -np.inf
+
+            # Candidates: valid pairs at or above the tile's k-th best and the heap floor.
+            # A tile with fewer than k valid pairs has a -inf threshold, so every valid pair qualifies
+            flat = block.ravel()
+            kth = min(k, flat.size) - 1
+            threshold = np.partition(flat, flat.size - 1 - kth)[flat.size - 1 - kth]
+            if len(heap) == k:
+                threshold = max(threshold, heap[0][0])
+
+            for pos in np.flatnonzero((flat >= threshold) & np.isfinite(flat)):
+                i = row_start + pos // block.shape[1]
+                j = col_start + pos % block.shape[1]
+                item = (float(flat[pos]), -int(i), -int(j))
+                if len(heap) < k:
+                    heapq.heappush(heap, item)
+                elif item > heap[0]:
+                    heapq.heapreplace(heap, item)
+
+    ranked = sorted(heap, reverse=True)
+    return [(-neg_i, -neg_j, score) for score, neg_i, neg_j in ranked]
+
+
+def pairwise_mean_similarity(embeddings: np.ndarray) -> np.ndarray:
+    """
+    Mean cosine similarity of each row to all rows (itself included)
+
+    Equivalent to ``cosine_similarity(embeddings).mean(axis=1)`` but computed
+    in O(n * dim) from the sum of the normalized vectors.
+    """
+    vectors = normalize_rows(embeddings).astype(np.float64)
+    return vectors @ vectors.sum(axis=0) / max(vectors.shape[0], 1)
+
+
+def write_similarity_matrix(embeddings: np.ndarray, path: str, tile_size: int = 512) -> str:
+    """
+    Write the full cosine similarity matrix to a .npy file tile by tile
+
+    Args:
+        embeddings: (n, dim) embedding matrix
+        path: Output .npy path
+        tile_size: Rows written per step
+
+    Returns:
+        The output path
+    """
+    vectors = normalize_rows(embeddings)
+    n = vectors.shape[0]
+    out = np.lib.format.open_memmap(path, mode='w+', dtype=np.float32, shape=(n, n))
+    for start in range(0, n, tile_size):
+        stop = min(start + tile_size, n)
+        out[start:stop] = vectors[start:stop] @ vectors.T
+    out.flush()
+    del out
+    return str(path)
+
+
+class BruteForceIndex:
+    """Exact cosine search computed block by block"""
+
+    def __init__(self, embeddings: np.ndarray, block_size: int = 1024):
+        """
+        Build the index
+
+        Args:
+            embeddings: (n, dim) embedding matrix
+            block_size: Number of query rows scored per block
+        """
+        self.vectors = normalize_rows(embeddings)
+        self.block_size = block_size
+
+    def __len__(self) -> int:
+        return self.vectors.shape[0]
+
+    def query(self, queries: np.ndarray, k: int,
+              exclude: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Top-k most similar indexed vectors for each query
+
+        Args:
+            queries: (m, dim) query vectors
+            k: Number of neighbours per query
+            exclude: Optional (m,) index to exclude per query (e.g. itself)
+
+        Returns:
+            (indices, scores) arrays of shape (m, k), best first
+        """
+        queries = normalize_rows(queries)
+        n = len(self)
+        k = min(k, n - (1 if exclude is not None else 0))
+        m = queries.shape[0]
+        out_idx = np.full((m, max(k, 0)), -1, dtype=np.int64)
+        out_scores = np.zeros((m, max(k, 0)), dtype=np.float32)
+        if k <= 0:
+            return out_idx, out_scores
+
+        for start in range(0, m, self.block_size):
+            stop = min(start + self.block_size, m)
+            block = queries[start:stop] @ self.vectors.T
+            if exclude is not None:
+                block[np.arange(stop - start), exclude[start:stop]] = -np.inf
+
+            top = np.argpartition(-block, k - 1, axis=1)[:, :k]
+            top_scores = np.take_along_axis(block, top, axis=1)
+            order = np.lexsort((top, -top_scores), axis=1)
+            out_idx[start:stop] = np.take_along_axis(top, order, axis=1)
+            out_scores[start:stop] = np.take_along_axis(top_scores, order, axis=1)
+
+        return out_idx, out_scores
+
+    def knn(self, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Top-k neighbours of every indexed section, excluding itself"""
+        return self.query(self.vectors, k, exclude=np.arange(len(self)))
+
+    def top_pairs(self, k: int) -> List[Tuple[int, int, float]]:
+        """Top-k most similar distinct pairs (i < j), best first"""
+        return streaming_top_pairs(self.vectors, k, tile_size=self.block_size)
+
+
+class HNSWIndex:
+    """Approximate cosine search backed by hnswlib"""
+
+    def __init__(self, embeddings: np.ndarray, ef_construction: int = 200,
+                 m: int = 16, ef_search: int = 100):
+        """
+        Build the index
+
+        Args:
+            embeddings: (n, dim) embedding matrix
+            ef_construction: HNSW build-time candidate list size
+            m: HNSW graph degree
+            ef_search: Query-time candidate list size (raised to k if smaller)
+        """
+        if hnswlib is None:
+            raise ImportError("hnswlib is required for the HNSW backend (pip install hnswlib)")
+
+        vectors = normalize_rows(embeddings)
+        self.ef_search = ef_search
+        self.index = hnswlib.Index(space='cosine', dim=vectors.shape[1])
+        self.index.init_index(max_elements=vectors.shape[0], ef_construction=ef_construction, M=m)
+        self.index.add_items(vectors, np.arange(vectors.shape[0]))
+        self.vectors = vectors
+
+    def __len__(self) -> int:
+        return self.vectors.shape[0]
+
+    def query(self, queries: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Approximate top-k most similar indexed vectors for each query"""
+        k = min(k, len(self))
+        self.index.set_ef(max(self.ef_search, k))
+        labels, distances = self.index.knn_query(normalize_rows(queries), k=k)
+        return labels.astype(np.int64), (1.0 - distances).astype(np.float32)
+
+    def knn(self, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Approximate top-k neighbours of every indexed section, excluding itself"""
+        labels, scores = self.query(self.vectors, k + 1)
+        rows = np.arange(len(self))[:, np.newaxis]
+        keep = labels != rows
+
+        # Drop the self match (or the last column if self was not returned)
+        out_idx = np.full((len(self), k), -1, dtype=np.int64)
+        out_scores = np.zeros((len(self), k), dtype=np.float32)
+        for i in range(len(self)):
+            idx, sc = labels[i][keep[i]][:k], scores[i][keep[i]][:k]
+            out_idx[i, :len(idx)] = idx
+            out_scores[i, :len(sc)] = sc
+        return out_idx, out_scores
+
+    def top_pairs(self, k: int) -> List[Tuple[int, int, float]]:
+        """Approximate top-k most similar distinct pairs (i < j), best first"""
+        indices, scores = self.knn(k)
+        return pairs_from_neighbors(indices, scores, k)
+
+
+def build_similarity_index(embeddings: np.ndarray, backend: str = 'auto', **kwargs):
+    """
+    Build a similarity index over section embeddings
+
+    Args:
+        embeddings: (n, dim) embedding matrix
+        backend: 'brute', 'hnsw' or 'auto' (HNSW for very large corpora when installed)
+        **kwargs: Backend-specific options
+
+    Returns:
+        BruteForceIndex or HNSWIndex
+    """
+    if backend == 'auto':
+        use_hnsw = hnswlib is not None and embeddings.shape[0] >= HNSW_AUTO_THRESHOLD
+        backend = 'hnsw' if use_hnsw else 'brute'
+
+    if backend == 'brute':
+        return BruteForceIndex(embeddings, **kwargs)
+    if backend == 'hnsw':
+        return HNSWIndex(embeddings, **kwargs)
+    raise ValueError(f"Unknown similarity index backend: {backend}")
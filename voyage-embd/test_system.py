@@ -141,6 +141,232 @@ def test_university_profiles_access():
         print(f"  Expected path: {profiles_dir.absolute()}")
         return False
 
+def exact_top_pairs(embeddings, k):
+    """Top-k pairs (i < j) from the full similarity matrix, ties by (i, j) ascending"""
+    import numpy as np
+    from relevance_scoring import normalize_rows
+
+    vectors = normalize_rows(embeddings).astype(np.float64)
+    similarity = vectors @ vectors.T
+    rows, cols = np.triu_indices(len(vectors), k=1)
+    scores = similarity[rows, cols]
+    order = np.lexsort((cols, rows, -scores))[:k]
+    return [(int(rows[p]), int(cols[p]), float(scores[p])) for p in order]
+
+def same_pairs(actual, expected):
+    """Whether two (i, j, score) lists name the same pairs in order with matching scores"""
+    import numpy as np
+
+    return (len(actual) == len(expected)
+            and all(a[:2] == e[:2] for a, e in zip(actual, expected))
+            and np.allclose([a[2] for a in actual], [e[2] for e in expected], atol=1e-5))
+
+def test_streaming_top_pairs():
+    """Test streaming top-k pairs against the full similarity matrix"""
+    print("\n🔍 Testing streaming top-k pairs...")
+
+    import numpy as np
+    from similarity_index import streaming_top_pairs
+
+    rng = np.random.default_rng(0)
+    # Fewer pairs than k, a single partial tile, and sizes that are not a multiple of the tile
+    cases = [(2, 20, 512), (5, 20, 512), (6, 20, 512), (6, 20, 4), (37, 20, 8), (100, 50, 32), (64, 10, 16)]
+    for n, k, tile_size in cases:
+        embeddings = rng.normal(size=(n, 16)).astype(np.float32)
+        actual = streaming_top_pairs(embeddings, k, tile_size=tile_size)
+        if not same_pairs(actual, exact_top_pairs(embeddings, k)):
+            print(f"  ✗ n={n}, k={k}, tile_size={tile_size} differs from the full matrix")
+            return False
+        print(f"  ✓ n={n}, k={k}, tile_size={tile_size}: {len(actual)} pairs match")
+
+    return True
+
+def test_brute_force_index():
+    """Test the brute-force index neighbours and pairs against the full similarity matrix"""
+    print("\n🔍 Testing brute-force similarity index...")
+
+    import numpy as np
+    from relevance_scoring import normalize_rows
+    from similarity_index import BruteForceIndex, pairs_from_neighbors
+
+    rng = np.random.default_rng(1)
+    for n, k, block_size in [(3, 5, 1024), (12, 4, 5), (50, 8, 16), (80, 20, 1024)]:
+        embeddings = rng.normal(size=(n, 16)).astype(np.float32)
+        index = BruteForceIndex(embeddings, block_size=block_size)
+
+        vectors = normalize_rows(embeddings).astype(np.float64)
+        similarity = vectors @ vectors.T
+        np.fill_diagonal(similarity, -np.inf)
+        neighbours = min(k, n - 1)
+        expected = np.argsort(-similarity, axis=1, kind='stable')[:, :neighbours]
+
+        indices, scores = index.knn(k)
+        if not (np.array_equal(indices, expected)
+                and np.allclose(scores, np.take_along_axis(similarity, expected, axis=1), atol=1e-5)):
+            print(f"  ✗ n={n}, k={k}: neighbours differ from the full matrix")
+            return False
+
+        exact = exact_top_pairs(embeddings, k)
+        if not (same_pairs(pairs_from_neighbors(indices, scores, k), exact)
+                and same_pairs(index.top_pairs(k), exact)):
+            print(f"  ✗ n={n}, k={k}: top pairs differ from the full matrix")
+            return False
+        print(f"  ✓ n={n}, k={k}, block_size={block_size}: neighbours and pairs match")
+
+    return True
+
+def start_stub_embeddings_server(responses):
+    """
+    Serve a fake embeddings endpoint on localhost in a background thread
+
+    Each POST pops the next (status, headers) from ``responses`` (200 once it
+    is empty); a 200 answers with one [len(text), position] vector per input.
+
+    Returns:
+        (server, url, requests) where requests collects the input list of every POST
+    """
+    import json
+    import threading
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    requests = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            body = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+            requests.append(body['input'])
+            status, headers = responses.pop(0) if responses else (200, {})
+            payload = {'data': [{'index': i, 'embedding': [float(len(t)), float(i)]}
+                                for i, t in enumerate(body['input'])]} if status == 200 else {'detail': 'stub'}
+            data = json.dumps(payload).encode('utf-8')
+            self.send_response(status)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/v1/embeddings", requests
+
+def test_async_client_stub_server():
+    """Test the async embeddings client against a local stub server"""
+    print("\n🔍 Testing async embeddings client against a local stub server...")
+
+    import time
+    from async_embedding_client import AsyncVoyageClient, EmbeddingRequestError, aiohttp
+
+    if aiohttp is None:
+        print("  ⚠ aiohttp not available (optional)")
+        return True
+
+    # Token-budget packing: 40-character texts estimate to 11 tokens, so two fit in 25
+    server, url, requests = start_stub_embeddings_server([])
+    try:
+        texts = [f"{i}" * 40 for i in range(5)]
+        client = AsyncVoyageClient('key', base_url=url, max_batch_tokens=25, max_concurrency=2)
+        embeddings = client.embed_sync(texts)
+        if sorted(len(batch) for batch in requests) != [1, 2, 2] or embeddings != [[40.0, i % 2] for i in range(5)]:
+            print(f"  ✗ Unexpected batches {requests} or embeddings {embeddings}")
+            return False
+        print(f"  ✓ 5 texts packed into {len(requests)} requests, order preserved")
+    finally:
+        server.shutdown()
+
+    # 429 with Retry-After: waits the given time (not the 5s+ backoff) and then succeeds
+    server, url, requests = start_stub_embeddings_server([(429, {'Retry-After': '0.2'})])
+    try:
+        client = AsyncVoyageClient('key', base_url=url, max_retries=2, backoff_base=5.0)
+        start = time.time()
+        embeddings = client.embed_sync(['hello'])
+        elapsed = time.time() - start
+        if len(requests) != 2 or embeddings != [[5.0, 0.0]] or not 0.2 <= elapsed < 2.0:
+            print(f"  ✗ Retry-After not honoured: {len(requests)} requests in {elapsed:.2f}s")
+            return False
+        print(f"  ✓ 429 retried after Retry-After ({elapsed:.2f}s), then succeeded")
+    finally:
+        server.shutdown()
+
+    # Exhausted retries raise instead of yielding zero vectors
+    server, url, requests = start_stub_embeddings_server([(503, {})] * 3)
+    try:
+        client = AsyncVoyageClient('key', base_url=url, max_retries=2, backoff_base=0.01)
+        try:
+            client.embed_sync(['hello'])
+            print("  ✗ Failed batch did not raise")
+            return False
+        except EmbeddingRequestError as e:
+            if len(requests) != 3:
+                print(f"  ✗ Expected 3 attempts, got {len(requests)}")
+                return False
+            print(f"  ✓ Raised after {len(requests)} attempts: {e}")
+    finally:
+        server.shutdown()
+
+    return True
+
+def test_embedding_cache():
+    """Test the on-disk embedding cache round trip, keys, zero-vector handling and eviction"""
+    print("\n🔍 Testing embedding cache...")
+
+    import tempfile
+    import time
+    import numpy as np
+    from embedding_cache import EmbeddingCache
+    from voyage_extractor import VoyageAIExtractor
+
+    cache_dir = tempfile.mkdtemp()
+
+    # Round trip through the vector file and index, keyed by model name
+    cache = EmbeddingCache(cache_dir)
+    cache.put_many('model-a', ['alpha', 'beta'], [[1.0, 2.0], [3.0, 4.0]])
+    reloaded = EmbeddingCache(cache_dir)
+    if reloaded.get_many('model-a', ['beta', 'alpha', 'gamma']) != [[3.0, 4.0], [1.0, 2.0], None]:
+        print("  ✗ Vectors did not survive a reload")
+        return False
+    if reloaded.get_many('model-b', ['alpha']) != [None]:
+        print("  ✗ Lookup under another model name hit")
+        return False
+    print("  ✓ Vectors reload from disk, keyed by model name")
+
+    # Zero vectors (failed batches) are returned but never cached
+    class ZeroForFailedClient:
+        model_name = 'model-a'
+
+        def embed_sync(self, texts):
+            return [[0.0, 0.0] if text == 'failed' else [5.0, 6.0] for text in texts]
+
+    extractor = VoyageAIExtractor('key', cache=reloaded, client=ZeroForFailedClient())
+    extractor.get_embeddings(['failed', 'fresh'])
+    if EmbeddingCache(cache_dir).get_many('model-a', ['failed', 'fresh']) != [None, [5.0, 6.0]]:
+        print("  ✗ Zero vector was cached")
+        return False
+    print("  ✓ Zero vectors are not cached")
+
+    # Eviction to the low-water mark keeps the most recently used entries
+    cache = EmbeddingCache(tempfile.mkdtemp(), max_entries=10, low_water=0.9)
+    cache.put_many('m', [f"text {i}" for i in range(10)], [[float(i), 0.0] for i in range(10)])
+    time.sleep(0.01)
+    cache.get_many('m', [f"text {i}" for i in range(6, 10)])
+    time.sleep(0.01)
+    cache.put_many('m', ['text 10'], [[10.0, 0.0]])
+    recent = [f"text {i}" for i in range(6, 11)]
+    vectors = cache.get_many('m', recent)
+    if len(cache) != 9 or cache.evictions != 2 or vectors != [[float(i), 0.0] for i in range(6, 11)]:
+        print(f"  ✗ Eviction kept {len(cache)} entries ({cache.evictions} evicted)")
+        return False
+    if EmbeddingCache(str(cache.cache_dir)).get_many('m', recent) != vectors:
+        print("  ✗ Compacted vector file does not match the index")
+        return False
+    print(f"  ✓ Evicted {cache.evictions} least recently used entries down to {len(cache)}")
+
+    return True
+
 def main():
     """Run all tests"""
     print("🚀 Voyage AI Embeddings System - System Test")
@@ -151,6 +377,10 @@ def main():
         ("File Structure", test_file_structure),
         ("Configuration", test_config_parsing),
         ("Code Syntax", test_code_syntax),
+        ("Embedding Cache", test_embedding_cache),
+        ("Brute-Force Index", test_brute_force_index),
+        ("Streaming Top Pairs", test_streaming_top_pairs),
+        ("Async Client (Stub Server)", test_async_client_stub_server),
         ("API Key Environment", test_api_key_environment),
         ("University Profiles Access", test_university_profiles_access)
     ]
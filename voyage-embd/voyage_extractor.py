@@ -5,39 +5,97 @@ Uses Voyage AI embeddings for semantic analysis and content extraction
 """
 
 import os
+import sys
 import json
-import re
 from pathlib import Path
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Tuple, Optional
 import requests
 from dataclasses import dataclass
 import numpy as np
 from sklearn.cluster import KMeans
 from sklearn.metrics.pairwise import cosine_similarity
 import pandas as pd
+from embedding_cache import EmbeddingCache
+from relevance_scoring import embedding_matrix, score_sections
+from async_embedding_client import AsyncVoyageClient, aiohttp
+from section_store import SectionStore
+from profile_manifest import ProfileManifest, build_section_store, MANIFEST_FILE, SECTION_STORE_DIR
+from section_splitter import SectionSplitter, load_section_headings
+from similarity_index import build_similarity_index, pairwise_mean_similarity, write_similarity_matrix
 
-@dataclass
+# One ContentSection is kept per profile section; slots (Python 3.10+) drop the per-instance __dict__
+@dataclass(**({'slots': True} if sys.version_info >= (3, 10) else {}))
 class ContentSection:
     """Represents a content section from a university profile"""
     university: str
     section_type: str
     content: str
-    embedding: List[float] = None
     metadata: Dict[str, Any] = None
+    row: Optional[int] = None  # Row of this section's embedding in its SectionStore
+
+def extract_profile_sections(file_path: str, splitter: SectionSplitter) -> List[ContentSection]:
+    """
+    Extract content sections from a university profile markdown file
+    
+    Module-level so profile ingestion workers can run it in other processes.
+    
+    Args:
+        file_path: Path to the markdown file
+        splitter: SectionSplitter mapping headings to section types
+        
+    Returns:
+        List of ContentSection objects
+    """
+    with open(file_path, 'r', encoding='utf-8') as f:
+        content = f.read()
+    
+    university_name = Path(file_path).stem.replace('_', ' ').title()
+    sections = []
+    
+    # Index headings once and slice out each mapped section body
+    for section_type, section_content in splitter.split(content).items():
+        if section_content and len(section_content) > 50:  # Filter out very short sections
+            sections.append(ContentSection(
+                university=university_name,
+                section_type=section_type,
+                content=section_content,
+                metadata={'file_path': str(file_path)}
+            ))
+    
+    return sections
 
 class VoyageAIExtractor:
     """Main class for Voyage AI-based content extraction"""
     
-    def __init__(self, api_key: str, model_name: str = "voyage-large-2"):
+    def __init__(self, api_key: str, model_name: Optional[str] = None,
+                 cache: Optional[EmbeddingCache] = None,
+                 client: Optional[AsyncVoyageClient] = None,
+                 section_headings: Optional[Dict[str, str]] = None):
         """
         Initialize the Voyage AI extractor
         
         Args:
             api_key: Voyage AI API key
-            model_name: Model to use for embeddings
+            model_name: Model to use for embeddings (default: the client's
+                model, or voyage-large-2 without a client)
+            cache: Optional on-disk embedding cache consulted before the API
+            client: Optional async client; when set, API requests are sent
+                concurrently and failures raise instead of yielding zero vectors.
+                Its model must match model_name, since cached embeddings are
+                keyed by model_name
+            section_headings: Mapping of section_type to heading spec
+                (defaults to section_splitter.DEFAULT_SECTION_HEADINGS)
         """
+        if model_name is None:
+            model_name = client.model_name if client is not None else "voyage-large-2"
+        if client is not None and client.model_name != model_name:
+            raise ValueError(f"Client model {client.model_name!r} does not match extractor model {model_name!r}")
+        
         self.api_key = api_key
         self.model_name = model_name
+        self.cache = cache
+        self.client = client
+        self.splitter = SectionSplitter(section_headings)
         self.base_url = "https://api.voyageai.com/v1/embeddings"
         self.headers = {
             "Authorization": f"Bearer {api_key}",
@@ -48,12 +106,49 @@ class VoyageAIExtractor:
         """
         Get embeddings for a list of texts using Voyage AI
         
+        Texts already present in the embedding cache are served from disk;
+        only the remaining texts are sent to the API.
+        
         Args:
             texts: List of text strings to embed
             
         Returns:
             List of embedding vectors
         """
+        if self.cache is None:
+            return self._request_embeddings(texts)
+        
+        embeddings = self.cache.get_many(self.model_name, texts)
+        missing = [i for i, embedding in enumerate(embeddings) if embedding is None]
+        
+        if missing:
+            # Embed each distinct missing text once
+            missing_texts = list(dict.fromkeys(texts[i] for i in missing))
+            fetched = dict(zip(missing_texts, self._request_embeddings(missing_texts)))
+            for i in missing:
+                embeddings[i] = fetched[texts[i]]
+            
+            # Zero vectors mark failed batches and must not be cached
+            valid = [t for t in missing_texts if any(fetched[t])]
+            self.cache.put_many(self.model_name, valid, [fetched[t] for t in valid])
+        else:
+            self.cache.flush()
+        
+        return embeddings
+    
+    def _request_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """
+        Request embeddings for a list of texts from the Voyage AI API
+        
+        Args:
+            texts: List of text strings to embed
+            
+        Returns:
+            List of embedding vectors
+        """
+        if self.client is not None:
+            return self.client.embed_sync(texts)
+        
         embeddings = []
         
         # Process in batches to avoid rate limits
@@ -97,70 +192,42 @@ class VoyageAIExtractor:
         Returns:
             List of ContentSection objects
         """
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        university_name = Path(file_path).stem.replace('_', ' ').title()
-        sections = []
-        
-        # Define section patterns
-        section_patterns = {
-            'overview': r'## \*\*Overview\*\*\s*\n(.*?)(?=\n##|\n#|\Z)',
-            'ai_readiness': r'## \*\*AI Readiness Assessment\*\*\s*\n(.*?)(?=\n##|\n#|\Z)',
-            'programs': r'## \*\*Academic Programs\*\*\s*\n(.*?)(?=\n##|\n#|\Z)',
-            'faculty': r'## \*\*Faculty Expertise\*\*\s*\n(.*?)(?=\n##|\n#|\Z)',
-            'research': r'## \*\*Research Centers and Infrastructure\*\*\s*\n(.*?)(?=\n##|\n#|\Z)',
-            'technology': r'## \*\*Technology Integration\*\*\s*\n(.*?)(?=\n##|\n#|\Z)',
-            'strategic': r'## \*\*Strategic Recommendations\*\*\s*\n(.*?)(?=\n##|\n#|\Z)',
-            'references': r'#### \*\*Works cited\*\*\s*\n(.*?)(?=\n##|\n#|\Z)',
-        }
-        
-        for section_type, pattern in section_patterns.items():
-            match = re.search(pattern, content, re.DOTALL | re.MULTILINE)
-            if match:
-                section_content = match.group(1).strip()
-                if section_content and len(section_content) > 50:  # Filter out very short sections
-                    sections.append(ContentSection(
-                        university=university_name,
-                        section_type=section_type,
-                        content=section_content,
-                        metadata={'file_path': str(file_path)}
-                    ))
-        
-        return sections
+        return extract_profile_sections(file_path, self.splitter)
     
-    def analyze_semantic_similarity(self, sections: List[ContentSection]) -> Dict[str, Any]:
+    def analyze_semantic_similarity(self, store: SectionStore, include_matrix: bool = False,
+                                    matrix_path: Optional[str] = None) -> Dict[str, Any]:
         """
         Analyze semantic similarity between content sections
         
+        The full N x N similarity matrix is never held in memory unless
+        ``include_matrix`` is set; the top pairs are found tile by tile.
+        
         Args:
-            sections: List of ContentSection objects with embeddings
+            store: SectionStore with embeddings attached
+            include_matrix: Embed the full similarity matrix as a nested list
+            matrix_path: Write the full similarity matrix to this .npy file
             
         Returns:
             Dictionary containing similarity analysis results
         """
-        if not sections or not sections[0].embedding:
+        if not store.has_embeddings:
             return {"error": "No embeddings available for analysis"}
         
-        # Convert embeddings to numpy array
-        embeddings_matrix = np.array([s.embedding for s in sections])
+        sections = store.sections
+        embeddings_matrix = store.matrix()
         
-        # Calculate cosine similarity matrix
-        similarity_matrix = cosine_similarity(embeddings_matrix)
+        # Mean similarity of each section to all sections, without the N x N matrix
+        mean_similarity = pairwise_mean_similarity(embeddings_matrix)
         
-        # Find most similar sections
+        # Find most similar sections from the similarity index (no all-pairs list)
+        index = build_similarity_index(embeddings_matrix)
         most_similar = []
-        for i in range(len(sections)):
-            for j in range(i + 1, len(sections)):
-                similarity = similarity_matrix[i][j]
-                most_similar.append({
-                    'section1': f"{sections[i].university} - {sections[i].section_type}",
-                    'section2': f"{sections[j].university} - {sections[j].section_type}",
-                    'similarity': float(similarity)
-                })
-        
-        # Sort by similarity
-        most_similar.sort(key=lambda x: x['similarity'], reverse=True)
+        for i, j, similarity in index.top_pairs(20):  # Top 20 most similar
+            most_similar.append({
+                'section1': f"{sections[i].university} - {sections[i].section_type}",
+                'section2': f"{sections[j].university} - {sections[j].section_type}",
+                'similarity': float(similarity)
+            })
         
         # Cluster sections by similarity
         n_clusters = min(5, len(sections))
@@ -175,23 +242,29 @@ class VoyageAIExtractor:
             clusters[label].append({
                 'university': sections[i].university,
                 'section_type': sections[i].section_type,
-                'similarity_score': float(similarity_matrix[i].mean())
+                'similarity_score': float(mean_similarity[i])
             })
         
-        return {
-            'similarity_matrix': similarity_matrix.tolist(),
-            'most_similar_sections': most_similar[:20],  # Top 20 most similar
+        results = {
+            'most_similar_sections': most_similar,
             'clusters': clusters,
-            'average_similarity': float(similarity_matrix.mean())
+            'average_similarity': float(mean_similarity.mean())
         }
+        
+        if matrix_path:
+            results['similarity_matrix_file'] = write_similarity_matrix(embeddings_matrix, matrix_path)
+        if include_matrix:
+            results['similarity_matrix'] = cosine_similarity(embeddings_matrix).tolist()
+        
+        return results
     
-    def extract_ai_related_content(self, sections: List[ContentSection], 
+    def extract_ai_related_content(self, store: SectionStore, 
                                   ai_keywords: List[str] = None) -> List[Dict[str, Any]]:
         """
         Extract AI-related content using semantic similarity
         
         Args:
-            sections: List of ContentSection objects
+            store: SectionStore with embeddings attached
             ai_keywords: List of AI-related keywords to search for
             
         Returns:
@@ -205,53 +278,41 @@ class VoyageAIExtractor:
                 "natural language processing", "NLP", "predictive modeling"
             ]
         
-        ai_content = []
+        # Embed the keywords once and score every section in a single pass
+        keyword_embeddings = [e for e in self.get_embeddings(ai_keywords) if e and any(e)]
+        rows = store.embedded_rows()
+        scores = score_sections(store.matrix(rows), embedding_matrix(keyword_embeddings))
         
-        for section in sections:
-            if section.embedding:
-                # Create embedding for AI keywords
-                keyword_embeddings = self.get_embeddings(ai_keywords)
-                
-                # Calculate similarity with section
-                section_embedding = np.array(section.embedding)
-                similarities = []
-                
-                for keyword_emb in keyword_embeddings:
-                    if keyword_emb and any(keyword_emb):  # Check if embedding is valid
-                        similarity = cosine_similarity(
-                            [section_embedding], 
-                            [keyword_emb]
-                        )[0][0]
-                        similarities.append(similarity)
-                
-                if similarities:
-                    max_similarity = max(similarities)
-                    if max_similarity > 0.3:  # Threshold for relevance
-                        ai_content.append({
-                            'university': section.university,
-                            'section_type': section.section_type,
-                            'content_preview': section.content[:200] + "...",
-                            'ai_relevance_score': float(max_similarity),
-                            'metadata': section.metadata
-                        })
+        ai_content = []
+        for i in np.flatnonzero(scores.above(0.3)):  # Threshold for relevance
+            section = store[rows[i]]
+            ai_content.append({
+                'university': section.university,
+                'section_type': section.section_type,
+                'content_preview': section.content[:200] + "...",
+                'ai_relevance_score': float(scores.max_scores[i]),
+                'metadata': section.metadata
+            })
         
         # Sort by relevance score
         ai_content.sort(key=lambda x: x['ai_relevance_score'], reverse=True)
         return ai_content
     
-    def generate_semantic_summary(self, sections: List[ContentSection]) -> Dict[str, Any]:
+    def generate_semantic_summary(self, store: SectionStore) -> Dict[str, Any]:
         """
         Generate a semantic summary of all content
         
         Args:
-            sections: List of ContentSection objects
+            store: SectionStore of extracted sections
             
         Returns:
             Dictionary containing semantic summary
         """
-        if not sections:
+        if not len(store):
             return {"error": "No sections to analyze"}
         
+        sections = store.sections
+        
         # Group by section type
         by_type = {}
         for section in sections:
@@ -268,8 +329,8 @@ class VoyageAIExtractor:
         
         # Analyze each section type
         for section_type, type_sections in by_type.items():
-            if type_sections and type_sections[0].embedding:
-                embeddings = np.array([s.embedding for s in type_sections])
+            if type_sections and store.has_embeddings:
+                embeddings = store.matrix(store.embedded_rows(section_type))
                 
                 # Calculate diversity within section type
                 avg_similarity = cosine_similarity(embeddings).mean()
@@ -293,8 +354,11 @@ def main():
         print("export VOYAGE_API_KEY='your-api-key-here'")
         return
     
-    # Initialize extractor
-    extractor = VoyageAIExtractor(api_key)
+    # Initialize extractor with the on-disk embedding cache
+    cache = EmbeddingCache(os.getenv('VOYAGE_CACHE_DIR', '.embedding_cache'))
+    client = AsyncVoyageClient.from_config(api_key) if aiohttp is not None else None
+    extractor = VoyageAIExtractor(api_key, cache=cache, client=client,
+                                  section_headings=load_section_headings())
     
     # Get university profile files
     profiles_dir = Path("../docs/university-profiles")
@@ -302,47 +366,36 @@ def main():
     
     print(f"🔍 Processing {len(markdown_files)} university profile files...")
     
-    all_sections = []
-    
-    # Process each file
-    for i, file_path in enumerate(markdown_files):
-        print(f"\n📚 Processing {i+1}/{len(markdown_files)}: {file_path.stem}")
-        
-        try:
-            sections = extractor.extract_sections(file_path)
-            all_sections.extend(sections)
-            print(f"  ✓ Extracted {len(sections)} content sections")
-        except Exception as e:
-            print(f"  ✗ Error processing {file_path.name}: {e}")
+    # Re-extract and re-embed only profiles that changed since the last run
+    manifest = ProfileManifest(MANIFEST_FILE)
+    previous_store = SectionStore.load(SECTION_STORE_DIR) if Path(SECTION_STORE_DIR).exists() else None
+    store, changed_universities = build_section_store(extractor, markdown_files, manifest, previous_store)
     
-    if not all_sections:
+    if not len(store):
         print("❌ No content sections extracted")
         return
     
-    print(f"\n🎯 Total sections extracted: {len(all_sections)}")
-    
-    # Get embeddings for all sections
-    print("\n🚀 Generating embeddings with Voyage AI...")
-    texts = [section.content for section in all_sections]
-    embeddings = extractor.get_embeddings(texts)
-    
-    # Assign embeddings to sections
-    for section, embedding in zip(all_sections, embeddings):
-        section.embedding = embedding
+    store.save(SECTION_STORE_DIR)
+    manifest.save()
     
-    print(f"✓ Generated embeddings for {len(all_sections)} sections")
+    print(f"✓ Embeddings ready for {len(store)} sections "
+          f"({len(changed_universities)} universities changed)")
+    cache_stats = cache.stats()
+    print(f"✓ Embedding cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses")
     
     # Perform semantic analysis
     print("\n🔬 Performing semantic analysis...")
     
     # Similarity analysis
-    similarity_results = extractor.analyze_semantic_similarity(all_sections)
+    similarity_results = extractor.analyze_semantic_similarity(
+        store, matrix_path='voyage_similarity_matrix.npy'
+    )
     
     # AI content extraction
-    ai_content = extractor.extract_ai_related_content(all_sections)
+    ai_content = extractor.extract_ai_related_content(store)
     
     # Semantic summary
-    summary = extractor.generate_semantic_summary(all_sections)
+    summary = extractor.generate_semantic_summary(store)
     
     # Save results
     results = {
@@ -350,8 +403,9 @@ def main():
         'ai_content': ai_content,
         'semantic_summary': summary,
         'metadata': {
-            'total_sections': len(all_sections),
-            'universities_covered': len(set(s.university for s in all_sections)),
+            'total_sections': len(store),
+            'universities_covered': len(set(s.university for s in store)),
+            'changed_universities': changed_universities,
             'model_used': extractor.model_name
         }
     }